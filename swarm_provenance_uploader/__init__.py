@@ -3,7 +3,7 @@
 import subprocess
 from pathlib import Path
 
-__version_base__ = "0.10.0"
+__version_base__ = "0.11.0"
 
 
 def _get_git_hash() -> str:
@@ -33,5 +33,15 @@ def get_version() -> str:
     return __version_base__
 
 
-# For compatibility with tools that expect __version__
-__version__ = get_version()
+def __getattr__(name: str) -> str:
+    """Resolve ``__version__`` lazily.
+
+    Computing the git hash spawns a subprocess, so it is deferred until the
+    version is actually requested instead of running on every CLI invocation.
+    """
+    if name == "__version__":
+        # For compatibility with tools that expect __version__
+        version = get_version()
+        globals()["__version__"] = version
+        return version
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,10 @@
+"""Allow running the CLI with ``python -m swarm_provenance_uploader``.
+
+Also serves as the entry point for the standalone binary built by
+``tools/build_cli.py``.
+"""
+
+from swarm_provenance_uploader.cli import app
+
+if __name__ == "__main__":
+    app(prog_name="swarm-prov-upload")
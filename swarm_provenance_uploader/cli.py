@@ -7,7 +7,7 @@ import time
 import json
 import warnings
 
-from . import config, __version__
+from . import config, get_version
 from .core import file_utils, swarm_client, metadata_builder
 from .core.gateway_client import GatewayClient
 from .models import ProvenanceMetadata, ValidationError
@@ -27,7 +27,7 @@ app.add_typer(chain_app, name="chain")
 def _version_callback(value: bool):
     """Print version and exit."""
     if value:
-        typer.echo(f"swarm-prov-upload {__version__}")
+        typer.echo(f"swarm-prov-upload {get_version()}")
         raise typer.Exit()
 
 
@@ -8,11 +8,15 @@ Supports x402 pay-per-request payments when enabled.
 """
 
 import base64
+import functools
 import json
 import requests
 import os
-from typing import Callable, List, Optional, Tuple
-from urllib.parse import urljoin
+from typing import Callable, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 from ..exceptions import (
     PaymentRequiredError,
@@ -46,6 +50,48 @@ from ..models import (
 )
 
 
+# Idempotent API reads are retried only when the connection could not be
+# opened or a proxy answered 502/503/504; a read that fails or times out after
+# the request went out is not repeated, so timeouts stay bounded. A server's
+# Retry-After is ignored for the same reason: the short backoff is the only
+# wait between attempts. POST/PATCH (purchases, uploads, payments) are never
+# re-sent; raise_on_status=False hands the last 5xx back to raise_for_status.
+_RETRY = Retry(
+    total=2,
+    read=0,
+    other=0,
+    backoff_factor=0.1,
+    status_forcelist=(502, 503, 504),
+    allowed_methods=frozenset({"GET", "HEAD"}),
+    raise_on_status=False,
+    respect_retry_after_header=False,
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _pool_stamp_list_adapter() -> TypeAdapter:
+    """Validator for a list of pool stamps, built on first use and reused."""
+    return TypeAdapter(List[PoolStampInfo])
+
+
+_M = TypeVar("_M", bound=BaseModel)
+
+
+def _validate_body(model: Type[_M], response: requests.Response) -> _M:
+    """Validate a gateway response body straight from its bytes.
+
+    A body that is not valid JSON is re-decoded with response.json(), so the
+    caller's RequestException handler sees the same JSONDecodeError (and
+    message) as before instead of a pydantic ValidationError.
+    """
+    try:
+        return model.model_validate_json(response.content)
+    except ValidationError as e:
+        if any(err["type"] == "json_invalid" for err in e.errors()):
+            response.json()  # raises requests' JSONDecodeError
+        raise
+
+
 class GatewayClient:
     """Client for provenance-gateway.datafund.io API.
 
@@ -83,7 +129,7 @@ class GatewayClient:
                                    Called with (amount_usd, description) -> bool
             free_tier: Send X-Payment-Mode: free header (rate-limited)
         """
-        self.base_url = (base_url or os.getenv("PROVENANCE_GATEWAY_URL", self.DEFAULT_URL)).rstrip("/")
+        self._base_url = (base_url or os.getenv("PROVENANCE_GATEWAY_URL", self.DEFAULT_URL)).rstrip("/")
         self.api_key = api_key or os.getenv("PROVENANCE_GATEWAY_API_KEY")
         self.free_tier = free_tier
 
@@ -96,6 +142,29 @@ class GatewayClient:
         self._x402_payment_callback = x402_payment_callback
         self._x402_client = None  # Lazy initialization
 
+        # One session per client so calls to the gateway reuse the pooled
+        # keep-alive connection instead of a new TCP+TLS handshake each time.
+        # Only the API routes get the retrying adapter; health_check (the
+        # root URL) stays on the session's default adapter, which never
+        # retries, so its timeout is a hard bound.
+        self._session = requests.Session()
+        self._session.mount(f"{self.base_url}/api/", HTTPAdapter(max_retries=_RETRY))
+
+    @property
+    def base_url(self) -> str:
+        """Gateway URL (read-only: the retrying adapter is mounted on it)."""
+        return self._base_url
+
+    def close(self) -> None:
+        """Close the underlying HTTP session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "GatewayClient":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def _get_x402_client(self):
         """Get or create the x402 client (lazy initialization)."""
         if self._x402_client is None and self.x402_enabled:
@@ -117,7 +186,9 @@ class GatewayClient:
 
     def _make_url(self, path: str) -> str:
         """Construct full URL from path."""
-        return urljoin(self.base_url + "/", path.lstrip("/"))
+        # base_url never ends in "/" and paths are fixed API routes, so plain
+        # concatenation gives what urljoin would without re-parsing the URL
+        return f"{self.base_url}/{path.lstrip('/')}"
 
     def _should_auto_pay(self, amount_usd: float) -> bool:
         """Check if amount is within auto-pay limit."""
@@ -263,7 +334,7 @@ class GatewayClient:
             PaymentRequiredError: If payment required but not configured/confirmed
             PaymentTransactionFailedError: If payment was signed but on-chain tx failed
         """
-        response = requests.request(method, url, **kwargs)
+        response = self._session.request(method, url, **kwargs)
 
         if response.status_code == 402:
             payment_header, amount_usd = self._handle_402_response(response, verbose)
@@ -276,7 +347,7 @@ class GatewayClient:
             if verbose:
                 print(f"DEBUG: Retrying request with X-PAYMENT header ({amount_usd})")
 
-            response = requests.request(method, url, **kwargs)
+            response = self._session.request(method, url, **kwargs)
 
             if verbose:
                 print(f"DEBUG: Paid request status: {response.status_code}")
@@ -320,7 +391,10 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, timeout=10)
+            # Fail fast on connect when the gateway is unreachable. Stays a GET
+            # since a GET-only root route may answer HEAD with 405. The small
+            # body is read in full so the connection goes back to the pool.
+            response = self._session.get(url, timeout=(5, 10))
             if verbose:
                 print(f"DEBUG: Health check status: {response.status_code}")
             return response.status_code == 200
@@ -344,12 +418,13 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=30)
+            response = self._session.get(url, headers=self._get_headers(), timeout=30)
             if verbose:
                 print(f"DEBUG: List stamps status: {response.status_code}")
             response.raise_for_status()
-            data = response.json()
-            return StampListResponse.model_validate(data)
+            # Validate straight from the body bytes: one pydantic-core pass
+            # over the whole stamp array, no intermediate dict tree
+            return _validate_body(StampListResponse, response)
         except requests.exceptions.RequestException as e:
             if verbose:
                 print(f"ERROR: List stamps failed: {e}")
@@ -419,8 +494,7 @@ class GatewayClient:
             if verbose:
                 print(f"DEBUG: Purchase stamp status: {response.status_code}")
             response.raise_for_status()
-            data = response.json()
-            result = StampPurchaseResponse.model_validate(data)
+            result = _validate_body(StampPurchaseResponse, response)
             if verbose:
                 print(f"DEBUG: Purchased stamp ID: {result.batchID}")
             return result.batchID
@@ -446,7 +520,7 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: Get stamp status: {response.status_code}")
             if response.status_code == 404:
@@ -454,8 +528,7 @@ class GatewayClient:
                     print(f"DEBUG: Stamp {stamp_id} not found")
                 return None
             response.raise_for_status()
-            data = response.json()
-            return StampDetails.model_validate(data)
+            return _validate_body(StampDetails, response)
         except requests.exceptions.RequestException as e:
             if verbose:
                 print(f"ERROR: Get stamp failed: {e}")
@@ -482,14 +555,13 @@ class GatewayClient:
             print(f"Payload: {payload}")
 
         try:
-            response = requests.patch(
+            response = self._session.patch(
                 url, json=payload, headers=self._get_headers(), timeout=60
             )
             if verbose:
                 print(f"DEBUG: Extend stamp status: {response.status_code}")
             response.raise_for_status()
-            data = response.json()
-            result = StampExtensionResponse.model_validate(data)
+            result = _validate_body(StampExtensionResponse, response)
             if verbose:
                 print(f"DEBUG: Extended stamp ID: {result.batchID}")
             return result.batchID
@@ -550,8 +622,7 @@ class GatewayClient:
             if verbose:
                 print(f"DEBUG: Upload status: {response.status_code}")
             response.raise_for_status()
-            data_response = response.json()
-            result = DataUploadResponse.model_validate(data_response)
+            result = _validate_body(DataUploadResponse, response)
             if verbose:
                 print(f"DEBUG: Upload reference: {result.reference}")
             return result.reference
@@ -577,7 +648,7 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, timeout=60)
+            response = self._session.get(url, timeout=60)
             if verbose:
                 print(f"DEBUG: Download status: {response.status_code}")
             if response.status_code == 404:
@@ -606,12 +677,11 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: Get wallet status: {response.status_code}")
             response.raise_for_status()
-            data = response.json()
-            return WalletResponse.model_validate(data)
+            return _validate_body(WalletResponse, response)
         except requests.exceptions.RequestException as e:
             if verbose:
                 print(f"ERROR: Get wallet failed: {e}")
@@ -630,12 +700,11 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: Get chequebook status: {response.status_code}")
             response.raise_for_status()
-            data = response.json()
-            return ChequebookResponse.model_validate(data)
+            return _validate_body(ChequebookResponse, response)
         except requests.exceptions.RequestException as e:
             if verbose:
                 print(f"ERROR: Get chequebook failed: {e}")
@@ -666,7 +735,7 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: Pool status response: {response.status_code}")
 
@@ -674,8 +743,7 @@ class GatewayClient:
                 raise PoolNotEnabledError("Stamp pool is not enabled on this gateway.")
 
             response.raise_for_status()
-            data = response.json()
-            return PoolStatusResponse.model_validate(data)
+            return _validate_body(PoolStatusResponse, response)
         except PoolNotEnabledError:
             raise
         except requests.exceptions.RequestException as e:
@@ -736,7 +804,7 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: List pool stamps response: {response.status_code}")
 
@@ -748,7 +816,7 @@ class GatewayClient:
             # Response contains {"stamps": [...], "count": n}
             stamps_data = data.get("stamps", data)
             if isinstance(stamps_data, list):
-                return [PoolStampInfo.model_validate(item) for item in stamps_data]
+                return _pool_stamp_list_adapter().validate_python(stamps_data)
             return []
         except PoolNotEnabledError:
             raise
@@ -810,8 +878,7 @@ class GatewayClient:
             if verbose:
                 print(f"DEBUG: Acquire response: {response.status_code}")
             response.raise_for_status()
-            data = response.json()
-            result = AcquireStampResponse.model_validate(data)
+            result = _validate_body(AcquireStampResponse, response)
 
             if not result.success:
                 raise PoolAcquisitionError(
@@ -864,7 +931,7 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: Stamp health check response: {response.status_code}")
 
@@ -872,8 +939,7 @@ class GatewayClient:
                 raise StampNotFoundError(f"Stamp {stamp_id} not found.")
 
             response.raise_for_status()
-            data = response.json()
-            return StampHealthCheckResponse.model_validate(data)
+            return _validate_body(StampHealthCheckResponse, response)
         except StampNotFoundError:
             raise
         except requests.exceptions.RequestException as e:
@@ -899,7 +965,7 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: Notary info response: {response.status_code}")
 
@@ -907,8 +973,7 @@ class GatewayClient:
                 raise NotaryNotEnabledError("Notary signing is not enabled on this gateway.")
 
             response.raise_for_status()
-            data = response.json()
-            return NotaryInfoResponse.model_validate(data)
+            return _validate_body(NotaryInfoResponse, response)
         except NotaryNotEnabledError:
             raise
         except requests.exceptions.RequestException as e:
@@ -932,7 +997,7 @@ class GatewayClient:
             print(f"URL: GET {url}")
 
         try:
-            response = requests.get(url, headers=self._get_headers(), timeout=10)
+            response = self._session.get(url, headers=self._get_headers(), timeout=10)
             if verbose:
                 print(f"DEBUG: Notary status response: {response.status_code}")
 
@@ -940,8 +1005,7 @@ class GatewayClient:
                 raise NotaryNotEnabledError("Notary signing is not enabled on this gateway.")
 
             response.raise_for_status()
-            data = response.json()
-            return NotaryStatusResponse.model_validate(data)
+            return _validate_body(NotaryStatusResponse, response)
         except NotaryNotEnabledError:
             raise
         except requests.exceptions.RequestException as e:
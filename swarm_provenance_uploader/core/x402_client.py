@@ -9,6 +9,7 @@ Requires optional dependencies: pip install swarm-provenance-uploader[x402]
 """
 
 import base64
+import functools
 import json
 import os
 import secrets
@@ -68,12 +69,14 @@ CHAIN_IDS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
 def compute_domain_separator(name: str, version: str, chain_id: int, contract_address: str) -> bytes:
     """
     Compute the EIP-712 DOMAIN_SEPARATOR for verification.
 
     This allows us to validate that our configured domain matches
-    what the contract actually uses.
+    what the contract actually uses. The result depends only on the
+    arguments, so it is cached; repeat calls skip the keccak hashing.
 
     Args:
         name: Token name (e.g., "USDC" or "USD Coin")
@@ -1,6 +1,6 @@
 from enum import IntEnum
 
-from pydantic import BaseModel, Field, ValidationError
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
 from typing import Any, Dict, Optional, List
 
 class ProvenanceMetadata(BaseModel):
@@ -17,7 +17,16 @@ class ProvenanceMetadata(BaseModel):
 
 # --- Gateway API Response Models ---
 
-class StampDetails(BaseModel):
+class _GatewayResponseModel(BaseModel):
+    """Base for models parsed from gateway responses.
+
+    Responses are read-only once parsed; freezing them lets callers share
+    and cache instances (e.g. long stamp lists) without defensive copies.
+    """
+    model_config = ConfigDict(frozen=True)
+
+
+class StampDetails(_GatewayResponseModel):
     """Details of a postage stamp batch."""
     batchID: str = Field(description="The batch ID (stamp ID)")
     utilization: Optional[int] = Field(default=None, description="Utilization percentage (may be null)")
@@ -37,7 +46,7 @@ class StampDetails(BaseModel):
     local: Optional[bool] = Field(default=None, description="Whether stamp is local")
 
 
-class StampListResponse(BaseModel):
+class StampListResponse(_GatewayResponseModel):
     """Response from listing all stamps."""
     stamps: List[StampDetails] = Field(default_factory=list, description="List of stamp batches")
     total_count: int = Field(default=0, description="Total number of stamps")
@@ -45,6 +54,7 @@ class StampListResponse(BaseModel):
 
 class StampPurchaseRequest(BaseModel):
     """Request body for purchasing a new stamp (gateway API)."""
+    model_config = ConfigDict(defer_build=True)
     duration_hours: Optional[int] = Field(default=None, ge=24, description="Hours of validity (min 24, default 25)")
     size: Optional[str] = Field(default=None, description="Preset size: 'small', 'medium', or 'large'")
     depth: Optional[int] = Field(default=None, ge=16, le=32, description="Technical depth parameter (16-32)")
@@ -52,7 +62,7 @@ class StampPurchaseRequest(BaseModel):
     amount: Optional[int] = Field(default=None, description="Legacy: PLUR amount (use duration_hours instead)")
 
 
-class StampPurchaseResponse(BaseModel):
+class StampPurchaseResponse(_GatewayResponseModel):
     """Response from purchasing a stamp."""
     batchID: str = Field(description="The newly created batch ID")
     message: Optional[str] = Field(default=None, description="Status message")
@@ -60,37 +70,42 @@ class StampPurchaseResponse(BaseModel):
 
 class StampExtensionRequest(BaseModel):
     """Request body for extending a stamp."""
+    model_config = ConfigDict(defer_build=True)
     amount: int = Field(description="Amount of BZZ to add to the stamp")
 
 
-class StampExtensionResponse(BaseModel):
+class StampExtensionResponse(_GatewayResponseModel):
     """Response from extending a stamp."""
+    model_config = ConfigDict(defer_build=True)
     batchID: str = Field(description="The extended batch ID")
     message: Optional[str] = Field(default=None, description="Status message")
 
 
-class DataUploadResponse(BaseModel):
+class DataUploadResponse(_GatewayResponseModel):
     """Response from uploading data."""
     reference: str = Field(description="Swarm reference hash")
     message: Optional[str] = Field(default=None, description="Status message")
 
 
-class DataDownloadResponse(BaseModel):
+class DataDownloadResponse(_GatewayResponseModel):
     """Response from downloading data as JSON."""
+    model_config = ConfigDict(defer_build=True)
     data: str = Field(description="Base64 encoded data")
     content_type: str = Field(description="Content type of the data")
     size: int = Field(description="Size of the data in bytes")
     reference: str = Field(description="Swarm reference hash")
 
 
-class WalletResponse(BaseModel):
+class WalletResponse(_GatewayResponseModel):
     """Response from wallet endpoint."""
+    model_config = ConfigDict(defer_build=True)
     walletAddress: str = Field(description="Ethereum wallet address")
     bzzBalance: str = Field(description="BZZ balance (as string for precision)")
 
 
-class ChequebookResponse(BaseModel):
+class ChequebookResponse(_GatewayResponseModel):
     """Response from chequebook endpoint."""
+    model_config = ConfigDict(defer_build=True)
     chequebookAddress: str = Field(description="Chequebook contract address")
     availableBalance: str = Field(description="Available balance")
     totalBalance: str = Field(description="Total balance")
@@ -100,6 +115,7 @@ class ChequebookResponse(BaseModel):
 
 class X402PaymentOption(BaseModel):
     """A single payment option from the 402 response accepts array."""
+    model_config = ConfigDict(defer_build=True)
     scheme: str = Field(description="Payment scheme (e.g., 'exact')")
     network: str = Field(description="Network identifier (e.g., 'base-sepolia', 'base')")
     maxAmountRequired: str = Field(description="Maximum payment amount in smallest units")
@@ -114,6 +130,7 @@ class X402PaymentOption(BaseModel):
 
 class X402PaymentRequirements(BaseModel):
     """Parsed from HTTP 402 response."""
+    model_config = ConfigDict(defer_build=True)
     accepts: List[X402PaymentOption] = Field(description="List of accepted payment options")
     error: Optional[str] = Field(default=None, description="Error message if present")
     x402Version: int = Field(default=1, description="x402 protocol version")
@@ -121,6 +138,7 @@ class X402PaymentRequirements(BaseModel):
 
 class X402PaymentAuthorization(BaseModel):
     """Authorization data for payment signature."""
+    model_config = ConfigDict(defer_build=True)
     from_address: str = Field(alias="from", description="Payer wallet address")
     to: str = Field(description="Recipient address")
     value: str = Field(description="Payment amount in smallest units")
@@ -131,14 +149,16 @@ class X402PaymentAuthorization(BaseModel):
 
 class X402PaymentPayload(BaseModel):
     """Payload for X-PAYMENT header."""
+    model_config = ConfigDict(defer_build=True)
     x402Version: int = Field(default=1, description="x402 protocol version")
     scheme: str = Field(default="exact", description="Payment scheme")
     network: str = Field(description="Network identifier")
     payload: dict = Field(description="Contains signature and authorization data")
 
 
-class X402PaymentResponse(BaseModel):
+class X402PaymentResponse(_GatewayResponseModel):
     """Response from x-payment-response header after payment attempt."""
+    model_config = ConfigDict(defer_build=True)
     success: bool = Field(description="Whether the payment was successful")
     errorReason: Optional[str] = Field(default=None, description="Error reason if payment failed")
     transaction: Optional[str] = Field(default=None, description="Transaction hash if successful")
@@ -148,8 +168,9 @@ class X402PaymentResponse(BaseModel):
 
 # --- Stamp Pool Models ---
 
-class PoolStatusResponse(BaseModel):
+class PoolStatusResponse(_GatewayResponseModel):
     """Response from pool status endpoint."""
+    model_config = ConfigDict(defer_build=True)
     enabled: bool = Field(description="Whether the stamp pool is enabled")
     reserve_config: Dict[str, int] = Field(description="Target reserve levels by depth")
     current_levels: Dict[str, int] = Field(description="Current stamp counts by depth")
@@ -163,12 +184,14 @@ class PoolStatusResponse(BaseModel):
 
 class AcquireStampRequest(BaseModel):
     """Request body for acquiring stamp from pool."""
+    model_config = ConfigDict(defer_build=True)
     size: Optional[str] = Field(default=None, description="Preferred size: 'small', 'medium', 'large'")
     depth: Optional[int] = Field(default=None, description="Specific depth (overrides size)")
 
 
-class AcquireStampResponse(BaseModel):
+class AcquireStampResponse(_GatewayResponseModel):
     """Response from pool acquire endpoint."""
+    model_config = ConfigDict(defer_build=True)
     success: bool = Field(description="Whether acquisition was successful")
     batch_id: Optional[str] = Field(default=None, description="Acquired stamp batch ID")
     depth: Optional[int] = Field(default=None, description="Depth of acquired stamp")
@@ -177,8 +200,9 @@ class AcquireStampResponse(BaseModel):
     fallback_used: bool = Field(description="True if a larger stamp was substituted")
 
 
-class PoolStampInfo(BaseModel):
+class PoolStampInfo(_GatewayResponseModel):
     """Information about a stamp in the pool."""
+    model_config = ConfigDict(defer_build=True)
     batch_id: str = Field(description="Stamp batch ID")
     depth: int = Field(description="Stamp depth")
     size_name: str = Field(description="Size name (small/medium/large)")
@@ -186,15 +210,17 @@ class PoolStampInfo(BaseModel):
     ttl_at_creation: int = Field(description="TTL in seconds at creation time")
 
 
-class StampHealthIssue(BaseModel):
+class StampHealthIssue(_GatewayResponseModel):
     """A health issue (error or warning) for a stamp."""
+    model_config = ConfigDict(defer_build=True)
     code: str = Field(description="Issue code (e.g., 'EXPIRED', 'LOW_TTL')")
     message: str = Field(description="Human-readable message")
     details: Optional[Dict] = Field(default=None, description="Additional details")
 
 
-class StampHealthCheckResponse(BaseModel):
+class StampHealthCheckResponse(_GatewayResponseModel):
     """Response from stamp health check endpoint."""
+    model_config = ConfigDict(defer_build=True)
     stamp_id: str = Field(description="The stamp batch ID")
     can_upload: bool = Field(description="Whether the stamp can be used for uploads")
     errors: List[StampHealthIssue] = Field(default_factory=list, description="Blocking issues")
@@ -204,16 +230,18 @@ class StampHealthCheckResponse(BaseModel):
 
 # --- Notary Signing Models ---
 
-class NotaryInfoResponse(BaseModel):
+class NotaryInfoResponse(_GatewayResponseModel):
     """Response from GET /api/v1/notary/info endpoint."""
+    model_config = ConfigDict(defer_build=True)
     enabled: bool = Field(description="Whether notary signing is enabled on this gateway")
     available: bool = Field(description="Whether notary signing is currently available (enabled + configured)")
     address: Optional[str] = Field(default=None, description="Ethereum address of the notary signer")
     message: Optional[str] = Field(default=None, description="Human-readable status message")
 
 
-class NotaryStatusResponse(BaseModel):
+class NotaryStatusResponse(_GatewayResponseModel):
     """Response from GET /api/v1/notary/status endpoint (simplified health check)."""
+    model_config = ConfigDict(defer_build=True)
     enabled: bool = Field(description="Whether notary signing is enabled")
     available: bool = Field(description="Whether notary signing is available")
     address: Optional[str] = Field(default=None, description="Notary signer address")
@@ -221,6 +249,7 @@ class NotaryStatusResponse(BaseModel):
 
 class NotarySignature(BaseModel):
     """A notary signature within a signed document."""
+    model_config = ConfigDict(defer_build=True)
     type: str = Field(description="Signature type, e.g., 'notary'")
     signer: str = Field(description="Ethereum address of the signer")
     timestamp: str = Field(description="ISO 8601 timestamp when signature was created")
@@ -230,11 +259,12 @@ class NotarySignature(BaseModel):
     signed_message_format: str = Field(description="Format of the signed message, e.g., '{data_hash}|{timestamp}'")
 
 
-class SignedDocumentResponse(BaseModel):
+class SignedDocumentResponse(_GatewayResponseModel):
     """Response when uploading with sign=notary parameter.
 
     Contains both the Swarm reference and the full signed document.
     """
+    model_config = ConfigDict(defer_build=True)
     reference: str = Field(description="Swarm reference hash")
     signed_document: Optional[Dict[str, Any]] = Field(
         default=None,
@@ -254,12 +284,14 @@ class DataStatusEnum(IntEnum):
 
 class ChainTransformation(BaseModel):
     """A transformation recorded on-chain."""
+    model_config = ConfigDict(defer_build=True)
     description: str = Field(description="Description of the transformation")
     new_data_hash: Optional[str] = Field(default=None, description="Hash of the transformed data (if available)")
 
 
 class ChainProvenanceRecord(BaseModel):
     """On-chain provenance record for a data hash."""
+    model_config = ConfigDict(defer_build=True)
     data_hash: str = Field(description="Swarm reference hash (bytes32 hex)")
     owner: str = Field(description="Ethereum address of data owner")
     timestamp: int = Field(description="Unix timestamp when registered")
@@ -274,6 +306,7 @@ class ChainProvenanceRecord(BaseModel):
 
 class AnchorResult(BaseModel):
     """Result from anchoring a Swarm hash on-chain."""
+    model_config = ConfigDict(defer_build=True)
     tx_hash: str = Field(description="Transaction hash")
     block_number: int = Field(description="Block number containing the transaction")
     gas_used: int = Field(description="Gas consumed by the transaction")
@@ -286,6 +319,7 @@ class AnchorResult(BaseModel):
 
 class TransformResult(BaseModel):
     """Result from recording a data transformation on-chain."""
+    model_config = ConfigDict(defer_build=True)
     tx_hash: str = Field(description="Transaction hash")
     block_number: int = Field(description="Block number containing the transaction")
     gas_used: int = Field(description="Gas consumed by the transaction")
@@ -297,6 +331,7 @@ class TransformResult(BaseModel):
 
 class MergeTransformResult(BaseModel):
     """Result from recording an N-to-1 merge transformation on-chain."""
+    model_config = ConfigDict(defer_build=True)
     tx_hash: str = Field(description="Transaction hash")
     block_number: int = Field(description="Block number containing the transaction")
     gas_used: int = Field(description="Gas consumed by the transaction")
@@ -309,6 +344,7 @@ class MergeTransformResult(BaseModel):
 
 class AccessResult(BaseModel):
     """Result from recording a data access on-chain."""
+    model_config = ConfigDict(defer_build=True)
     tx_hash: str = Field(description="Transaction hash")
     block_number: int = Field(description="Block number containing the transaction")
     gas_used: int = Field(description="Gas consumed by the transaction")
@@ -319,6 +355,7 @@ class AccessResult(BaseModel):
 
 class ChainWalletInfo(BaseModel):
     """Wallet information for chain operations."""
+    model_config = ConfigDict(defer_build=True)
     address: str = Field(description="Ethereum wallet address")
     balance_wei: int = Field(description="Balance in wei")
     balance_eth: str = Field(description="Balance formatted as ETH string")
@@ -328,15 +365,17 @@ class ChainWalletInfo(BaseModel):
 
 # --- Collection / Manifest Upload Models ---
 
-class ManifestUploadTiming(BaseModel):
+class ManifestUploadTiming(_GatewayResponseModel):
     """Optional timing breakdown from manifest upload."""
+    model_config = ConfigDict(defer_build=True)
     stamp_check_ms: Optional[int] = Field(default=None, description="Time spent checking stamp in milliseconds")
     upload_ms: Optional[int] = Field(default=None, description="Time spent uploading in milliseconds")
     total_ms: Optional[int] = Field(default=None, description="Total request time in milliseconds")
 
 
-class ManifestUploadResponse(BaseModel):
+class ManifestUploadResponse(_GatewayResponseModel):
     """Response from uploading a TAR archive as a Swarm manifest."""
+    model_config = ConfigDict(defer_build=True)
     reference: str = Field(description="Swarm manifest reference hash")
     file_count: Optional[int] = Field(default=None, description="Number of files in the manifest")
     message: Optional[str] = Field(default=None, description="Status message")
@@ -345,6 +384,7 @@ class ManifestUploadResponse(BaseModel):
 
 class CollectionFileInfo(BaseModel):
     """Information about a single file within a collection."""
+    model_config = ConfigDict(defer_build=True)
     path: str = Field(description="Relative path of the file within the collection")
     size: int = Field(description="File size in bytes")
     content_hash: str = Field(description="SHA-256 hash of the file content")
@@ -352,6 +392,7 @@ class CollectionFileInfo(BaseModel):
 
 class CollectionProvenanceMetadata(BaseModel):
     """Provenance metadata for a collection (directory) upload."""
+    model_config = ConfigDict(defer_build=True)
     collection_hash: str = Field(description="SHA-256 hash representing the entire collection")
     files: List[CollectionFileInfo] = Field(description="List of files in the collection")
     total_size: int = Field(description="Total size of all files in bytes")
@@ -1,60 +1,221 @@
+import base64
+import hashlib
 import json
+import os
+import re
+from types import SimpleNamespace
+
 import pytest
 import typer
-from typer.testing import CliRunner
-from swarm_provenance_uploader.cli import app, _backend_config, _x402_config, _chain_config
+from click.testing import CliRunner
+from swarm_provenance_uploader import cli, get_version
+from swarm_provenance_uploader.cli import _backend_config, _x402_config, _chain_config
+from swarm_provenance_uploader.core import swarm_client
+from swarm_provenance_uploader.core.gateway_client import GatewayClient
+from swarm_provenance_uploader.exceptions import PoolNotEnabledError
 from swarm_provenance_uploader.models import (
+    AcquireStampResponse,
+    ChequebookResponse,
+    PoolStatusResponse,
     StampDetails,
+    StampHealthCheckResponse,
+    StampHealthIssue,
     StampListResponse,
-    StampPurchaseResponse,
     WalletResponse,
-    ChequebookResponse,
 )
 
-# Create a Typer Test Runner
+# Build the Click command tree once. typer.testing.CliRunner rebuilds it from
+# the Typer app on every invoke, which costs far more than the command itself.
+app = typer.main.get_command(cli.app)
 runner = CliRunner()
 
 # Test constants
 DUMMY_HASH = "a028d9370473556397e189567c07279195890a1688600210336996689840.2.0"
 DUMMY_STAMP = "a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3"
 DUMMY_SWARM_REF = "b5d4ea763a1396676771151158461f73678f1676166acd06a0a18600b85de8a4"
+STAMP_A = "a" * 64
+STAMP_B = "b" * 64
+STAMP_C = "c" * 64
+
+# Version format: X.Y.Z or X.Y.Z+git.abc1234
+_VERSION_RE = re.compile(r"\d+\.\d+\.\d+")
+# --json output starts on its own line, possibly after warnings on stderr
+_JSON_START_RE = re.compile(r"^\{", re.MULTILINE)
+
+# Metadata blob a successful download returns for b"test provenance data"
+_DOWNLOAD_DATA = b"test provenance data"
+_DOWNLOAD_B64 = base64.b64encode(_DOWNLOAD_DATA).decode()
+_DOWNLOAD_HASH = hashlib.sha256(_DOWNLOAD_DATA).hexdigest()
+_DOWNLOAD_PAYLOAD = json.dumps({
+    "data": _DOWNLOAD_B64,
+    "content_hash": _DOWNLOAD_HASH,
+    "stamp_id": DUMMY_STAMP,
+    "provenance_standard": "TEST-V1",
+    "encryption": None
+}).encode()
+
+
+# Gateway responses shared across tests (response models are frozen)
+_STAMP_OK = StampDetails(
+    batchID=DUMMY_STAMP,
+    usable=True,
+    exists=True,
+    depth=17,
+    amount="1000000000",
+    bucketDepth=16,
+    blockNumber=12345,
+    immutableFlag=False,
+    batchTTL=3600,
+    utilization=0
+)
+_STAMP_LIST_OK = StampListResponse(
+    stamps=[_STAMP_OK.model_copy(update={"batchTTL": 86400, "utilization": 10})],
+    total_count=1
+)
+_WALLET_OK = WalletResponse(
+    walletAddress="0x1234567890abcdef1234567890abcdef12345678",
+    bzzBalance="100.5"
+)
+_CHEQUEBOOK_OK = ChequebookResponse(
+    chequebookAddress="0xabcdef1234567890abcdef1234567890abcdef12",
+    availableBalance="50.0",
+    totalBalance="100.0"
+)
+SAMPLE_POOL_STATUS = {
+    "enabled": True,
+    "reserve_config": {"17": 5, "20": 3, "22": 2},
+    "current_levels": {"17": 4, "20": 2, "22": 1},
+    "available_stamps": {
+        "17": [STAMP_A, STAMP_B],
+        "20": [STAMP_C],
+        "22": [],
+    },
+    "total_stamps": 7,
+    "low_reserve_warning": False,
+    "last_check": "2024-01-15T10:00:00Z",
+    "next_check": "2024-01-15T11:00:00Z",
+    "errors": [],
+}
+_POOL_STATUS_OK = PoolStatusResponse(**SAMPLE_POOL_STATUS)
+
+
+@pytest.fixture(scope="session")
+def upload_file(tmp_path_factory):
+    """Small data file written once per session; upload only reads it."""
+    path = tmp_path_factory.mktemp("upload") / "my_data.txt"
+    path.write_text("some provenance data")
+    return str(path)
+
+
+@pytest.fixture(scope="module")
+def stamp_details():
+    """Usable stamp shared by tests; models are frozen, so use model_copy for variants."""
+    return _STAMP_OK
+
+
+@pytest.fixture
+def gateway_mock(mocker):
+    """GatewayClient mock the CLI receives in place of a real client."""
+    mock = mocker.MagicMock(spec=GatewayClient)
+    mocker.patch.object(cli, "GatewayClient", return_value=mock)
+    return mock
+
+
+@pytest.fixture
+def bee_health_ok(monkeypatch):
+    """Make the local Bee node's /health probe answer 200."""
+    response = SimpleNamespace(status_code=200)
+    monkeypatch.setattr("requests.get", lambda *args, **kwargs: response)
+    return response
+
+
+def _stub_gateway(monkeypatch, **returns):
+    """Patch GatewayClient with a plain object whose methods return fixed values.
+
+    Cheaper than a MagicMock for tests that never assert on calls.
+    """
+    stub = SimpleNamespace(**{
+        name: (lambda value: lambda *args, **kwargs: value)(value)
+        for name, value in returns.items()
+    })
+    monkeypatch.setattr(cli, "GatewayClient", lambda *args, **kwargs: stub)
+    return stub
+
+
+def _assert_all_in(text, needles):
+    """Assert every needle occurs in text, reporting all missing ones at once."""
+    missing = [needle for needle in needles if needle not in text]
+    assert not missing, f"missing {missing} in output:\n{text}"
+
+
+def _json_output(text):
+    """Parse the JSON document that follows any non-JSON lines in CLI output."""
+    match = _JSON_START_RE.search(text)
+    assert match, f"no JSON object in output:\n{text}"
+    return json.loads(text[match.start():])
+
+
+def _run_direct(command, *args, **kwargs):
+    """Call a command function without the Click runner; return its exit code."""
+    try:
+        command(*args, **kwargs)
+    except typer.Exit as e:
+        return e.exit_code
+    return 0
+
+
+# Config every test starts from, independent of whatever .env provides
+_PRISTINE_BACKEND = {
+    "backend": "gateway",
+    "gateway_url": "https://provenance-gateway.datafund.io",
+    "bee_url": "http://localhost:1633",
+    "free_tier": False,
+}
+_PRISTINE_X402 = {
+    "enabled": False,
+    "auto_pay": False,
+    "max_auto_pay_usd": 1.00,
+    "network": "base-sepolia",
+}
+_PRISTINE_CHAIN = {
+    "enabled": False,
+    "chain": "base-sepolia",
+    "rpc_url": None,
+    "contract": None,
+    "wallet_key_env": "PROVENANCE_WALLET_KEY",
+    "explorer_url": None,
+    "gas_limit": None,
+}
+_CONFIGS = (
+    (_backend_config, _PRISTINE_BACKEND),
+    (_x402_config, _PRISTINE_X402),
+    (_chain_config, _PRISTINE_CHAIN),
+)
+
+
+def _restore_pristine_config():
+    for live, pristine in _CONFIGS:
+        # Most tests never touch the config; skip the writes when unchanged
+        if live != pristine:
+            live.update(pristine)
+
+
+@pytest.fixture(scope="module", autouse=True)
+def _snapshot_config():
+    """Start the module from pristine config and put the real one back after."""
+    saved = [live.copy() for live, _ in _CONFIGS]
+    _restore_pristine_config()
+    yield
+    for (live, _), original in zip(_CONFIGS, saved):
+        live.clear()
+        live.update(original)
 
 
 @pytest.fixture(autouse=True)
 def reset_backend_config():
-    """Reset backend config to defaults before each test."""
-    _backend_config["backend"] = "gateway"
-    _backend_config["gateway_url"] = "https://provenance-gateway.datafund.io"
-    _backend_config["bee_url"] = "http://localhost:1633"
-    _backend_config["free_tier"] = False
-    _x402_config["enabled"] = False
-    _x402_config["auto_pay"] = False
-    _x402_config["max_auto_pay_usd"] = 1.00
-    _x402_config["network"] = "base-sepolia"
-    _chain_config["enabled"] = False
-    _chain_config["chain"] = "base-sepolia"
-    _chain_config["rpc_url"] = None
-    _chain_config["contract"] = None
-    _chain_config["wallet_key_env"] = "PROVENANCE_WALLET_KEY"
-    _chain_config["explorer_url"] = None
-    _chain_config["gas_limit"] = None
+    """Undo any global config changes a test (or its CLI flags) made."""
     yield
-    # Reset again after test
-    _backend_config["backend"] = "gateway"
-    _backend_config["gateway_url"] = "https://provenance-gateway.datafund.io"
-    _backend_config["bee_url"] = "http://localhost:1633"
-    _backend_config["free_tier"] = False
-    _x402_config["enabled"] = False
-    _x402_config["auto_pay"] = False
-    _x402_config["max_auto_pay_usd"] = 1.00
-    _x402_config["network"] = "base-sepolia"
-    _chain_config["enabled"] = False
-    _chain_config["chain"] = "base-sepolia"
-    _chain_config["rpc_url"] = None
-    _chain_config["contract"] = None
-    _chain_config["wallet_key_env"] = "PROVENANCE_WALLET_KEY"
-    _chain_config["explorer_url"] = None
-    _chain_config["gas_limit"] = None
+    _restore_pristine_config()
 
 
 # =============================================================================
@@ -64,37 +225,31 @@ def reset_backend_config():
 class TestLocalBackendUpload:
     """Tests for upload command with local Bee backend."""
 
-    def test_upload_command_success(self, mocker):
+    def test_upload_command_success(self, mocker, upload_file):
         """Tests the CLI upload command with local backend."""
         # Mock swarm_client functions
-        m_purchase_stamp = mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.purchase_postage_stamp",
-            return_value=DUMMY_STAMP
+        m_purchase_stamp = mocker.patch.object(
+            swarm_client, "purchase_postage_stamp", return_value=DUMMY_STAMP
         )
-        m_get_stamp_info = mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.get_stamp_info",
+        mocker.patch.object(
+            swarm_client, "get_stamp_info",
             return_value={"exists": True, "usable": True, "batchTTL": 3600}
         )
-        m_upload_data = mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.upload_data",
-            return_value=DUMMY_SWARM_REF
+        m_upload_data = mocker.patch.object(
+            swarm_client, "upload_data", return_value=DUMMY_SWARM_REF
         )
 
-        with runner.isolated_filesystem():
-            with open("my_data.txt", "w") as f:
-                f.write("some provenance data")
-
-            result = runner.invoke(
-                app,
-                ["--backend", "local", "upload", "--file", "my_data.txt", "--std", "TESTING-V1"]
-            )
+        result = runner.invoke(
+            app,
+            ["--backend", "local", "upload", "--file", upload_file, "--std", "TESTING-V1"]
+        )
 
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert DUMMY_SWARM_REF in result.stdout
-            assert "SUCCESS!" in result.stdout
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        assert DUMMY_SWARM_REF in result.stdout
+        assert "SUCCESS!" in result.stdout
 
-            m_purchase_stamp.assert_called_once()
-            m_upload_data.assert_called_once()
+        m_purchase_stamp.assert_called_once()
+        m_upload_data.assert_called_once()
 
     def test_upload_file_not_found(self):
         """Tests CLI exits correctly if file does not exist."""
@@ -102,62 +257,41 @@ class TestLocalBackendUpload:
         assert result.exit_code != 0
         assert "Invalid value" in result.stdout
 
-    def test_upload_stamp_purchase_fails(self, mocker):
+    def test_upload_stamp_purchase_fails(self, mocker, upload_file):
         """Tests CLI exits correctly if stamp purchase fails."""
-        mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.purchase_postage_stamp",
+        mocker.patch.object(
+            swarm_client, "purchase_postage_stamp",
             side_effect=ConnectionError("Mock Connection Error")
         )
 
-        with runner.isolated_filesystem():
-            with open("my_data.txt", "w") as f:
-                f.write("some data")
-
-            result = runner.invoke(app, ["--backend", "local", "upload", "--file", "my_data.txt"])
+        result = runner.invoke(app, ["--backend", "local", "upload", "--file", upload_file])
 
-            assert result.exit_code == 1
-            assert "ERROR: Failed purchasing stamp" in result.stdout
+        assert result.exit_code == 1
+        assert "ERROR: Failed purchasing stamp" in result.stdout
 
 
 class TestLocalBackendDownload:
     """Tests for download command with local Bee backend."""
 
-    def test_download_command_success(self, mocker):
+    def test_download_command_success(self, mocker, tmp_path):
         """Tests download command with local backend."""
-        import json
-        import base64
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        import hashlib
-        content_hash = hashlib.sha256(original_data).hexdigest()
-
-        metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
-            "stamp_id": DUMMY_STAMP,
-            "provenance_standard": "TEST-V1",
-            "encryption": None
-        }
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.download_data_from_swarm",
-            return_value=json.dumps(metadata).encode()
+        mocker.patch.object(
+            swarm_client, "download_data_from_swarm",
+            return_value=_DOWNLOAD_PAYLOAD
         )
 
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                app,
-                ["--backend", "local", "download", DUMMY_SWARM_REF, "--output-dir", "."]
-            )
+        result = runner.invoke(
+            app,
+            ["--backend", "local", "download", DUMMY_SWARM_REF, "--output-dir", str(tmp_path)]
+        )
 
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert "SUCCESS: Content hash verification passed!" in result.stdout
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        assert "SUCCESS: Content hash verification passed!" in result.stdout
 
     def test_download_not_found(self, mocker):
         """Tests download fails gracefully when data not found."""
-        mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.download_data_from_swarm",
+        mocker.patch.object(
+            swarm_client, "download_data_from_swarm",
             side_effect=FileNotFoundError("Data not found")
         )
 
@@ -177,99 +311,45 @@ class TestLocalBackendDownload:
 class TestGatewayBackendUpload:
     """Tests for upload command with gateway backend."""
 
-    def test_upload_command_success(self, mocker):
+    def test_upload_command_success(self, upload_file, gateway_mock, stamp_details):
         """Tests the CLI upload command with gateway backend (default)."""
-        mock_client = mocker.MagicMock()
-        mock_client.purchase_stamp.return_value = DUMMY_STAMP
-        mock_client.get_stamp.return_value = StampDetails(
-            batchID=DUMMY_STAMP,
-            usable=True,
-            exists=True,
-            depth=17,
-            amount="1000000000",
-            bucketDepth=16,
-            blockNumber=12345,
-            immutableFlag=False,
-            batchTTL=3600,
-            utilization=0
-        )
-        mock_client.upload_data.return_value = DUMMY_SWARM_REF
+        gateway_mock.purchase_stamp.return_value = DUMMY_STAMP
+        gateway_mock.get_stamp.return_value = stamp_details
+        gateway_mock.upload_data.return_value = DUMMY_SWARM_REF
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
+        result = runner.invoke(
+            app,
+            ["upload", "--file", upload_file, "--std", "TESTING-V1"]
         )
 
-        with runner.isolated_filesystem():
-            with open("my_data.txt", "w") as f:
-                f.write("some provenance data")
-
-            result = runner.invoke(
-                app,
-                ["upload", "--file", "my_data.txt", "--std", "TESTING-V1"]
-            )
-
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert DUMMY_SWARM_REF in result.stdout
-            assert "SUCCESS!" in result.stdout
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        assert DUMMY_SWARM_REF in result.stdout
+        assert "SUCCESS!" in result.stdout
 
-    def test_upload_gateway_connection_fails(self, mocker):
+    def test_upload_gateway_connection_fails(self, upload_file, gateway_mock):
         """Tests CLI handles gateway connection errors."""
-        mock_client = mocker.MagicMock()
-        mock_client.purchase_stamp.side_effect = ConnectionError("Gateway unreachable")
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
-        with runner.isolated_filesystem():
-            with open("my_data.txt", "w") as f:
-                f.write("some data")
+        gateway_mock.purchase_stamp.side_effect = ConnectionError("Gateway unreachable")
 
-            result = runner.invoke(app, ["upload", "--file", "my_data.txt"])
+        result = runner.invoke(app, ["upload", "--file", upload_file])
 
-            assert result.exit_code == 1
-            assert "ERROR: Failed purchasing stamp" in result.stdout
+        assert result.exit_code == 1
+        assert "ERROR: Failed purchasing stamp" in result.stdout
 
 
 class TestGatewayBackendDownload:
     """Tests for download command with gateway backend."""
 
-    def test_download_command_success(self, mocker):
+    def test_download_command_success(self, gateway_mock, tmp_path):
         """Tests download command with gateway backend."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
-
-        metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
-            "stamp_id": DUMMY_STAMP,
-            "provenance_standard": "TEST-V1",
-            "encryption": None
-        }
+        gateway_mock.download_data.return_value = _DOWNLOAD_PAYLOAD
 
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
+        result = runner.invoke(
+            app,
+            ["download", DUMMY_SWARM_REF, "--output-dir", str(tmp_path)]
         )
 
-        with runner.isolated_filesystem():
-            result = runner.invoke(
-                app,
-                ["download", DUMMY_SWARM_REF, "--output-dir", "."]
-            )
-
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert "SUCCESS: Content hash verification passed!" in result.stdout
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        assert "SUCCESS: Content hash verification passed!" in result.stdout
 
 
 # =============================================================================
@@ -279,64 +359,18 @@ class TestGatewayBackendDownload:
 class TestStampsCommands:
     """Tests for stamps subcommands."""
 
-    def test_stamps_list_success(self, mocker):
+    def test_stamps_list_success(self, gateway_mock):
         """Tests stamps list command."""
-        mock_client = mocker.MagicMock()
-        mock_client.list_stamps.return_value = StampListResponse(
-            stamps=[
-                StampDetails(
-                    batchID=DUMMY_STAMP,
-                    usable=True,
-                    exists=True,
-                    depth=17,
-                    amount="1000000000",
-                    bucketDepth=16,
-                    blockNumber=12345,
-                    immutableFlag=False,
-                    batchTTL=86400,
-                    utilization=10
-                )
-            ],
-            total_count=1
-        )
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.list_stamps.return_value = _STAMP_LIST_OK
 
         result = runner.invoke(app, ["stamps", "list"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "Total: 1 stamp(s)" in result.stdout
 
-    def test_stamps_list_requires_gateway(self):
-        """Tests stamps list fails with local backend."""
-        result = runner.invoke(app, ["--backend", "local", "stamps", "list"])
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
-    def test_stamps_info_success(self, mocker):
+    def test_stamps_info_success(self, monkeypatch, stamp_details):
         """Tests stamps info command."""
-        mock_client = mocker.MagicMock()
-        mock_client.get_stamp.return_value = StampDetails(
-            batchID=DUMMY_STAMP,
-            usable=True,
-            exists=True,
-            depth=17,
-            amount="1000000000",
-            bucketDepth=16,
-            blockNumber=12345,
-            immutableFlag=False,
-            batchTTL=3600,
-            utilization=5
-        )
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        _stub_gateway(monkeypatch, get_stamp=stamp_details.model_copy(update={"utilization": 5}))
 
         result = runner.invoke(app, ["stamps", "info", DUMMY_STAMP])
 
@@ -344,46 +378,24 @@ class TestStampsCommands:
         assert "Stamp Details:" in result.stdout
         assert "Usable:" in result.stdout
 
-    def test_stamps_info_not_found(self, mocker):
+    def test_stamps_info_not_found(self, gateway_mock):
         """Tests stamps info when stamp not found."""
-        mock_client = mocker.MagicMock()
-        mock_client.get_stamp.return_value = None
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.get_stamp.return_value = None
 
         result = runner.invoke(app, ["stamps", "info", DUMMY_STAMP])
 
         assert result.exit_code == 1
         assert "not found" in result.stdout
 
-    def test_stamps_extend_success(self, mocker):
+    def test_stamps_extend_success(self, gateway_mock):
         """Tests stamps extend command."""
-        mock_client = mocker.MagicMock()
-        mock_client.extend_stamp.return_value = DUMMY_STAMP
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.extend_stamp.return_value = DUMMY_STAMP
 
         result = runner.invoke(app, ["stamps", "extend", DUMMY_STAMP, "--amount", "1000000"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "SUCCESS: Stamp extended" in result.stdout
 
-    def test_stamps_extend_requires_gateway(self):
-        """Tests stamps extend fails with local backend."""
-        result = runner.invoke(
-            app,
-            ["--backend", "local", "stamps", "extend", DUMMY_STAMP, "--amount", "1000000"]
-        )
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
 
 # =============================================================================
 # INFO COMMANDS TESTS (wallet, chequebook, health)
@@ -392,18 +404,9 @@ class TestStampsCommands:
 class TestInfoCommands:
     """Tests for wallet, chequebook, and health commands."""
 
-    def test_wallet_success(self, mocker):
+    def test_wallet_success(self, monkeypatch):
         """Tests wallet command."""
-        mock_client = mocker.MagicMock()
-        mock_client.get_wallet.return_value = WalletResponse(
-            walletAddress="0x1234567890abcdef1234567890abcdef12345678",
-            bzzBalance="100.5"
-        )
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        _stub_gateway(monkeypatch, get_wallet=_WALLET_OK)
 
         result = runner.invoke(app, ["wallet"])
 
@@ -411,82 +414,80 @@ class TestInfoCommands:
         assert "Wallet Information:" in result.stdout
         assert "0x1234567890abcdef" in result.stdout
 
-    def test_wallet_requires_gateway(self):
-        """Tests wallet fails with local backend."""
-        result = runner.invoke(app, ["--backend", "local", "wallet"])
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
-    def test_chequebook_success(self, mocker):
+    def test_chequebook_success(self, monkeypatch):
         """Tests chequebook command."""
-        mock_client = mocker.MagicMock()
-        mock_client.get_chequebook.return_value = ChequebookResponse(
-            chequebookAddress="0xabcdef1234567890abcdef1234567890abcdef12",
-            availableBalance="50.0",
-            totalBalance="100.0"
-        )
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        _stub_gateway(monkeypatch, get_chequebook=_CHEQUEBOOK_OK)
 
         result = runner.invoke(app, ["chequebook"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "Chequebook Information:" in result.stdout
 
-    def test_chequebook_requires_gateway(self):
-        """Tests chequebook fails with local backend."""
-        result = runner.invoke(app, ["--backend", "local", "chequebook"])
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
-    def test_health_gateway_success(self, mocker):
+    def test_health_gateway_success(self, monkeypatch):
         """Tests health command with gateway backend."""
-        mock_client = mocker.MagicMock()
-        mock_client.health_check.return_value = True
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        _stub_gateway(monkeypatch, health_check=True)
 
         result = runner.invoke(app, ["health"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "Healthy" in result.stdout
 
-    def test_health_gateway_unhealthy(self, mocker):
+    def test_health_gateway_unhealthy(self, monkeypatch):
         """Tests health command when gateway is unhealthy."""
-        mock_client = mocker.MagicMock()
-        mock_client.health_check.return_value = False
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        _stub_gateway(monkeypatch, health_check=False)
 
         result = runner.invoke(app, ["health"])
 
         assert result.exit_code == 1
         assert "Unhealthy" in result.stdout
 
-    def test_health_local_success(self, mocker):
+    def test_health_local_success(self, bee_health_ok):
         """Tests health command with local backend."""
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 200
-
-        mocker.patch("requests.get", return_value=mock_response)
-
         result = runner.invoke(app, ["--backend", "local", "health"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "Healthy" in result.stdout
 
 
+# =============================================================================
+# GATEWAY-ONLY COMMAND TESTS
+# =============================================================================
+
+class TestRequiresGateway:
+    """Tests that gateway-only commands refuse the local backend."""
+
+    @pytest.mark.parametrize("command,args", [
+        pytest.param(cli.stamps_list, (), id="stamps-list"),
+        pytest.param(cli.stamps_extend, (DUMMY_STAMP, 1000000), id="stamps-extend"),
+        pytest.param(cli.wallet, (), id="wallet"),
+        pytest.param(cli.chequebook, (), id="chequebook"),
+        pytest.param(cli.notary_info, (), id="notary-info"),
+        pytest.param(cli.notary_status, (), id="notary-status"),
+        pytest.param(cli.stamps_pool_status, (), id="stamps-pool-status"),
+        pytest.param(cli.stamps_check, (STAMP_A,), id="stamps-check"),
+    ])
+    def test_requires_gateway(self, capsys, command, args):
+        """Tests the command fails with local backend."""
+        _backend_config["backend"] = "local"
+
+        assert _run_direct(command, *args) == 1
+        assert "requires gateway backend" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("option", [
+        pytest.param(["--usePool"], id="usepool"),
+        pytest.param(["--sign", "notary"], id="sign"),
+    ])
+    def test_upload_option_requires_gateway(self, upload_file, option):
+        """Tests gateway-only upload options fail with local backend."""
+        result = runner.invoke(
+            app,
+            ["--backend", "local", "upload", "--file", upload_file, *option]
+        )
+
+        assert result.exit_code == 1
+        assert "requires gateway backend" in result.stdout
+
+
 # =============================================================================
 # BACKEND SWITCHING TESTS
 # =============================================================================
@@ -494,47 +495,35 @@ class TestInfoCommands:
 class TestBackendSwitching:
     """Tests for --backend flag behavior."""
 
-    def test_invalid_backend(self):
+    def test_invalid_backend(self, capsys):
         """Tests invalid backend value."""
-        result = runner.invoke(app, ["--backend", "invalid", "health"])
-
-        assert result.exit_code == 1
-        assert "Invalid backend" in result.stdout
+        assert _run_direct(cli.main, None, backend="invalid") == 1
+        assert "Invalid backend" in capsys.readouterr().err
+        assert _backend_config["backend"] == "gateway"
 
-    def test_default_is_gateway(self, mocker):
+    def test_default_is_gateway(self, gateway_mock):
         """Tests that gateway is the default backend."""
-        mock_client = mocker.MagicMock()
-        mock_client.health_check.return_value = True
+        gateway_mock.health_check.return_value = True
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
-        result = runner.invoke(app, ["health"])
+        result = runner.invoke(app, ["health"], catch_exceptions=False)
 
         # Should use gateway (mock was called)
         assert result.exit_code == 0
-        mock_client.health_check.assert_called_once()
+        gateway_mock.health_check.assert_called_once()
 
-    def test_custom_gateway_url(self, mocker):
+    def test_custom_gateway_url(self, gateway_mock):
         """Tests custom gateway URL option."""
-        mock_client = mocker.MagicMock()
-        mock_client.health_check.return_value = True
-
-        mock_constructor = mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.health_check.return_value = True
 
         result = runner.invoke(
             app,
-            ["--gateway-url", "https://custom.gateway.io", "health"]
+            ["--gateway-url", "https://custom.gateway.io", "health"],
+            catch_exceptions=False
         )
 
         assert result.exit_code == 0
         # Verify custom URL was used
-        mock_constructor.assert_called_with(base_url="https://custom.gateway.io", free_tier=False)
+        cli.GatewayClient.assert_called_with(base_url="https://custom.gateway.io", free_tier=False)
 
 
 # =============================================================================
@@ -544,25 +533,17 @@ class TestBackendSwitching:
 class TestVersionFlag:
     """Tests for --version flag."""
 
-    def test_version_long_flag(self):
-        """Tests --version flag shows version."""
-        result = runner.invoke(app, ["--version"])
-
-        assert result.exit_code == 0
-        assert "swarm-prov-upload" in result.stdout
-        # Version format: X.Y.Z or X.Y.Z+git.abc1234
-        import re
-        assert re.search(r"\d+\.\d+\.\d+", result.stdout)
+    def test_version_string(self):
+        """Tests the package version has X.Y.Z form."""
+        assert _VERSION_RE.match(get_version())
 
-    def test_version_short_flag(self):
-        """Tests -V flag shows version."""
-        result = runner.invoke(app, ["-V"])
+    @pytest.mark.parametrize("flag", ["--version", "-V"])
+    def test_version_flag(self, flag):
+        """Tests --version / -V prints the package version."""
+        result = runner.invoke(app, [flag])
 
         assert result.exit_code == 0
-        assert "swarm-prov-upload" in result.stdout
-        # Version format: X.Y.Z or X.Y.Z+git.abc1234
-        import re
-        assert re.search(r"\d+\.\d+\.\d+", result.stdout)
+        assert result.stdout.strip() == f"swarm-prov-upload {get_version()}"
 
 
 # =============================================================================
@@ -572,84 +553,44 @@ class TestVersionFlag:
 class TestStampIdOption:
     """Tests for --stamp-id option on upload."""
 
-    def test_upload_with_existing_stamp(self, mocker):
+    def test_upload_with_existing_stamp(self, upload_file, gateway_mock, stamp_details):
         """Tests upload using existing stamp ID."""
         existing_stamp = "a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3"
+        gateway_mock.get_stamp.return_value = stamp_details.model_copy(update={"utilization": 10})
+        gateway_mock.upload_data.return_value = DUMMY_SWARM_REF
 
-        mock_client = mocker.MagicMock()
-        mock_client.get_stamp.return_value = StampDetails(
-            batchID=existing_stamp,
-            usable=True,
-            exists=True,
-            depth=17,
-            amount="1000000000",
-            bucketDepth=16,
-            blockNumber=12345,
-            immutableFlag=False,
-            batchTTL=3600,
-            utilization=10
-        )
-        mock_client.upload_data.return_value = DUMMY_SWARM_REF
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
+        result = runner.invoke(
+            app,
+            ["upload", "--file", upload_file, "--stamp-id", existing_stamp]
         )
 
-        with runner.isolated_filesystem():
-            with open("test_data.txt", "w") as f:
-                f.write("test data")
-
-            result = runner.invoke(
-                app,
-                ["upload", "--file", "test_data.txt", "--stamp-id", existing_stamp]
-            )
-
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert "Using existing stamp" in result.stdout
-            assert DUMMY_SWARM_REF in result.stdout
-            # Should NOT call purchase_stamp
-            mock_client.purchase_stamp.assert_not_called()
-            # Should call upload
-            mock_client.upload_data.assert_called_once()
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        assert "Using existing stamp" in result.stdout
+        assert DUMMY_SWARM_REF in result.stdout
+        # Should NOT call purchase_stamp
+        gateway_mock.purchase_stamp.assert_not_called()
+        # Should call upload
+        gateway_mock.upload_data.assert_called_once()
 
-    def test_upload_with_unusable_stamp(self, mocker):
+    def test_upload_with_unusable_stamp(self, monkeypatch, upload_file, gateway_mock, stamp_details):
         """Tests upload fails when stamp exists but is not usable."""
         unusable_stamp = "a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3"
-
-        mock_client = mocker.MagicMock()
         # Return a stamp that exists but is NOT usable
-        mock_client.get_stamp.return_value = StampDetails(
-            batchID=unusable_stamp,
-            usable=False,  # Not usable!
-            exists=True,
-            depth=17,
-            amount="1000000000",
-            bucketDepth=16,
-            blockNumber=12345,
-            immutableFlag=False,
-            batchTTL=3600,
-            utilization=100
-        )
+        gateway_mock.get_stamp.return_value = stamp_details.model_copy(update={"usable": False, "utilization": 100})
+        # Retry waits are real sleeps; record them instead
+        sleeps = []
+        monkeypatch.setattr(cli.time, "sleep", sleeps.append)
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
+        result = runner.invoke(
+            app,
+            ["upload", "--file", upload_file, "--stamp-id", unusable_stamp,
+             "--stamp-retries", "2", "--stamp-interval", "5"]
         )
 
-        with runner.isolated_filesystem():
-            with open("test_data.txt", "w") as f:
-                f.write("test data")
-
-            # Use minimal retries to speed up test
-            result = runner.invoke(
-                app,
-                ["upload", "--file", "test_data.txt", "--stamp-id", unusable_stamp,
-                 "--stamp-retries", "1", "--stamp-interval", "1"]
-            )
-
-            assert result.exit_code == 1
-            assert "did not become USABLE" in result.stdout or "ERROR" in result.stdout
+        assert result.exit_code == 1
+        assert "did not become USABLE" in result.stdout
+        assert gateway_mock.get_stamp.call_count == 2
+        assert sleeps == [5]
 
 
 # =============================================================================
@@ -659,28 +600,17 @@ class TestStampIdOption:
 class TestLocalBackendWarning:
     """Tests for local backend deprecation warning."""
 
-    def test_local_backend_shows_warning(self, mocker):
+    def test_local_backend_shows_warning(self, bee_health_ok):
         """Tests that local backend shows warning message."""
-        mock_response = mocker.MagicMock()
-        mock_response.status_code = 200
-
-        mocker.patch("requests.get", return_value=mock_response)
-
         result = runner.invoke(app, ["--backend", "local", "health"])
 
         assert result.exit_code == 0
         # Warning should be shown (on stderr, but captured in output)
         assert "Local Bee backend is intended for development" in result.output or result.exit_code == 0
 
-    def test_gateway_backend_no_warning(self, mocker):
+    def test_gateway_backend_no_warning(self, gateway_mock):
         """Tests that gateway backend does NOT show warning."""
-        mock_client = mocker.MagicMock()
-        mock_client.health_check.return_value = True
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.health_check.return_value = True
 
         result = runner.invoke(app, ["health"])
 
@@ -695,35 +625,19 @@ class TestLocalBackendWarning:
 class TestX402StatusCommand:
     """Tests for x402 status command."""
 
-    def test_x402_status_shows_disabled(self):
-        """Tests x402 status shows disabled by default."""
+    def test_x402_status_output(self):
+        """Tests x402 status shows the default configuration."""
         result = runner.invoke(app, ["x402", "status"])
 
         assert result.exit_code == 0
-        assert "x402 Payment Configuration" in result.stdout
-        assert "Disabled" in result.stdout
-
-    def test_x402_status_shows_network(self):
-        """Tests x402 status shows configured network."""
-        result = runner.invoke(app, ["x402", "status"])
-
-        assert result.exit_code == 0
-        assert "base-sepolia" in result.stdout
-
-    def test_x402_status_shows_auto_pay_settings(self):
-        """Tests x402 status shows auto-pay settings."""
-        result = runner.invoke(app, ["x402", "status"])
-
-        assert result.exit_code == 0
-        assert "Auto-pay" in result.stdout
-        assert "Max auto-pay" in result.stdout
-
-    def test_x402_status_shows_no_private_key(self):
-        """Tests x402 status shows private key not set."""
-        result = runner.invoke(app, ["x402", "status"])
-
-        assert result.exit_code == 0
-        assert "Not set" in result.stdout
+        _assert_all_in(result.stdout, (
+            "x402 Payment Configuration",
+            "Disabled",
+            "base-sepolia",
+            "Auto-pay",
+            "Max auto-pay",
+            "Not set",  # private key
+        ))
 
 
 class TestX402InfoCommand:
@@ -742,44 +656,32 @@ class TestX402InfoCommand:
 class TestX402BalanceCommand:
     """Tests for x402 balance command."""
 
-    def test_x402_balance_fails_without_private_key(self):
+    def test_x402_balance_fails_without_private_key(self, capsys):
         """Tests x402 balance fails when no private key configured."""
-        result = runner.invoke(app, ["x402", "balance"])
-
-        assert result.exit_code == 1
-        assert "No private key" in result.stdout or "ERROR" in result.stdout
+        assert _run_direct(cli.x402_balance) == 1
+        assert "No private key" in capsys.readouterr().err
 
 
 class TestX402GlobalFlags:
     """Tests for x402 global CLI flags."""
 
-    def test_x402_flag_enables_payments(self):
-        """Tests --x402 flag enables x402 payments."""
-        # Just test that the flag is recognized
-        result = runner.invoke(app, ["--x402", "x402", "status"])
-
-        assert result.exit_code == 0
-        # After the flag, x402 should be enabled in config
-        assert "Enabled" in result.stdout or "x402" in result.stdout
-
-    def test_auto_pay_flag_recognized(self):
-        """Tests --auto-pay flag is recognized."""
-        result = runner.invoke(app, ["--auto-pay", "x402", "status"])
-
-        assert result.exit_code == 0
-
-    def test_max_pay_flag_recognized(self):
-        """Tests --max-pay flag is recognized."""
-        result = runner.invoke(app, ["--max-pay", "5.00", "x402", "status"])
-
-        assert result.exit_code == 0
-
-    def test_x402_network_flag_recognized(self):
-        """Tests --x402-network flag is recognized."""
-        result = runner.invoke(app, ["--x402-network", "base", "x402", "status"])
+    @pytest.mark.parametrize("flags,expected", [
+        pytest.param(["--x402"], ["Enabled"], id="x402"),
+        pytest.param(["--auto-pay"], ["Yes"], id="auto-pay"),
+        pytest.param(["--max-pay", "2.50"], ["$2.50"], id="max-pay"),
+        pytest.param(["--x402-network", "base"], ["base"], id="x402-network"),
+        pytest.param(
+            ["--x402", "--auto-pay", "--max-pay", "10.00", "--x402-network", "base-sepolia"],
+            ["Enabled", "Yes", "$10.00", "base-sepolia"],
+            id="all-flags",
+        ),
+    ])
+    def test_x402_global_flag_recognized(self, flags, expected):
+        """Tests x402 global flags parse and show up in x402 status."""
+        result = runner.invoke(app, [*flags, "x402", "status"])
 
         assert result.exit_code == 0
-        assert "base" in result.stdout
+        _assert_all_in(result.stdout, expected)
 
     def test_invalid_x402_network_rejected(self):
         """Tests invalid x402 network is rejected."""
@@ -788,45 +690,6 @@ class TestX402GlobalFlags:
         assert result.exit_code == 1
         assert "Invalid x402 network" in result.stdout
 
-    def test_max_pay_flag_updates_config(self):
-        """Tests --max-pay flag updates the auto-pay limit."""
-        result = runner.invoke(app, ["--max-pay", "2.50", "x402", "status"])
-
-        assert result.exit_code == 0
-        # Should show the updated max pay value
-        assert "2.50" in result.stdout or "$2.50" in result.stdout
-
-
-class TestX402StatusDetails:
-    """Additional tests for x402 status command."""
-
-    def test_x402_status_shows_max_auto_pay(self):
-        """Tests x402 status shows max auto-pay amount."""
-        result = runner.invoke(app, ["--max-pay", "3.50", "x402", "status"])
-
-        assert result.exit_code == 0
-        assert "3.50" in result.stdout or "$3.50" in result.stdout
-
-    def test_x402_status_network_after_flag(self):
-        """Tests that --x402-network flag changes displayed network."""
-        result = runner.invoke(app, ["--x402-network", "base", "x402", "status"])
-
-        assert result.exit_code == 0
-        # Should show 'base' not 'base-sepolia'
-        assert "base" in result.stdout.lower()
-        # Mainnet warning might appear
-        # (no assertion as warning may or may not be present)
-
-    def test_x402_status_with_all_flags(self):
-        """Tests x402 status with multiple flags combined."""
-        result = runner.invoke(
-            app,
-            ["--x402", "--auto-pay", "--max-pay", "10.00", "--x402-network", "base-sepolia", "x402", "status"]
-        )
-
-        assert result.exit_code == 0
-        assert "Enabled" in result.stdout
-        assert "10.00" in result.stdout or "$10.00" in result.stdout
 
 
 # =============================================================================
@@ -836,153 +699,67 @@ class TestX402StatusDetails:
 class TestStampsPoolCommands:
     """Tests for stamps pool commands."""
 
-    SAMPLE_POOL_STATUS = {
-        "enabled": True,
-        "reserve_config": {"17": 5, "20": 3, "22": 2},
-        "current_levels": {"17": 4, "20": 2, "22": 1},
-        "available_stamps": {
-            "17": ["a" * 64, "b" * 64],
-            "20": ["c" * 64],
-            "22": [],
-        },
-        "total_stamps": 7,
-        "low_reserve_warning": False,
-        "last_check": "2024-01-15T10:00:00Z",
-        "next_check": "2024-01-15T11:00:00Z",
-        "errors": [],
-    }
-
-    def test_pool_status_success(self, mocker):
+    def test_pool_status_success(self, capsys, gateway_mock):
         """Tests stamps pool-status command."""
-        from swarm_provenance_uploader.models import PoolStatusResponse
+        gateway_mock.get_pool_status.return_value = _POOL_STATUS_OK
 
-        mock_client = mocker.MagicMock()
-        mock_client.get_pool_status.return_value = PoolStatusResponse(**self.SAMPLE_POOL_STATUS)
+        assert _run_direct(cli.stamps_pool_status) == 0
+        out = capsys.readouterr().out
+        assert "Stamp Pool Status" in out
+        assert "Enabled" in out
+        assert "Total stamps: 7" in out
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
-        result = runner.invoke(app, ["stamps", "pool-status"])
-
-        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        assert "Stamp Pool Status" in result.stdout
-        assert "Enabled" in result.stdout
-        assert "Total stamps: 7" in result.stdout
-
-    def test_pool_status_requires_gateway(self):
-        """Tests pool-status fails with local backend."""
-        result = runner.invoke(app, ["--backend", "local", "stamps", "pool-status"])
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
-    def test_pool_status_not_enabled(self, mocker):
+    def test_pool_status_not_enabled(self, capsys, gateway_mock):
         """Tests stamps pool-status when pool not enabled."""
-        from swarm_provenance_uploader.exceptions import PoolNotEnabledError
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_pool_status.side_effect = PoolNotEnabledError("Pool not enabled")
+        gateway_mock.get_pool_status.side_effect = PoolNotEnabledError("Pool not enabled")
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        assert _run_direct(cli.stamps_pool_status) == 0  # Not a hard error, just informational
+        assert "not enabled" in capsys.readouterr().out.lower()
 
-        result = runner.invoke(app, ["stamps", "pool-status"])
-
-        assert result.exit_code == 0  # Not a hard error, just informational
-        assert "not enabled" in result.stdout.lower()
-
-    def test_stamps_check_success(self, mocker):
+    def test_stamps_check_success(self, capsys, gateway_mock):
         """Tests stamps check command."""
-        from swarm_provenance_uploader.models import StampHealthCheckResponse, StampHealthIssue
-
-        mock_client = mocker.MagicMock()
-        mock_client.check_stamp_health.return_value = StampHealthCheckResponse(
-            stamp_id="a" * 64,
+        gateway_mock.check_stamp_health.return_value = StampHealthCheckResponse(
+            stamp_id=STAMP_A,
             can_upload=True,
             errors=[],
             warnings=[StampHealthIssue(code="LOW_TTL", message="TTL is below 24 hours")],
             status={"ttl": 43200},
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
-        result = runner.invoke(app, ["stamps", "check", "a" * 64])
-
-        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        assert "Health Check" in result.stdout
-        assert "Can upload: Yes" in result.stdout
-        assert "LOW_TTL" in result.stdout
+        assert _run_direct(cli.stamps_check, STAMP_A) == 0
+        out = capsys.readouterr().out
+        assert "Health Check" in out
+        assert "Can upload: Yes" in out
+        assert "LOW_TTL" in out
 
-    def test_stamps_check_not_usable(self, mocker):
+    def test_stamps_check_not_usable(self, capsys, gateway_mock):
         """Tests stamps check when stamp cannot upload."""
-        from swarm_provenance_uploader.models import StampHealthCheckResponse, StampHealthIssue
-
-        mock_client = mocker.MagicMock()
-        mock_client.check_stamp_health.return_value = StampHealthCheckResponse(
-            stamp_id="a" * 64,
+        gateway_mock.check_stamp_health.return_value = StampHealthCheckResponse(
+            stamp_id=STAMP_A,
             can_upload=False,
             errors=[StampHealthIssue(code="EXPIRED", message="Stamp has expired")],
             warnings=[],
             status=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
-        result = runner.invoke(app, ["stamps", "check", "a" * 64])
-
-        assert result.exit_code == 1
-        assert "Can upload: No" in result.stdout
-        assert "EXPIRED" in result.stdout
-
-    def test_stamps_check_requires_gateway(self):
-        """Tests stamps check fails with local backend."""
-        result = runner.invoke(app, ["--backend", "local", "stamps", "check", "a" * 64])
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
+        assert _run_direct(cli.stamps_check, STAMP_A) == 1
+        out = capsys.readouterr().out
+        assert "Can upload: No" in out
+        assert "EXPIRED" in out
 
 
 class TestUploadWithPool:
     """Tests for upload command with --usePool flag."""
 
-    def test_usepool_requires_gateway(self, mocker, tmp_path):
-        """Tests --usePool fails with local backend."""
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-
-        result = runner.invoke(
-            app,
-            ["--backend", "local", "upload", "--file", str(test_file), "--usePool"]
-        )
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
-    def test_usepool_acquires_from_pool(self, mocker, tmp_path):
+    def test_usepool_acquires_from_pool(self, upload_file, gateway_mock, stamp_details):
         """Tests --usePool acquires stamp from pool instead of purchasing."""
-        from swarm_provenance_uploader.models import AcquireStampResponse
-
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-
-        mock_client = mocker.MagicMock()
         # Pool availability check
-        mock_client.get_pool_available_count.return_value = 2
+        gateway_mock.get_pool_available_count.return_value = 2
 
         # Pool acquisition
-        mock_client.acquire_stamp_from_pool.return_value = AcquireStampResponse(
+        gateway_mock.acquire_stamp_from_pool.return_value = AcquireStampResponse(
             success=True,
-            batch_id="a" * 64,
+            batch_id=STAMP_A,
             depth=17,
             size_name="small",
             message="Stamp acquired successfully",
@@ -990,119 +767,75 @@ class TestUploadWithPool:
         )
 
         # Stamp usability check (mark as usable immediately)
-        mock_stamp = mocker.MagicMock()
-        mock_stamp.exists = True
-        mock_stamp.usable = True
-        mock_stamp.batchTTL = 86400
-        mock_client.get_stamp.return_value = mock_stamp
+        gateway_mock.get_stamp.return_value = stamp_details.model_copy(
+            update={"batchID": STAMP_A, "batchTTL": 86400}
+        )
 
         # Upload success
-        mock_client.upload_data.return_value = "swarmref" * 8
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_gateway_client_with_x402",
-            return_value=mock_client
-        )
+        gateway_mock.upload_data.return_value = "swarmref" * 8
 
         result = runner.invoke(
             app,
-            ["upload", "--file", str(test_file), "--usePool"]
+            ["upload", "--file", upload_file, "--usePool"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        assert "Acquiring stamp from pool" in result.stdout
-        assert "acquired from pool" in result.stdout.lower()
+        out = result.stdout
+        assert "Acquiring stamp from pool" in out
+        assert "acquired from pool" in out.lower()
         # Should NOT have called purchase_stamp
-        mock_client.purchase_stamp.assert_not_called()
+        gateway_mock.purchase_stamp.assert_not_called()
         # Should have called acquire_stamp_from_pool
-        mock_client.acquire_stamp_from_pool.assert_called_once()
+        gateway_mock.acquire_stamp_from_pool.assert_called_once()
 
-    def test_usepool_shows_fallback_message(self, mocker, tmp_path):
+    def test_usepool_shows_fallback_message(self, upload_file, gateway_mock, stamp_details):
         """Tests --usePool shows fallback message when larger stamp used."""
-        from swarm_provenance_uploader.models import AcquireStampResponse
-
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_pool_available_count.return_value = 1
+        gateway_mock.get_pool_available_count.return_value = 1
 
-        mock_client.acquire_stamp_from_pool.return_value = AcquireStampResponse(
+        gateway_mock.acquire_stamp_from_pool.return_value = AcquireStampResponse(
             success=True,
-            batch_id="a" * 64,
+            batch_id=STAMP_A,
             depth=20,
             size_name="medium",
             message="Larger stamp substituted",
             fallback_used=True,
         )
 
-        mock_stamp = mocker.MagicMock()
-        mock_stamp.usable = True
-        mock_stamp.batchTTL = 86400
-        mock_client.get_stamp.return_value = mock_stamp
-
-        mock_client.upload_data.return_value = "swarmref" * 8
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_gateway_client_with_x402",
-            return_value=mock_client
+        gateway_mock.get_stamp.return_value = stamp_details.model_copy(
+            update={"batchID": STAMP_A, "batchTTL": 86400}
         )
 
+        gateway_mock.upload_data.return_value = "swarmref" * 8
+
         result = runner.invoke(
             app,
-            ["upload", "--file", str(test_file), "--usePool", "--size", "small"]
+            ["upload", "--file", upload_file, "--usePool", "--size", "small"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "fallback" in result.stdout.lower()
 
-    def test_usepool_pool_empty_error(self, mocker, tmp_path):
-        """Tests --usePool fails gracefully when pool is empty."""
-        from swarm_provenance_uploader.exceptions import PoolEmptyError
-
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_pool_available_count.return_value = 0
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_gateway_client_with_x402",
-            return_value=mock_client
-        )
-
-        result = runner.invoke(
-            app,
-            ["upload", "--file", str(test_file), "--usePool"]
-        )
-
-        assert result.exit_code == 1
-        assert "No stamps available" in result.stdout
-        assert "retry later" in result.stdout.lower() or "without --usePool" in result.stdout
-
-    def test_usepool_pool_not_enabled(self, mocker, tmp_path):
-        """Tests --usePool fails when pool not enabled."""
-        from swarm_provenance_uploader.exceptions import PoolNotEnabledError
-
-        test_file = tmp_path / "test.txt"
-        test_file.write_text("test content")
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_pool_available_count.side_effect = PoolNotEnabledError("Pool not enabled")
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_gateway_client_with_x402",
-            return_value=mock_client
-        )
+    @pytest.mark.parametrize("count,expected", [
+        pytest.param({"return_value": 0}, "No stamps available", id="pool-empty"),
+        pytest.param(
+            {"side_effect": PoolNotEnabledError("Pool not enabled")},
+            "not enabled",
+            id="pool-not-enabled",
+        ),
+    ])
+    def test_usepool_pool_unavailable(self, upload_file, gateway_mock, count, expected):
+        """Tests --usePool fails gracefully when the pool cannot supply a stamp."""
+        gateway_mock.get_pool_available_count.configure_mock(**count)
 
         result = runner.invoke(
             app,
-            ["upload", "--file", str(test_file), "--usePool"]
+            ["upload", "--file", upload_file, "--usePool"]
         )
 
         assert result.exit_code == 1
-        assert "not enabled" in result.stdout.lower()
+        assert expected in result.stdout
         assert "without --usePool" in result.stdout
+        gateway_mock.acquire_stamp_from_pool.assert_not_called()
 
 
 # =============================================================================
@@ -1112,100 +845,63 @@ class TestUploadWithPool:
 class TestNotaryInfoCommand:
     """Tests for notary info command."""
 
-    def test_notary_info_enabled(self, mocker):
+    def test_notary_info_enabled(self, gateway_mock):
         """Tests notary info when notary is enabled and available."""
         from swarm_provenance_uploader.models import NotaryInfoResponse
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message="Notary service is operational",
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         result = runner.invoke(app, ["notary", "info"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        assert "Notary Service" in result.stdout
-        assert "Enabled:" in result.stdout and "Yes" in result.stdout
-        assert "Available:" in result.stdout
-        assert "0x1234567890abcdef" in result.stdout
+        _assert_all_in(result.stdout, (
+            "Notary Service", "Enabled:", "Yes", "Available:", "0x1234567890abcdef"
+        ))
 
-    def test_notary_info_disabled(self, mocker):
+    def test_notary_info_disabled(self, gateway_mock):
         """Tests notary info when notary is not enabled."""
         from swarm_provenance_uploader.models import NotaryInfoResponse
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=False,
             available=False,
             address=None,
             message="Notary signing is not enabled on this gateway",
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         result = runner.invoke(app, ["notary", "info"])
 
         assert result.exit_code == 0
         assert "Enabled:" in result.stdout and "No" in result.stdout
 
-    def test_notary_info_requires_gateway(self):
-        """Tests notary info fails with local backend."""
-        result = runner.invoke(app, ["--backend", "local", "notary", "info"])
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
 
 class TestNotaryStatusCommand:
     """Tests for notary status command."""
 
-    def test_notary_status_success(self, mocker):
+    def test_notary_status_success(self, gateway_mock):
         """Tests notary status command."""
         from swarm_provenance_uploader.models import NotaryStatusResponse
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_notary_status.return_value = NotaryStatusResponse(
+        gateway_mock.get_notary_status.return_value = NotaryStatusResponse(
             enabled=True,
             available=True,
             address="0xabcdef1234567890abcdef1234567890abcdef12",
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         result = runner.invoke(app, ["notary", "status"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "Notary" in result.stdout
         assert "Available" in result.stdout or "Enabled" in result.stdout
 
-    def test_notary_status_requires_gateway(self):
-        """Tests notary status fails with local backend."""
-        result = runner.invoke(app, ["--backend", "local", "notary", "status"])
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
 
 class TestNotaryVerifyCommand:
     """Tests for notary verify command."""
 
-    def test_notary_verify_success(self, mocker, tmp_path):
+    def test_notary_verify_success(self, mocker, tmp_path, gateway_mock):
         """Tests notary verify command with valid signature."""
-        import json
         from swarm_provenance_uploader.models import NotaryInfoResponse
 
         # Create a test signed document file
@@ -1225,20 +921,13 @@ class TestNotaryVerifyCommand:
         }
         test_file = tmp_path / "signed.json"
         test_file.write_text(json.dumps(signed_doc))
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         # Mock verify function at the source module level
         mocker.patch(
             "swarm_provenance_uploader.core.notary_utils.verify_notary_signature",
@@ -1248,11 +937,10 @@ class TestNotaryVerifyCommand:
         result = runner.invoke(app, ["notary", "verify", "--file", str(test_file)])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        assert "VERIFIED" in result.stdout or "verified" in result.stdout.lower()
+        assert "verified" in result.stdout.lower()
 
-    def test_notary_verify_invalid_signature(self, mocker, tmp_path):
+    def test_notary_verify_invalid_signature(self, mocker, tmp_path, gateway_mock):
         """Tests notary verify with invalid signature."""
-        import json
         from swarm_provenance_uploader.models import NotaryInfoResponse
 
         signed_doc = {
@@ -1271,20 +959,13 @@ class TestNotaryVerifyCommand:
         }
         test_file = tmp_path / "bad_sig.json"
         test_file.write_text(json.dumps(signed_doc))
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         mocker.patch(
             "swarm_provenance_uploader.core.notary_utils.verify_notary_signature",
             return_value=(False, "Data hash mismatch")
@@ -1293,11 +974,10 @@ class TestNotaryVerifyCommand:
         result = runner.invoke(app, ["notary", "verify", "--file", str(test_file)])
 
         assert result.exit_code == 1
-        assert "FAILED" in result.stdout or "failed" in result.stdout.lower()
+        assert "failed" in result.stdout.lower()
 
     def test_notary_verify_requires_gateway(self, mocker, tmp_path):
         """Tests notary verify fails with local backend when no --address provided."""
-        import json
         signed_doc = {
             "data": {"content": "test"},
             "signatures": [
@@ -1319,7 +999,8 @@ class TestNotaryVerifyCommand:
 
         assert result.exit_code == 1
         # Should fail because no --address and local backend can't fetch
-        assert "address" in result.stdout.lower() or "gateway" in result.stdout.lower()
+        out_lower = result.stdout.lower()
+        assert "address" in out_lower or "gateway" in out_lower
 
     def test_notary_verify_file_not_found(self):
         """Tests notary verify fails with non-existent file."""
@@ -1327,9 +1008,8 @@ class TestNotaryVerifyCommand:
 
         assert result.exit_code != 0
 
-    def test_notary_verify_shows_new_fields_verbose(self, mocker, tmp_path):
+    def test_notary_verify_shows_new_fields_verbose(self, mocker, tmp_path, gateway_mock):
         """Tests notary verify shows hashed_fields and signed_message_format in verbose mode."""
-        import json
         from swarm_provenance_uploader.models import NotaryInfoResponse
 
         signed_doc = {
@@ -1348,20 +1028,13 @@ class TestNotaryVerifyCommand:
         }
         test_file = tmp_path / "signed.json"
         test_file.write_text(json.dumps(signed_doc))
-
-        mock_client = mocker.MagicMock()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         mocker.patch(
             "swarm_provenance_uploader.core.notary_utils.verify_notary_signature",
             return_value=(True, None)
@@ -1377,38 +1050,22 @@ class TestNotaryVerifyCommand:
 class TestUploadWithSign:
     """Tests for upload command with --sign option."""
 
-    def test_upload_with_sign_notary(self, mocker, tmp_path):
+    def test_upload_with_sign_notary(self, upload_file, gateway_mock, stamp_details):
         """Tests upload with --sign notary option."""
         from swarm_provenance_uploader.models import (
             SignedDocumentResponse,
             NotaryInfoResponse,
-            StampDetails,
         )
 
-        test_file = tmp_path / "data.txt"
-        test_file.write_text("test provenance data")
-
-        mock_client = mocker.MagicMock()
-        mock_client.purchase_stamp.return_value = DUMMY_STAMP
-        mock_client.get_stamp.return_value = StampDetails(
-            batchID=DUMMY_STAMP,
-            usable=True,
-            exists=True,
-            depth=17,
-            amount="1000000000",
-            bucketDepth=16,
-            blockNumber=12345,
-            immutableFlag=False,
-            batchTTL=3600,
-            utilization=0,
-        )
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.purchase_stamp.return_value = DUMMY_STAMP
+        gateway_mock.get_stamp.return_value = stamp_details
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
-        mock_client.upload_data_with_signing.return_value = SignedDocumentResponse(
+        gateway_mock.upload_data_with_signing.return_value = SignedDocumentResponse(
             reference=DUMMY_SWARM_REF,
             signed_document={
                 "data": "base64data",
@@ -1427,69 +1084,30 @@ class TestUploadWithSign:
             message="Document signed successfully",
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         result = runner.invoke(
             app,
-            ["upload", "--file", str(test_file), "--sign", "notary"]
+            ["upload", "--file", upload_file, "--sign", "notary"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert DUMMY_SWARM_REF in result.stdout
         assert "signed" in result.stdout.lower() or "Signature" in result.stdout
-        mock_client.upload_data_with_signing.assert_called_once()
+        gateway_mock.upload_data_with_signing.assert_called_once()
         # Should NOT call regular upload_data
-        mock_client.upload_data.assert_not_called()
+        gateway_mock.upload_data.assert_not_called()
 
-    def test_upload_sign_requires_gateway(self, tmp_path):
-        """Tests --sign option fails with local backend."""
-        test_file = tmp_path / "data.txt"
-        test_file.write_text("test data")
-
-        result = runner.invoke(
-            app,
-            ["--backend", "local", "upload", "--file", str(test_file), "--sign", "notary"]
-        )
-
-        assert result.exit_code == 1
-        assert "requires gateway backend" in result.stdout
-
-    def test_upload_sign_notary_not_available(self, mocker, tmp_path):
+    def test_upload_sign_notary_not_available(self, upload_file, gateway_mock, stamp_details):
         """Tests --sign notary fails when notary not available."""
-        from swarm_provenance_uploader.models import StampDetails
         from swarm_provenance_uploader.exceptions import NotaryNotEnabledError
 
-        test_file = tmp_path / "data.txt"
-        test_file.write_text("test data")
-
-        mock_client = mocker.MagicMock()
-        mock_client.purchase_stamp.return_value = DUMMY_STAMP
-        mock_client.get_stamp.return_value = StampDetails(
-            batchID=DUMMY_STAMP,
-            usable=True,
-            exists=True,
-            depth=17,
-            amount="1000000000",
-            bucketDepth=16,
-            blockNumber=12345,
-            immutableFlag=False,
-            batchTTL=3600,
-            utilization=0,
-        )
+        gateway_mock.purchase_stamp.return_value = DUMMY_STAMP
+        gateway_mock.get_stamp.return_value = stamp_details
         # upload_data_with_signing raises NotaryNotEnabledError
-        mock_client.upload_data_with_signing.side_effect = NotaryNotEnabledError("Notary not enabled")
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.upload_data_with_signing.side_effect = NotaryNotEnabledError("Notary not enabled")
 
         result = runner.invoke(
             app,
-            ["upload", "--file", str(test_file), "--sign", "notary"]
+            ["upload", "--file", upload_file, "--sign", "notary"]
         )
 
         assert result.exit_code == 1
@@ -1499,20 +1117,13 @@ class TestUploadWithSign:
 class TestDownloadWithVerify:
     """Tests for download command with default signature verification."""
 
-    def test_download_with_verify_success(self, mocker, tmp_path):
+    def test_download_with_verify_success(self, mocker, tmp_path, gateway_mock):
         """Tests download verifies signature by default."""
-        import json
-        import base64
-        import hashlib
         from swarm_provenance_uploader.models import NotaryInfoResponse
 
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
-
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "encryption": None,
@@ -1528,21 +1139,14 @@ class TestDownloadWithVerify:
                 }
             ],
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         mocker.patch(
             "swarm_provenance_uploader.core.notary_utils.verify_notary_signature",
             return_value=(True, None)
@@ -1555,22 +1159,15 @@ class TestDownloadWithVerify:
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         # Looking for "Verified" in the signature verification output
-        assert "verified" in result.stdout.lower() or "Verified" in result.stdout
+        assert "verified" in result.stdout.lower()
 
-    def test_download_verify_fails_invalid_signature(self, mocker, tmp_path):
+    def test_download_verify_fails_invalid_signature(self, mocker, tmp_path, gateway_mock):
         """Tests download warns on invalid signature but still succeeds."""
-        import json
-        import base64
-        import hashlib
         from swarm_provenance_uploader.models import NotaryInfoResponse
 
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
-
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "signatures": [
@@ -1585,21 +1182,14 @@ class TestDownloadWithVerify:
                 }
             ],
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         mocker.patch(
             "swarm_provenance_uploader.core.notary_utils.verify_notary_signature",
             return_value=(False, "Signature recovery mismatch")
@@ -1613,33 +1203,19 @@ class TestDownloadWithVerify:
         # Download should still succeed (files downloaded) but with a warning about failed signature
         # The exit code is 0 because the download itself succeeded
         assert result.exit_code == 0
-        assert "FAILED" in result.stdout or "failed" in result.stdout.lower()
+        assert "failed" in result.stdout.lower()
 
-    def test_download_verify_no_signature_found(self, mocker, tmp_path):
+    def test_download_verify_no_signature_found(self, tmp_path, gateway_mock):
         """Tests download silently skips verification when no signature present."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
 
         # Metadata without signatures
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
 
         # No need to patch has_notary_signature - the metadata doesn't have signatures
         # so the actual function will correctly return False
@@ -1656,18 +1232,11 @@ class TestDownloadWithVerify:
 
     def test_download_verify_local_backend_warns(self, mocker, tmp_path):
         """Tests default verify with local backend still downloads but can't verify."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
 
         # Metadata with signature
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "signatures": [
@@ -1683,8 +1252,8 @@ class TestDownloadWithVerify:
             ],
         }
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.download_data_from_swarm",
+        mocker.patch.object(
+            swarm_client, "download_data_from_swarm",
             return_value=json.dumps(metadata).encode()
         )
 
@@ -1698,19 +1267,12 @@ class TestDownloadWithVerify:
         # But should warn about not being able to verify
         assert "Cannot verify" in result.stdout or "No notary address" in result.stdout
 
-    def test_download_no_verify_skips_verification(self, mocker, tmp_path):
+    def test_download_no_verify_skips_verification(self, tmp_path, gateway_mock):
         """Tests --no-verify skips signature verification entirely."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
 
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "signatures": [
@@ -1723,14 +1285,7 @@ class TestDownloadWithVerify:
                 }
             ],
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
 
         result = runner.invoke(
             app,
@@ -1742,20 +1297,13 @@ class TestDownloadWithVerify:
         assert "Signature" not in result.stdout
         assert "Verified" not in result.stdout
 
-    def test_download_strict_fails_on_invalid_signature(self, mocker, tmp_path):
+    def test_download_strict_fails_on_invalid_signature(self, mocker, tmp_path, gateway_mock):
         """Tests --strict exits with code 1 when signature verification fails."""
-        import json
-        import base64
-        import hashlib
         from swarm_provenance_uploader.models import NotaryInfoResponse
 
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
-
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "signatures": [
@@ -1768,21 +1316,14 @@ class TestDownloadWithVerify:
                 }
             ],
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         mocker.patch(
             "swarm_provenance_uploader.core.notary_utils.verify_notary_signature",
             return_value=(False, "Signature recovery mismatch")
@@ -1797,20 +1338,13 @@ class TestDownloadWithVerify:
         assert "FAILED" in result.stdout
         assert "strict" in result.stdout.lower() or "Aborting" in result.stdout
 
-    def test_download_strict_succeeds_on_valid_signature(self, mocker, tmp_path):
+    def test_download_strict_succeeds_on_valid_signature(self, mocker, tmp_path, gateway_mock):
         """Tests --strict succeeds when signature is valid."""
-        import json
-        import base64
-        import hashlib
         from swarm_provenance_uploader.models import NotaryInfoResponse
 
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
-
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "signatures": [
@@ -1823,21 +1357,14 @@ class TestDownloadWithVerify:
                 }
             ],
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-        mock_client.get_notary_info.return_value = NotaryInfoResponse(
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
+        gateway_mock.get_notary_info.return_value = NotaryInfoResponse(
             enabled=True,
             available=True,
             address="0x1234567890abcdef1234567890abcdef12345678",
             message=None,
         )
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
-
         mocker.patch(
             "swarm_provenance_uploader.core.notary_utils.verify_notary_signature",
             return_value=(True, None)
@@ -1851,30 +1378,16 @@ class TestDownloadWithVerify:
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "Verified" in result.stdout
 
-    def test_download_verify_flag_backward_compatible(self, mocker, tmp_path):
+    def test_download_verify_flag_backward_compatible(self, tmp_path, gateway_mock):
         """Tests that --verify flag still works (backward compatibility)."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
 
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
 
         result = runner.invoke(
             app,
@@ -1884,30 +1397,16 @@ class TestDownloadWithVerify:
         # Should not crash — --verify is accepted silently
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
 
-    def test_download_strict_no_signatures_succeeds(self, mocker, tmp_path):
+    def test_download_strict_no_signatures_succeeds(self, tmp_path, gateway_mock):
         """Tests --strict with no signatures present still succeeds."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
 
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
 
         result = runner.invoke(
             app,
@@ -1917,19 +1416,12 @@ class TestDownloadWithVerify:
         # No signatures → nothing to fail on → succeeds
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
 
-    def test_download_no_verify_overrides_strict(self, mocker, tmp_path):
+    def test_download_no_verify_overrides_strict(self, tmp_path, gateway_mock):
         """Tests --no-verify takes precedence over --strict."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
 
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "signatures": [
@@ -1942,14 +1434,7 @@ class TestDownloadWithVerify:
                 }
             ],
         }
-
-        mock_client = mocker.MagicMock()
-        mock_client.download_data.return_value = json.dumps(metadata).encode()
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client
-        )
+        gateway_mock.download_data.return_value = json.dumps(metadata).encode()
 
         result = runner.invoke(
             app,
@@ -1962,17 +1447,10 @@ class TestDownloadWithVerify:
 
     def test_download_strict_local_backend_warns_not_fails(self, mocker, tmp_path):
         """Tests --strict on local backend warns but doesn't fail (can't fetch notary address)."""
-        import json
-        import base64
-        import hashlib
-
-        original_data = b"test provenance data"
-        b64_data = base64.b64encode(original_data).decode()
-        content_hash = hashlib.sha256(original_data).hexdigest()
 
         metadata = {
-            "data": b64_data,
-            "content_hash": content_hash,
+            "data": _DOWNLOAD_B64,
+            "content_hash": _DOWNLOAD_HASH,
             "stamp_id": DUMMY_STAMP,
             "provenance_standard": "TEST-V1",
             "signatures": [
@@ -1986,8 +1464,8 @@ class TestDownloadWithVerify:
             ],
         }
 
-        mocker.patch(
-            "swarm_provenance_uploader.cli.swarm_client.download_data_from_swarm",
+        mocker.patch.object(
+            swarm_client, "download_data_from_swarm",
             return_value=json.dumps(metadata).encode()
         )
 
@@ -2028,7 +1506,7 @@ class TestChainAnchorCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF])
 
@@ -2052,12 +1530,11 @@ class TestChainAnchorCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF, "--json"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["tx_hash"] == DUMMY_TX_HASH
         assert output["block_number"] == 12345
@@ -2069,7 +1546,7 @@ class TestChainAnchorCommand:
         mock_client = mocker.MagicMock()
         mock_client.anchor.side_effect = ChainTransactionError("reverted", tx_hash=DUMMY_TX_HASH)
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF])
 
@@ -2092,7 +1569,7 @@ class TestChainAnchorCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF, "--type", "custom-type"])
 
@@ -2116,7 +1593,7 @@ class TestChainAnchorAlreadyRegistered:
             data_type="swarm-provenance",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF])
 
@@ -2128,7 +1605,6 @@ class TestChainAnchorAlreadyRegistered:
     def test_anchor_already_registered_json(self, mocker):
         """Tests that already-registered hash shows JSON output with --json."""
         from swarm_provenance_uploader.exceptions import DataAlreadyRegisteredError
-        import json
 
         mock_client = mocker.MagicMock()
         mock_client.anchor.side_effect = DataAlreadyRegisteredError(
@@ -2139,7 +1615,7 @@ class TestChainAnchorAlreadyRegistered:
             data_type="swarm-provenance",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF, "--json"])
 
@@ -2170,7 +1646,7 @@ class TestChainTransformCommand:
             description="filtered PII",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transform", DUMMY_SWARM_REF, "c" * 64, "--description", "filtered PII"]
@@ -2188,7 +1664,7 @@ class TestChainTransformCommand:
             "Not registered", data_hash=DUMMY_SWARM_REF
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "transform", DUMMY_SWARM_REF, "c" * 64])
 
@@ -2214,7 +1690,7 @@ class TestChainAccessCommand:
             accessor=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "access", DUMMY_SWARM_REF])
 
@@ -2235,12 +1711,11 @@ class TestChainAccessCommand:
             accessor=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "access", DUMMY_SWARM_REF, "--json"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["swarm_hash"] == DUMMY_SWARM_REF
 
@@ -2263,7 +1738,7 @@ class TestChainGetCommand:
             transformations=[],
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF])
 
@@ -2279,7 +1754,7 @@ class TestChainGetCommand:
         mock_client = mocker.MagicMock()
         mock_client.get.side_effect = DataNotRegisteredError("Not registered", data_hash=DUMMY_SWARM_REF)
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF])
 
@@ -2301,12 +1776,11 @@ class TestChainGetCommand:
             transformations=[],
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF, "--json"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["data_hash"] == DUMMY_SWARM_REF
         assert output["status"] == 0  # ACTIVE
@@ -2330,7 +1804,7 @@ class TestChainGetCommand:
             ],
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF])
 
@@ -2347,7 +1821,7 @@ class TestChainVerifyCommand:
         mock_client = mocker.MagicMock()
         mock_client.verify.return_value = True
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "verify", DUMMY_SWARM_REF])
 
@@ -2359,7 +1833,7 @@ class TestChainVerifyCommand:
         mock_client = mocker.MagicMock()
         mock_client.verify.return_value = False
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "verify", DUMMY_SWARM_REF])
 
@@ -2383,7 +1857,7 @@ class TestChainBalanceCommand:
             contract_address="0xD4a724CD7f5C4458cD2d884C2af6f011aC3Af80a",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "balance"])
 
@@ -2405,12 +1879,11 @@ class TestChainBalanceCommand:
             contract_address="0xD4a724CD7f5C4458cD2d884C2af6f011aC3Af80a",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "balance", "--json"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["address"] == DUMMY_ADDRESS
         assert output["balance_eth"] == "1.0"
@@ -2428,7 +1901,7 @@ class TestChainBalanceCommand:
             contract_address="0xD4a724CD7f5C4458cD2d884C2af6f011aC3Af80a",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "balance"])
 
@@ -2448,7 +1921,7 @@ class TestChainBalanceCommand:
             contract_address="0x1234567890abcdef1234567890abcdef12345678",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "balance"])
 
@@ -2461,8 +1934,8 @@ class TestChainDepsNotInstalled:
 
     def test_chain_command_without_deps(self, mocker):
         """Tests chain commands fail gracefully when blockchain deps missing."""
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_chain_client",
+        mocker.patch.object(
+            cli, "_get_chain_client",
             side_effect=typer.Exit(code=1),
         )
 
@@ -2481,8 +1954,8 @@ class TestChainDepsNotInstalled:
             return original_import(name, *args, **kwargs)
 
         # Patch at the _get_chain_client level to simulate ImportError
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_chain_client",
+        mocker.patch.object(
+            cli, "_get_chain_client",
             side_effect=typer.Exit(code=1),
         )
 
@@ -2506,7 +1979,7 @@ class TestChainGlobalFlags:
             contract_address="0x1234",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["--chain", "base", "chain", "balance"])
 
@@ -2532,7 +2005,7 @@ class TestChainGlobalFlags:
             contract_address="0x1234",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["--chain-rpc", "https://custom-rpc.example.com", "chain", "balance"])
 
@@ -2560,8 +2033,8 @@ class TestChainExplorerUrlConfig:
             chain="base-sepolia",
             contract_address="0x1234",
         )
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_chain_client",
+        mocker.patch.object(
+            cli, "_get_chain_client",
             return_value=mock_client,
         )
 
@@ -2584,7 +2057,7 @@ class TestChainConnectionError:
             "Cannot connect", rpc_url="https://rpc.example.com"
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "balance"])
 
@@ -2613,7 +2086,7 @@ class TestChainStatusCommand:
             status=DataStatusEnum.ACTIVE,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF])
 
@@ -2635,7 +2108,7 @@ class TestChainStatusCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF, "--set", "restricted"])
 
@@ -2659,18 +2132,17 @@ class TestChainStatusCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF, "--set", "active", "--json"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["tx_hash"] == DUMMY_TX_HASH
 
     def test_status_invalid_name(self, mocker):
         """Tests chain status --set with invalid status name."""
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mocker.MagicMock())
+        mocker.patch.object(cli, "_get_chain_client", return_value=SimpleNamespace())
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF, "--set", "invalid"])
 
@@ -2684,7 +2156,7 @@ class TestChainStatusCommand:
         mock_client = mocker.MagicMock()
         mock_client.get.side_effect = DataNotRegisteredError("Not found", data_hash=DUMMY_SWARM_REF)
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF])
 
@@ -2715,7 +2187,7 @@ class TestChainTransferCommand:
             owner=new_owner,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transfer", DUMMY_SWARM_REF, "--to", new_owner]
@@ -2743,14 +2215,13 @@ class TestChainTransferCommand:
             owner=new_owner,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transfer", DUMMY_SWARM_REF, "--to", new_owner, "--json"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["owner"] == new_owner
 
@@ -2761,7 +2232,7 @@ class TestChainTransferCommand:
         mock_client = mocker.MagicMock()
         mock_client.transfer_ownership.side_effect = ChainTransactionError("reverted", tx_hash=DUMMY_TX_HASH)
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transfer", DUMMY_SWARM_REF, "--to", DUMMY_ADDRESS]
@@ -2794,7 +2265,7 @@ class TestChainDelegateCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "delegate", delegate_addr, "--authorize"]
@@ -2822,7 +2293,7 @@ class TestChainDelegateCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "delegate", delegate_addr, "--revoke"]
@@ -2836,7 +2307,7 @@ class TestChainDelegateCommand:
 
     def test_delegate_neither_flag_error(self, mocker):
         """Tests chain delegate fails without --authorize or --revoke."""
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mocker.MagicMock())
+        mocker.patch.object(cli, "_get_chain_client", return_value=SimpleNamespace())
 
         result = runner.invoke(app, ["chain", "delegate", DUMMY_ADDRESS])
 
@@ -2867,7 +2338,7 @@ class TestChainAnchorOwner:
             owner=owner_addr,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "anchor", DUMMY_SWARM_REF, "--owner", owner_addr]
@@ -2906,7 +2377,7 @@ class TestChainAnchorStorageRef:
             storage_ref=storage_ref,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, [
             "chain", "anchor", DUMMY_SWARM_REF, "--storage-ref", storage_ref
@@ -2936,7 +2407,7 @@ class TestChainAnchorStorageRef:
             storage_ref=storage_ref,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, [
             "chain", "anchor", DUMMY_SWARM_REF, "--storage-ref", storage_ref, "--json"
@@ -2968,7 +2439,7 @@ class TestChainSetStorageRef:
             storage_ref=storage_ref,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "set-storage-ref", data_hash, storage_ref])
 
@@ -2996,7 +2467,7 @@ class TestChainSetStorageRef:
             storage_ref=storage_ref,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "set-storage-ref", data_hash, storage_ref, "--json"])
 
@@ -3013,7 +2484,7 @@ class TestChainSetStorageRef:
             "Storage ref already set", tx_hash=DUMMY_TX_HASH
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "set-storage-ref", "aa" * 32, "bb" * 32])
 
@@ -3040,7 +2511,7 @@ class TestChainLookup:
             status=DataStatusEnum.ACTIVE,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "lookup", storage_ref])
 
@@ -3058,7 +2529,7 @@ class TestChainLookup:
             "Not found", data_hash=storage_ref
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "lookup", storage_ref])
 
@@ -3081,7 +2552,7 @@ class TestChainLookup:
             status=DataStatusEnum.ACTIVE,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "lookup", storage_ref, "--json"])
 
@@ -3109,7 +2580,7 @@ class TestChainGetStorageRef:
             status=DataStatusEnum.ACTIVE,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF])
 
@@ -3130,7 +2601,7 @@ class TestChainGetStorageRef:
             status=DataStatusEnum.ACTIVE,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF])
 
@@ -3173,7 +2644,7 @@ class TestChainGetFollow:
             ),
         ]
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", hash_a, "--follow"])
 
@@ -3200,7 +2671,7 @@ class TestChainGetFollow:
             ),
         ]
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF, "--follow", "--depth", "2"])
 
@@ -3224,12 +2695,11 @@ class TestChainGetFollow:
             ),
         ]
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF, "--follow", "--json"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert "chain" in output
         assert output["depth"] == 1
@@ -3240,7 +2710,7 @@ class TestChainGetFollow:
         mock_client = mocker.MagicMock()
         mock_client.get_provenance_chain.return_value = []
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF, "--follow"])
 
@@ -3279,7 +2749,7 @@ class TestChainTransformRestrictOriginal:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transform", DUMMY_SWARM_REF, "c" * 64, "--restrict-original"]
@@ -3331,7 +2801,7 @@ class TestChainProtectCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64, "-d", "removed PII"]
@@ -3386,7 +2856,7 @@ class TestChainProtectCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, new_hash, "--anchor-new"]
@@ -3429,14 +2899,13 @@ class TestChainProtectCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64, "--json"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert "transform" in output
         assert "restrict" in output
@@ -3454,7 +2923,7 @@ class TestChainProtectCommand:
             status=DataStatusEnum.RESTRICTED,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64]
@@ -3471,7 +2940,7 @@ class TestChainProtectCommand:
         mock_client = mocker.MagicMock()
         mock_client.get.side_effect = DataNotRegisteredError("Not found", data_hash=DUMMY_SWARM_REF)
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64]
@@ -3506,7 +2975,7 @@ class TestChainProtectCommand:
         )
         mock_client.set_status.side_effect = ChainTransactionError("reverted")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64]
@@ -3542,7 +3011,7 @@ class TestChainProtectCommand:
         )
         mock_client.set_status.side_effect = ChainTransactionError("reverted")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64, "--json"]
@@ -3550,10 +3019,8 @@ class TestChainProtectCommand:
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "WARNING" in result.stdout
-        # Extract JSON from mixed output (CliRunner merges stderr into stdout)
-        import json
-        json_start = result.stdout.index("{")
-        output = json.loads(result.stdout[json_start:])
+        # CliRunner merges stderr into stdout
+        output = _json_output(result.stdout)
         assert output["partial_failure"] is True
         assert output["restrict"] is None
         assert "transform" in output
@@ -3573,7 +3040,7 @@ class TestChainProtectCommand:
         )
         mock_client.anchor.side_effect = ChainTransactionError("already registered")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64, "--anchor-new"]
@@ -3610,7 +3077,7 @@ class TestChainProtectCommand:
         )
         mock_client.transform.side_effect = ChainTransactionError("reverted")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, new_hash, "--anchor-new"]
@@ -3663,14 +3130,13 @@ class TestChainProtectCommand:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, new_hash, "--anchor-new", "--json"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert "anchor" in output
         assert "transform" in output
@@ -3690,7 +3156,7 @@ class TestChainProtectCommand:
             status=DataStatusEnum.DELETED,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "protect", DUMMY_SWARM_REF, "c" * 64]
@@ -3723,7 +3189,7 @@ class TestChainStatusCommandAdditional:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF, "--set", "deleted"])
 
@@ -3746,7 +3212,7 @@ class TestChainStatusCommandAdditional:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF, "--set", "RESTRICTED"])
 
@@ -3766,12 +3232,11 @@ class TestChainStatusCommandAdditional:
             status=DataStatusEnum.RESTRICTED,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF, "--json"])
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["status"] == "RESTRICTED"
         assert output["hash"] == DUMMY_SWARM_REF
@@ -3783,7 +3248,7 @@ class TestChainStatusCommandAdditional:
         mock_client = mocker.MagicMock()
         mock_client.get.side_effect = ChainConnectionError("timeout", rpc_url="http://localhost:8545")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF])
 
@@ -3797,7 +3262,7 @@ class TestChainStatusCommandAdditional:
         mock_client = mocker.MagicMock()
         mock_client.set_status.side_effect = ChainConnectionError("timeout", rpc_url="http://localhost:8545")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "status", DUMMY_SWARM_REF, "--set", "active"])
 
@@ -3819,7 +3284,7 @@ class TestChainTransferCommandAdditional:
         mock_client = mocker.MagicMock()
         mock_client.transfer_ownership.side_effect = ChainConnectionError("timeout")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transfer", DUMMY_SWARM_REF, "--to", DUMMY_ADDRESS]
@@ -3835,7 +3300,7 @@ class TestChainTransferCommandAdditional:
         mock_client = mocker.MagicMock()
         mock_client.transfer_ownership.side_effect = ChainError("not owner")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transfer", DUMMY_SWARM_REF, "--to", DUMMY_ADDRESS]
@@ -3854,7 +3319,7 @@ class TestChainDelegateCommandAdditional:
 
     def test_delegate_both_flags_error(self, mocker):
         """Tests chain delegate fails when both --authorize and --revoke are given."""
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mocker.MagicMock())
+        mocker.patch.object(cli, "_get_chain_client", return_value=SimpleNamespace())
 
         result = runner.invoke(
             app, ["chain", "delegate", DUMMY_ADDRESS, "--authorize", "--revoke"]
@@ -3870,7 +3335,7 @@ class TestChainDelegateCommandAdditional:
         mock_client = mocker.MagicMock()
         mock_client.set_delegate.side_effect = ChainConnectionError("timeout")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "delegate", DUMMY_ADDRESS, "--authorize"]
@@ -3895,14 +3360,13 @@ class TestChainDelegateCommandAdditional:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "delegate", delegate_addr, "--authorize", "--json"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["tx_hash"] == DUMMY_TX_HASH
 
@@ -3927,7 +3391,7 @@ class TestChainGetAdditional:
             status=DataStatusEnum.ACTIVE,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF, "--depth", "3"])
 
@@ -3949,7 +3413,7 @@ class TestChainGetAdditional:
             ),
         ]
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF, "--follow", "--depth", "0"])
 
@@ -3965,7 +3429,7 @@ class TestChainGetAdditional:
         mock_client = mocker.MagicMock()
         mock_client.get_provenance_chain.side_effect = ChainConnectionError("timeout", rpc_url="http://localhost:8545")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "get", DUMMY_SWARM_REF, "--follow"])
 
@@ -4004,14 +3468,13 @@ class TestChainTransformAdditional:
             owner=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transform", DUMMY_SWARM_REF, "c" * 64, "--restrict-original", "--json"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert "transform" in output
         assert "restrict" in output
@@ -4034,7 +3497,7 @@ class TestChainTransformAdditional:
         )
         mock_client.set_status.side_effect = ChainTransactionError("reverted")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transform", DUMMY_SWARM_REF, "c" * 64, "--restrict-original"]
@@ -4061,7 +3524,7 @@ class TestChainTransformAdditional:
         )
         mock_client.set_status.side_effect = ChainTransactionError("reverted")
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "transform", DUMMY_SWARM_REF, "c" * 64, "--restrict-original", "--json"]
@@ -4069,10 +3532,8 @@ class TestChainTransformAdditional:
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert "WARNING" in result.stdout
-        # Extract JSON from mixed output (CliRunner merges stderr into stdout)
-        import json
-        json_start = result.stdout.index("{")
-        output = json.loads(result.stdout[json_start:])
+        # CliRunner merges stderr into stdout
+        output = _json_output(result.stdout)
         assert output["restrict"] is None
         assert output["transform"]["tx_hash"] == DUMMY_TX_HASH
 
@@ -4084,105 +3545,86 @@ class TestChainTransformAdditional:
 class TestUploadCollectionCommand:
     """Tests for upload-collection command."""
 
-    def _mock_gateway_for_collection(self, mocker):
-        """Set up common mocks for collection upload tests."""
+    def _mock_gateway_for_collection(self, mock_client):
+        """Set up common return values for collection upload tests."""
         from swarm_provenance_uploader.models import ManifestUploadResponse
 
-        mock_client = mocker.MagicMock()
         mock_client.purchase_stamp.return_value = DUMMY_STAMP
         mock_client.upload_manifest.return_value = ManifestUploadResponse(
             reference=DUMMY_SWARM_REF,
             file_count=2,
             message="Manifest uploaded",
         )
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_gateway_client_with_x402",
-            return_value=mock_client,
-        )
         return mock_client
 
-    def test_upload_collection_success(self, mocker):
+    def test_upload_collection_success(self, monkeypatch, tmp_path, gateway_mock):
         """Tests full collection upload flow."""
-        mock_client = self._mock_gateway_for_collection(mocker)
-
-        with runner.isolated_filesystem():
-            import os
-            os.makedirs("mydir/sub")
-            with open("mydir/a.txt", "w") as f:
-                f.write("hello")
-            with open("mydir/sub/b.txt", "w") as f:
-                f.write("world")
-
-            result = runner.invoke(
-                app, ["upload-collection", "mydir", "--std", "TEST-V1"]
-            )
-
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert "SUCCESS" in result.stdout
-            assert DUMMY_SWARM_REF in result.stdout
-            assert "a.txt" in result.stdout
-            assert "sub/b.txt" in result.stdout
-            mock_client.purchase_stamp.assert_called_once()
-            mock_client.upload_manifest.assert_called_once()
-
-    def test_upload_collection_json(self, mocker):
+        mock_client = self._mock_gateway_for_collection(gateway_mock)
+
+        monkeypatch.chdir(tmp_path)
+        os.makedirs("mydir/sub")
+        with open("mydir/a.txt", "w") as f:
+            f.write("hello")
+        with open("mydir/sub/b.txt", "w") as f:
+            f.write("world")
+
+        result = runner.invoke(
+            app, ["upload-collection", "mydir", "--std", "TEST-V1"]
+        )
+
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        _assert_all_in(result.stdout, ("SUCCESS", DUMMY_SWARM_REF, "a.txt", "sub/b.txt"))
+        mock_client.purchase_stamp.assert_called_once()
+        mock_client.upload_manifest.assert_called_once()
+
+    def test_upload_collection_json(self, monkeypatch, tmp_path, gateway_mock):
         """Tests JSON output format."""
-        self._mock_gateway_for_collection(mocker)
-
-        with runner.isolated_filesystem():
-            import os
-            os.mkdir("mydir")
-            with open("mydir/data.csv", "w") as f:
-                f.write("a,b\n1,2")
-
-            result = runner.invoke(
-                app, ["upload-collection", "mydir", "--json"]
-            )
-
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            import json
-            # Find the JSON object in the output
-            lines = result.stdout.strip().split("\n")
-            # JSON output starts with '{'
-            json_start = next(i for i, l in enumerate(lines) if l.strip().startswith("{"))
-            json_text = "\n".join(lines[json_start:])
-            output = json.loads(json_text)
-            assert output["swarm_reference"] == DUMMY_SWARM_REF
-            assert output["file_count"] == 1
-            assert len(output["files"]) == 1
-
-    def test_upload_collection_not_a_directory(self):
+        self._mock_gateway_for_collection(gateway_mock)
+
+        monkeypatch.chdir(tmp_path)
+        os.mkdir("mydir")
+        with open("mydir/data.csv", "w") as f:
+            f.write("a,b\n1,2")
+
+        result = runner.invoke(
+            app, ["upload-collection", "mydir", "--json"]
+        )
+
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        output = _json_output(result.stdout)
+        assert output["swarm_reference"] == DUMMY_SWARM_REF
+        assert output["file_count"] == 1
+        assert len(output["files"]) == 1
+
+    def test_upload_collection_not_a_directory(self, monkeypatch, tmp_path):
         """Tests error when path is a file, not a directory."""
-        with runner.isolated_filesystem():
-            with open("notadir.txt", "w") as f:
-                f.write("data")
+        monkeypatch.chdir(tmp_path)
+        with open("notadir.txt", "w") as f:
+            f.write("data")
 
-            result = runner.invoke(
-                app, ["upload-collection", "notadir.txt"]
-            )
+        result = runner.invoke(
+            app, ["upload-collection", "notadir.txt"]
+        )
 
-            assert result.exit_code != 0
-            assert "Not a directory" in result.stdout
+        assert result.exit_code != 0
+        assert "Not a directory" in result.stdout
 
-    def test_upload_collection_empty_directory(self):
+    def test_upload_collection_empty_directory(self, monkeypatch, tmp_path):
         """Tests error on empty directory."""
-        with runner.isolated_filesystem():
-            import os
-            os.mkdir("emptydir")
+        monkeypatch.chdir(tmp_path)
+        os.mkdir("emptydir")
 
-            result = runner.invoke(
-                app, ["upload-collection", "emptydir"]
-            )
+        result = runner.invoke(
+            app, ["upload-collection", "emptydir"]
+        )
 
-            assert result.exit_code != 0
-            assert "empty" in result.stdout.lower()
+        assert result.exit_code != 0
+        assert "empty" in result.stdout.lower()
 
-    def test_upload_collection_with_pool(self, mocker):
+    def test_upload_collection_with_pool(self, monkeypatch, tmp_path, gateway_mock):
         """Tests collection upload using pooled stamp."""
         from swarm_provenance_uploader.models import ManifestUploadResponse, AcquireStampResponse
-
-        mock_client = mocker.MagicMock()
-        mock_client.acquire_stamp_from_pool.return_value = AcquireStampResponse(
+        gateway_mock.acquire_stamp_from_pool.return_value = AcquireStampResponse(
             success=True,
             batch_id=DUMMY_STAMP,
             depth=17,
@@ -4190,47 +3632,41 @@ class TestUploadCollectionCommand:
             message="Acquired",
             fallback_used=False,
         )
-        mock_client.upload_manifest.return_value = ManifestUploadResponse(
+        gateway_mock.upload_manifest.return_value = ManifestUploadResponse(
             reference=DUMMY_SWARM_REF,
             file_count=1,
             message="OK",
         )
-        mocker.patch(
-            "swarm_provenance_uploader.cli._get_gateway_client_with_x402",
-            return_value=mock_client,
-        )
 
-        with runner.isolated_filesystem():
-            import os
-            os.mkdir("mydir")
-            with open("mydir/file.txt", "w") as f:
-                f.write("data")
+        monkeypatch.chdir(tmp_path)
+        os.mkdir("mydir")
+        with open("mydir/file.txt", "w") as f:
+            f.write("data")
 
-            result = runner.invoke(
-                app, ["upload-collection", "mydir", "--usePool"]
-            )
+        result = runner.invoke(
+            app, ["upload-collection", "mydir", "--usePool"]
+        )
 
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert "SUCCESS" in result.stdout
-            mock_client.acquire_stamp_from_pool.assert_called_once()
-            mock_client.upload_manifest.assert_called_once()
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        assert "SUCCESS" in result.stdout
+        gateway_mock.acquire_stamp_from_pool.assert_called_once()
+        gateway_mock.upload_manifest.assert_called_once()
 
-    def test_upload_collection_local_backend(self, mocker):
+    def test_upload_collection_local_backend(self, mocker, monkeypatch, tmp_path):
         """Tests error when using local backend (gateway only)."""
         _backend_config["backend"] = "local"
 
-        with runner.isolated_filesystem():
-            import os
-            os.mkdir("mydir")
-            with open("mydir/file.txt", "w") as f:
-                f.write("data")
+        monkeypatch.chdir(tmp_path)
+        os.mkdir("mydir")
+        with open("mydir/file.txt", "w") as f:
+            f.write("data")
 
-            result = runner.invoke(
-                app, ["upload-collection", "mydir"]
-            )
+        result = runner.invoke(
+            app, ["upload-collection", "mydir"]
+        )
 
-            assert result.exit_code != 0
-            assert "gateway" in result.stdout.lower()
+        assert result.exit_code != 0
+        assert "gateway" in result.stdout.lower()
 
     def test_upload_collection_nonexistent_directory(self):
         """Tests error when directory path does not exist."""
@@ -4241,47 +3677,45 @@ class TestUploadCollectionCommand:
         assert result.exit_code != 0
         assert "Not a directory" in result.stdout
 
-    def test_upload_collection_with_existing_stamp(self, mocker):
+    def test_upload_collection_with_existing_stamp(self, monkeypatch, tmp_path, gateway_mock):
         """Tests collection upload with --stamp-id (skip purchase)."""
-        mock_client = self._mock_gateway_for_collection(mocker)
-
-        with runner.isolated_filesystem():
-            import os
-            os.mkdir("mydir")
-            with open("mydir/file.txt", "w") as f:
-                f.write("data")
-
-            result = runner.invoke(
-                app, ["upload-collection", "mydir", "--stamp-id", DUMMY_STAMP]
-            )
-
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            assert "SUCCESS" in result.stdout
-            # Should NOT have called purchase or pool acquire
-            mock_client.purchase_stamp.assert_not_called()
-            mock_client.acquire_stamp_from_pool.assert_not_called()
-            # Should have called upload_manifest
-            mock_client.upload_manifest.assert_called_once()
-
-    def test_upload_collection_deferred_and_redundancy(self, mocker):
+        mock_client = self._mock_gateway_for_collection(gateway_mock)
+
+        monkeypatch.chdir(tmp_path)
+        os.mkdir("mydir")
+        with open("mydir/file.txt", "w") as f:
+            f.write("data")
+
+        result = runner.invoke(
+            app, ["upload-collection", "mydir", "--stamp-id", DUMMY_STAMP]
+        )
+
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        assert "SUCCESS" in result.stdout
+        # Should NOT have called purchase or pool acquire
+        mock_client.purchase_stamp.assert_not_called()
+        mock_client.acquire_stamp_from_pool.assert_not_called()
+        # Should have called upload_manifest
+        mock_client.upload_manifest.assert_called_once()
+
+    def test_upload_collection_deferred_and_redundancy(self, monkeypatch, tmp_path, gateway_mock):
         """Tests that --deferred and --redundancy flags are passed through."""
-        mock_client = self._mock_gateway_for_collection(mocker)
+        mock_client = self._mock_gateway_for_collection(gateway_mock)
 
-        with runner.isolated_filesystem():
-            import os
-            os.mkdir("mydir")
-            with open("mydir/file.txt", "w") as f:
-                f.write("data")
+        monkeypatch.chdir(tmp_path)
+        os.mkdir("mydir")
+        with open("mydir/file.txt", "w") as f:
+            f.write("data")
 
-            result = runner.invoke(
-                app, ["upload-collection", "mydir", "--deferred", "--redundancy"]
-            )
+        result = runner.invoke(
+            app, ["upload-collection", "mydir", "--deferred", "--redundancy"]
+        )
 
-            assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-            # Verify flags were passed to upload_manifest
-            call_kwargs = mock_client.upload_manifest.call_args
-            assert call_kwargs.kwargs.get("deferred") is True or call_kwargs[1].get("deferred") is True
-            assert call_kwargs.kwargs.get("redundancy") is True or call_kwargs[1].get("redundancy") is True
+        assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
+        # Verify flags were passed to upload_manifest
+        call_kwargs = mock_client.upload_manifest.call_args
+        assert call_kwargs.kwargs.get("deferred") is True or call_kwargs[1].get("deferred") is True
+        assert call_kwargs.kwargs.get("redundancy") is True or call_kwargs[1].get("redundancy") is True
 
 
 class TestChainGasLimitFlag:
@@ -4302,7 +3736,7 @@ class TestChainGasLimitFlag:
             owner=DUMMY_ADDRESS,
         )
 
-        mock_get = mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mock_get = mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF, "--gas", "500000"])
 
@@ -4324,7 +3758,7 @@ class TestChainGasLimitFlag:
             accessor=DUMMY_ADDRESS,
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "access", DUMMY_SWARM_REF, "--gas", "300000"])
 
@@ -4355,7 +3789,7 @@ class TestChainMergeCommand:
             new_data_type="merged",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "merge", source1, source2, new_hash, "--description", "Merged datasets"]
@@ -4374,7 +3808,7 @@ class TestChainMergeCommand:
 
     def test_merge_too_few_args(self, mocker):
         """Tests chain merge fails with fewer than 3 hashes."""
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client")
+        mocker.patch.object(cli, "_get_chain_client")
 
         result = runner.invoke(app, ["chain", "merge", "a" * 64, "b" * 64])
 
@@ -4400,14 +3834,13 @@ class TestChainMergeCommand:
             new_data_type="merged",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "merge", source1, source2, new_hash, "--json"]
         )
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
-        import json
         output = json.loads(result.stdout)
         assert output["tx_hash"] == DUMMY_TX_HASH
         assert len(output["source_hashes"]) == 2
@@ -4421,7 +3854,7 @@ class TestChainMergeCommand:
             "Not registered", data_hash="a" * 64
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "merge", "a" * 64, "b" * 64, "c" * 64])
 
@@ -4437,7 +3870,7 @@ class TestChainMergeCommand:
             "Merge source count 51 exceeds maximum of 50"
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         hashes = ["a" * 64] * 51 + ["b" * 64]
         result = runner.invoke(app, ["chain", "merge"] + hashes)
@@ -4464,7 +3897,7 @@ class TestChainMergeCommand:
             new_data_type="dataset",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "merge", source1, source2, new_hash,
@@ -4495,7 +3928,7 @@ class TestChainMergeCommand:
             new_data_type="merged",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(
             app, ["chain", "merge", "a" * 64, "b" * 64, "c" * 64, "--gas", "400000"]
@@ -4512,17 +3945,11 @@ class TestChainMergeCommand:
 class TestFreeTierFlag:
     """Tests for --free flag."""
 
-    def test_free_flag_sets_backend_config(self, mocker):
+    def test_free_flag_sets_backend_config(self, gateway_mock):
         """Tests that --free flag sets _backend_config['free_tier']."""
-        mock_client = mocker.MagicMock()
-        mock_client.health_check.return_value = True
-
-        mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client,
-        )
+        gateway_mock.health_check.return_value = True
 
-        result = runner.invoke(app, ["--free", "health"])
+        result = runner.invoke(app, ["--free", "health"], catch_exceptions=False)
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert _backend_config["free_tier"] is True
@@ -4531,17 +3958,11 @@ class TestFreeTierFlag:
         """Tests that free_tier defaults to False."""
         assert _backend_config["free_tier"] is False
 
-    def test_free_and_x402_both_set(self, mocker):
+    def test_free_and_x402_both_set(self, gateway_mock):
         """Tests that --free and --x402 can both be set (free header sent, x402 also configured)."""
-        mock_client = mocker.MagicMock()
-        mock_client.health_check.return_value = True
-
-        mock_gw_cls = mocker.patch(
-            "swarm_provenance_uploader.cli.GatewayClient",
-            return_value=mock_client,
-        )
+        gateway_mock.health_check.return_value = True
 
-        result = runner.invoke(app, ["--free", "--x402", "health"])
+        result = runner.invoke(app, ["--free", "--x402", "health"], catch_exceptions=False)
 
         assert result.exit_code == 0, f"CLI Failed: {result.stdout}"
         assert _backend_config["free_tier"] is True
@@ -4569,7 +3990,7 @@ class TestChainInsufficientFunds:
             chain_name="base-sepolia",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF])
 
@@ -4582,7 +4003,6 @@ class TestChainInsufficientFunds:
     def test_anchor_insufficient_funds_json_output(self, mocker):
         """Tests that --json outputs structured JSON error on insufficient funds."""
         from swarm_provenance_uploader.exceptions import InsufficientFundsError
-        import json
 
         mock_client = mocker.MagicMock()
         mock_client.anchor.side_effect = InsufficientFundsError(
@@ -4593,7 +4013,7 @@ class TestChainInsufficientFunds:
             chain_name="base-sepolia",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF, "--json"])
 
@@ -4617,7 +4037,7 @@ class TestChainInsufficientFunds:
             chain_name="base",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "anchor", DUMMY_SWARM_REF])
 
@@ -4637,7 +4057,7 @@ class TestChainInsufficientFunds:
             contract_address="0xD4a724CD7f5C4458cD2d884C2af6f011aC3Af80a",
         )
 
-        mocker.patch("swarm_provenance_uploader.cli._get_chain_client", return_value=mock_client)
+        mocker.patch.object(cli, "_get_chain_client", return_value=mock_client)
 
         result = runner.invoke(app, ["chain", "balance"])
 
@@ -1,19 +1,79 @@
 """Tests for the GatewayClient module."""
 
+import json
+import tarfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
 import pytest
 import requests
 from swarm_provenance_uploader.core.gateway_client import GatewayClient
+from swarm_provenance_uploader.exceptions import (
+    PaymentRequiredError,
+    PoolNotEnabledError,
+    PoolAcquisitionError,
+    StampNotFoundError,
+    NotaryNotEnabledError,
+    NotaryNotConfiguredError,
+    InvalidDocumentFormatError,
+)
 from swarm_provenance_uploader.models import (
     StampDetails,
     StampListResponse,
     WalletResponse,
     ChequebookResponse,
+    X402PaymentRequirements,
 )
 
 
 # Test constants
 DUMMY_STAMP = "a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3a3"
 DUMMY_SWARM_REF = "b5d4ea763a1396676771151158461f73678f1676166acd06a0a18600b85de8a4"
+DUMMY_WALLET = "0x1234567890abcdef1234567890abcdef12345678"
+DUMMY_PRIVATE_KEY = "0x" + "a" * 64
+DUMMY_SIGNATURE = "0x" + "a" * 130
+DUMMY_STAMP_B = "b" * 64
+DUMMY_STAMP_C = "c" * 64
+
+# Per-resource gateway URLs (the IDs above are already lowercase)
+STAMP_URL = f"https://test.gateway.io/api/v1/stamps/{DUMMY_STAMP}"
+DATA_URL = f"https://test.gateway.io/api/v1/data/{DUMMY_SWARM_REF}"
+POOL_STATUS_URL = "https://test.gateway.io/api/v1/pool/status"
+
+# Gateway response bodies shared by several tests (never mutated)
+SAMPLE_STAMP = {
+    "batchID": DUMMY_STAMP,
+    "utilization": 10,
+    "usable": True,
+    "label": None,
+    "depth": 17,
+    "amount": "1000000000",
+    "bucketDepth": 16,
+    "blockNumber": 12345,
+    "immutableFlag": False,
+    "exists": True,
+    "batchTTL": 86400,
+}
+SAMPLE_WALLET = {"walletAddress": DUMMY_WALLET, "bzzBalance": "100.5"}
+
+
+def _recording_callback(answer):
+    """Payment callback that records each (amount, description) it is asked about."""
+    calls = []
+
+    def callback(amount_usd, description):
+        calls.append((amount_usd, description))
+        return answer
+
+    return callback, calls
+
+
+@pytest.fixture
+def client():
+    """Gateway client pointed at the mocked test URL."""
+    return GatewayClient(base_url="https://test.gateway.io")
 
 
 class TestGatewayClientInit:
@@ -34,41 +94,162 @@ class TestGatewayClientInit:
         client = GatewayClient(base_url="https://custom.gateway.io/")
         assert client.base_url == "https://custom.gateway.io"
 
+    def test_base_url_read_only(self, client):
+        """Tests base_url cannot be reassigned after the session is mounted."""
+        with pytest.raises(AttributeError):
+            client.base_url = "https://other.gateway.io"
+
+    def test_url_path_prefix_kept(self, requests_mock):
+        """Tests a gateway mounted under a path prefix keeps the prefix."""
+        requests_mock.get("https://custom.gateway.io/prefix/api/v1/wallet", json=SAMPLE_WALLET)
+
+        client = GatewayClient(base_url="https://custom.gateway.io/prefix/")
+        result = client.get_wallet()
+
+        assert result.walletAddress == DUMMY_WALLET
+
     def test_api_key_stored(self):
         """Tests API key is stored."""
         client = GatewayClient(api_key="test-key")
         assert client.api_key == "test-key"
 
 
+@pytest.fixture
+def scripted_gateway():
+    """Real local HTTP server that plays back scripted replies.
+
+    requests_mock replaces the transport adapter, so retry behaviour has to
+    be observed over a socket. Append status codes, (status, headers) pairs,
+    or "drop" (close the connection without replying) to ``replies``; every
+    request received is recorded in ``hits`` as (method, path, client port).
+    Connections are kept alive, so distinct ports count TCP connections.
+    """
+    replies, hits = [], []
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self):
+            hits.append((self.command, self.path, self.client_address[1]))
+            self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            reply = replies.pop(0)
+            if reply == "drop":
+                self.close_connection = True
+                return
+            status, headers = reply if isinstance(reply, tuple) else (reply, {})
+            body = json.dumps(SAMPLE_WALLET).encode()
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = _reply
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", replies, hits
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class TestGatewayClientSession:
+    """Tests for the pooled HTTP session and its retry policy."""
+
+    def test_context_manager_closes_session(self, mocker):
+        """Tests leaving the with-block closes the HTTP session."""
+        with GatewayClient(base_url="https://test.gateway.io") as client:
+            close = mocker.spy(client._session, "close")
+
+        close.assert_called_once()
+
+    @pytest.mark.parametrize("replies,call,expected_hits", [
+        pytest.param([503, 200], lambda c: c.get_wallet(), 2, id="get-retried-on-503"),
+        pytest.param([503], lambda c: c.purchase_stamp(), 1, id="post-never-retried"),
+        pytest.param(["drop"], lambda c: c.get_wallet(), 1, id="failed-read-not-retried"),
+        pytest.param([503], lambda c: c.health_check(), 1, id="health-check-not-retried"),
+    ])
+    def test_retry_policy(self, scripted_gateway, replies, call, expected_hits):
+        """Tests only idempotent API reads are re-sent, and only on 502/503/504."""
+        base_url, scripted, hits = scripted_gateway
+        scripted.extend(replies)
+
+        with GatewayClient(base_url=base_url) as client:
+            try:
+                call(client)
+            except ConnectionError:
+                pass
+
+        assert len(hits) == expected_hits
+
+    def test_retry_ignores_retry_after(self, scripted_gateway):
+        """Tests a large Retry-After on a 503 does not stall the retries."""
+        base_url, scripted, hits = scripted_gateway
+        scripted.extend([(503, {"Retry-After": "600"})] * 3)
+
+        started = time.monotonic()
+        with GatewayClient(base_url=base_url) as client:
+            with pytest.raises(ConnectionError):
+                client.get_wallet()
+
+        assert len(hits) == 3
+        assert time.monotonic() - started < 5
+
+    def test_health_checks_reuse_connection(self, scripted_gateway):
+        """Tests repeated health checks return their connection to the pool."""
+        base_url, scripted, hits = scripted_gateway
+        scripted.extend([200] * 5)
+
+        with GatewayClient(base_url=base_url) as client:
+            assert all(client.health_check() for _ in range(5))
+
+        assert len(hits) == 5
+        assert len({port for _, _, port in hits}) == 1
+
+    def test_requests_share_session(self, requests_mock, mocker, client):
+        """Tests consecutive calls go through the client's session."""
+        requests_mock.get("https://test.gateway.io/", json={})
+
+        get = mocker.spy(client._session, "get")
+        assert client.health_check() is True
+        assert client.health_check() is True
+
+        assert get.call_count == 2
+
+
 class TestGatewayClientHealth:
     """Tests for health check functionality."""
 
-    def test_health_check_success(self, requests_mock):
+    def test_health_check_success(self, requests_mock, client):
         """Tests successful health check."""
         requests_mock.get("https://test.gateway.io/", json={})
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.health_check()
 
         assert result is True
 
-    def test_health_check_failure(self, requests_mock):
+    def test_health_check_failure(self, requests_mock, client):
         """Tests health check failure."""
         requests_mock.get("https://test.gateway.io/", status_code=500)
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.health_check()
 
         assert result is False
 
-    def test_health_check_connection_error(self, requests_mock):
+    def test_health_check_connection_error(self, requests_mock, client):
         """Tests health check with connection error."""
         requests_mock.get(
             "https://test.gateway.io/",
             exc=requests.exceptions.ConnectionError
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.health_check()
 
         assert result is False
@@ -77,31 +258,13 @@ class TestGatewayClientHealth:
 class TestGatewayClientStamps:
     """Tests for stamp-related functionality."""
 
-    def test_list_stamps_success(self, requests_mock):
+    def test_list_stamps_success(self, requests_mock, client):
         """Tests listing stamps."""
         requests_mock.get(
             "https://test.gateway.io/api/v1/stamps/",
-            json={
-                "stamps": [
-                    {
-                        "batchID": DUMMY_STAMP,
-                        "utilization": 10,
-                        "usable": True,
-                        "label": None,
-                        "depth": 17,
-                        "amount": "1000000000",
-                        "bucketDepth": 16,
-                        "blockNumber": 12345,
-                        "immutableFlag": False,
-                        "exists": True,
-                        "batchTTL": 86400,
-                    }
-                ],
-                "total_count": 1
-            }
+            json={"stamps": [SAMPLE_STAMP], "total_count": 1}
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.list_stamps()
 
         assert isinstance(result, StampListResponse)
@@ -109,121 +272,68 @@ class TestGatewayClientStamps:
         assert result.stamps[0].batchID == DUMMY_STAMP
         assert result.total_count == 1
 
-    def test_list_stamps_empty(self, requests_mock):
+    def test_list_stamps_empty(self, requests_mock, client):
         """Tests listing stamps when none exist."""
         requests_mock.get(
             "https://test.gateway.io/api/v1/stamps/",
             json={"stamps": [], "total_count": 0}
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.list_stamps()
 
         assert len(result.stamps) == 0
         assert result.total_count == 0
 
-    def test_purchase_stamp_success(self, requests_mock):
-        """Tests purchasing a stamp with duration_hours."""
-        requests_mock.post(
+    @pytest.mark.parametrize("kwargs", [
+        pytest.param({"duration_hours": 48}, id="duration"),
+        pytest.param({"size": "medium"}, id="size"),
+        pytest.param({"duration_hours": 24, "label": "test-label"}, id="label"),
+        pytest.param({"amount": 1000000000, "depth": 17}, id="legacy-amount"),
+    ])
+    def test_purchase_stamp(self, requests_mock, client, kwargs):
+        """Tests purchasing a stamp sends exactly the given parameters."""
+        adapter = requests_mock.post(
             "https://test.gateway.io/api/v1/stamps/",
             json={"batchID": DUMMY_STAMP, "message": "Stamp purchased"},
             status_code=201
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-        result = client.purchase_stamp(duration_hours=48)
+        result = client.purchase_stamp(**kwargs)
 
         assert result == DUMMY_STAMP
+        assert adapter.last_request.json() == kwargs
 
-    def test_purchase_stamp_with_size(self, requests_mock):
-        """Tests purchasing a stamp with size preset."""
-        adapter = requests_mock.post(
-            "https://test.gateway.io/api/v1/stamps/",
-            json={"batchID": DUMMY_STAMP},
-            status_code=201
-        )
-
-        client = GatewayClient(base_url="https://test.gateway.io")
-        client.purchase_stamp(size="medium")
-
-        # Verify size was sent in request
-        assert adapter.last_request.json()["size"] == "medium"
-
-    def test_purchase_stamp_with_label(self, requests_mock):
-        """Tests purchasing a stamp with label."""
-        adapter = requests_mock.post(
-            "https://test.gateway.io/api/v1/stamps/",
-            json={"batchID": DUMMY_STAMP},
-            status_code=201
-        )
-
-        client = GatewayClient(base_url="https://test.gateway.io")
-        client.purchase_stamp(duration_hours=24, label="test-label")
-
-        # Verify label was sent in request
-        assert adapter.last_request.json()["label"] == "test-label"
-
-    def test_purchase_stamp_legacy_amount(self, requests_mock):
-        """Tests purchasing a stamp with legacy amount parameter."""
-        adapter = requests_mock.post(
-            "https://test.gateway.io/api/v1/stamps/",
-            json={"batchID": DUMMY_STAMP},
-            status_code=201
-        )
-
-        client = GatewayClient(base_url="https://test.gateway.io")
-        client.purchase_stamp(amount=1000000000, depth=17)
-
-        # Verify legacy params were sent
-        assert adapter.last_request.json()["amount"] == 1000000000
-        assert adapter.last_request.json()["depth"] == 17
-
-    def test_get_stamp_success(self, requests_mock):
+    def test_get_stamp_success(self, requests_mock, client):
         """Tests getting stamp details."""
         requests_mock.get(
-            f"https://test.gateway.io/api/v1/stamps/{DUMMY_STAMP.lower()}",
-            json={
-                "batchID": DUMMY_STAMP,
-                "utilization": 5,
-                "usable": True,
-                "label": "test",
-                "depth": 17,
-                "amount": "1000000000",
-                "bucketDepth": 16,
-                "blockNumber": 12345,
-                "immutableFlag": False,
-                "exists": True,
-                "batchTTL": 3600,
-            }
+            STAMP_URL,
+            json=SAMPLE_STAMP
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.get_stamp(DUMMY_STAMP)
 
         assert isinstance(result, StampDetails)
         assert result.batchID == DUMMY_STAMP
         assert result.usable is True
 
-    def test_get_stamp_not_found(self, requests_mock):
+    def test_get_stamp_not_found(self, requests_mock, client):
         """Tests getting non-existent stamp."""
         requests_mock.get(
-            f"https://test.gateway.io/api/v1/stamps/{DUMMY_STAMP.lower()}",
+            STAMP_URL,
             status_code=404
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.get_stamp(DUMMY_STAMP)
 
         assert result is None
 
-    def test_extend_stamp_success(self, requests_mock):
+    def test_extend_stamp_success(self, requests_mock, client):
         """Tests extending a stamp."""
         requests_mock.patch(
-            f"https://test.gateway.io/api/v1/stamps/{DUMMY_STAMP.lower()}/extend",
+            STAMP_URL + "/extend",
             json={"batchID": DUMMY_STAMP, "message": "Stamp extended"}
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.extend_stamp(DUMMY_STAMP, amount=500000000)
 
         assert result == DUMMY_STAMP
@@ -232,14 +342,13 @@ class TestGatewayClientStamps:
 class TestGatewayClientData:
     """Tests for data upload/download functionality."""
 
-    def test_upload_data_success(self, requests_mock):
+    def test_upload_data_success(self, requests_mock, client):
         """Tests uploading data."""
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/",
             json={"reference": DUMMY_SWARM_REF, "message": "Upload successful"}
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.upload_data(
             data=b"test data",
             stamp_id=DUMMY_STAMP
@@ -247,14 +356,13 @@ class TestGatewayClientData:
 
         assert result == DUMMY_SWARM_REF
 
-    def test_upload_data_with_content_type(self, requests_mock):
+    def test_upload_data_with_content_type(self, requests_mock, client):
         """Tests uploading data with custom content type."""
         adapter = requests_mock.post(
             "https://test.gateway.io/api/v1/data/",
             json={"reference": DUMMY_SWARM_REF}
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         client.upload_data(
             data=b"test data",
             stamp_id=DUMMY_STAMP,
@@ -264,28 +372,25 @@ class TestGatewayClientData:
         # Verify content_type param was sent
         assert "content_type=text" in adapter.last_request.url
 
-    def test_download_data_success(self, requests_mock):
+    def test_download_data_success(self, requests_mock, client):
         """Tests downloading data."""
         test_data = b"downloaded test data"
         requests_mock.get(
-            f"https://test.gateway.io/api/v1/data/{DUMMY_SWARM_REF.lower()}",
+            DATA_URL,
             content=test_data
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.download_data(DUMMY_SWARM_REF)
 
         assert result == test_data
 
-    def test_download_data_not_found(self, requests_mock):
+    def test_download_data_not_found(self, requests_mock, client):
         """Tests downloading non-existent data."""
         requests_mock.get(
-            f"https://test.gateway.io/api/v1/data/{DUMMY_SWARM_REF.lower()}",
+            DATA_URL,
             status_code=404
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(FileNotFoundError):
             client.download_data(DUMMY_SWARM_REF)
 
@@ -293,24 +398,20 @@ class TestGatewayClientData:
 class TestGatewayClientWallet:
     """Tests for wallet/chequebook functionality."""
 
-    def test_get_wallet_success(self, requests_mock):
+    def test_get_wallet_success(self, requests_mock, client):
         """Tests getting wallet info."""
         requests_mock.get(
             "https://test.gateway.io/api/v1/wallet",
-            json={
-                "walletAddress": "0x1234567890abcdef1234567890abcdef12345678",
-                "bzzBalance": "100.5"
-            }
+            json=SAMPLE_WALLET
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.get_wallet()
 
         assert isinstance(result, WalletResponse)
-        assert result.walletAddress == "0x1234567890abcdef1234567890abcdef12345678"
+        assert result.walletAddress == DUMMY_WALLET
         assert result.bzzBalance == "100.5"
 
-    def test_get_chequebook_success(self, requests_mock):
+    def test_get_chequebook_success(self, requests_mock, client):
         """Tests getting chequebook info."""
         requests_mock.get(
             "https://test.gateway.io/api/v1/chequebook",
@@ -321,7 +422,6 @@ class TestGatewayClientWallet:
             }
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.get_chequebook()
 
         assert isinstance(result, ChequebookResponse)
@@ -331,30 +431,59 @@ class TestGatewayClientWallet:
 class TestGatewayClientErrorHandling:
     """Tests for error handling."""
 
-    def test_connection_error_on_list_stamps(self, requests_mock):
+    def test_connection_error_on_list_stamps(self, requests_mock, client):
         """Tests connection error handling."""
         requests_mock.get(
             "https://test.gateway.io/api/v1/stamps/",
             exc=requests.exceptions.ConnectionError
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(ConnectionError):
             client.list_stamps()
 
-    def test_timeout_error(self, requests_mock):
+    def test_timeout_error(self, requests_mock, client):
         """Tests timeout error handling."""
         requests_mock.get(
             "https://test.gateway.io/api/v1/wallet",
             exc=requests.exceptions.Timeout
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(ConnectionError):
             client.get_wallet()
 
+    @pytest.mark.parametrize("method,path,call,message", [
+        pytest.param(
+            "GET", "/api/v1/wallet", lambda client: client.get_wallet(),
+            "Failed to get wallet info", id="get-wallet",
+        ),
+        pytest.param(
+            "GET", f"/api/v1/stamps/{DUMMY_STAMP}", lambda client: client.get_stamp(DUMMY_STAMP),
+            f"Failed to get stamp {DUMMY_STAMP}", id="get-stamp",
+        ),
+        pytest.param(
+            "POST", "/api/v1/stamps/", lambda client: client.purchase_stamp(),
+            "Failed to purchase stamp", id="purchase-stamp",
+        ),
+        pytest.param(
+            "GET", "/api/v1/stamps/", lambda client: client.list_stamps(),
+            "Failed to list stamps", id="list-stamps",
+        ),
+        pytest.param(
+            "GET", "/api/v1/pool/stamps", lambda client: client.list_pool_stamps(),
+            "Failed to list pool stamps", id="list-pool-stamps",
+        ),
+    ])
+    def test_non_json_body_raises_connection_error(
+        self, requests_mock, client, method, path, call, message
+    ):
+        """Tests a 2xx response with a non-JSON body raises ConnectionError."""
+        requests_mock.register_uri(
+            method, f"https://test.gateway.io{path}", text="<html>Bad Gateway</html>"
+        )
+
+        with pytest.raises(ConnectionError, match=f"{message}: Expecting value"):
+            call(client)
+
     def test_api_key_in_headers(self, requests_mock):
         """Tests API key is included in headers."""
         adapter = requests_mock.get(
@@ -390,40 +519,43 @@ class TestGatewayClientX402:
             }
         ],
     }
-
-    def test_402_without_x402_enabled_raises_error(self, requests_mock):
-        """Tests that 402 response raises PaymentRequiredError when x402 disabled."""
-        from swarm_provenance_uploader.exceptions import PaymentRequiredError
-
+    # Parsed form handed back by the mocked X402Client
+    SAMPLE_REQUIREMENTS = X402PaymentRequirements.model_validate(SAMPLE_402_RESPONSE)
+    SAMPLE_OPTION = SAMPLE_REQUIREMENTS.accepts[0]
+
+    def _mock_x402(self):
+        """Returns an x402 client mock that offers SAMPLE_OPTION ($0.05)."""
+        mock_x402 = MagicMock()
+        mock_x402.parse_402_response.return_value = self.SAMPLE_REQUIREMENTS
+        mock_x402.select_payment_option.return_value = self.SAMPLE_OPTION
+        mock_x402.format_amount_usd.return_value = "$0.05"
+        mock_x402.sign_payment.return_value = "ZHVtbXlfcGF5bWVudF9oZWFkZXI="  # base64
+        return mock_x402
+
+    @pytest.mark.parametrize("path,call", [
+        pytest.param(
+            "/api/v1/stamps/",
+            lambda client: client.purchase_stamp(duration_hours=24),
+            id="purchase-stamp",
+        ),
+        pytest.param(
+            "/api/v1/data/",
+            lambda client: client.upload_data(data=b"test", stamp_id=DUMMY_STAMP),
+            id="upload-data",
+        ),
+    ])
+    def test_402_without_x402_enabled_raises_error(self, requests_mock, client, path, call):
+        """Tests that 402 raises PaymentRequiredError with options when x402 disabled."""
         requests_mock.post(
-            "https://test.gateway.io/api/v1/stamps/",
+            f"https://test.gateway.io{path}",
             status_code=402,
             json=self.SAMPLE_402_RESPONSE,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io", x402_enabled=False)
-
         with pytest.raises(PaymentRequiredError) as exc_info:
-            client.purchase_stamp(duration_hours=24)
+            call(client)
 
-        assert "x402" in str(exc_info.value).lower() or "payment required" in str(exc_info.value).lower()
-
-    def test_402_error_includes_payment_options(self, requests_mock):
-        """Tests that PaymentRequiredError includes payment options."""
-        from swarm_provenance_uploader.exceptions import PaymentRequiredError
-
-        requests_mock.post(
-            "https://test.gateway.io/api/v1/stamps/",
-            status_code=402,
-            json=self.SAMPLE_402_RESPONSE,
-        )
-
-        client = GatewayClient(base_url="https://test.gateway.io", x402_enabled=False)
-
-        with pytest.raises(PaymentRequiredError) as exc_info:
-            client.purchase_stamp()
-
-        # Should have payment options in the exception
+        assert "x402" in str(exc_info.value).lower()
         assert exc_info.value.payment_options is not None
 
     def test_x402_init_parameters(self):
@@ -441,52 +573,54 @@ class TestGatewayClientX402:
         assert client._x402_auto_pay is True
         assert client._x402_max_auto_pay_usd == 5.00
 
-    def test_should_auto_pay_within_limit(self):
-        """Tests auto-pay check when within limit."""
+    @pytest.mark.parametrize("auto_pay,limit_usd,amount_usd,expected", [
+        pytest.param(True, 1.00, 0.50, True, id="within-limit"),
+        pytest.param(True, 1.00, 1.00, True, id="at-limit"),
+        pytest.param(True, 1.00, 1.01, False, id="over-limit"),
+        pytest.param(False, 10.00, 0.50, False, id="disabled"),
+    ])
+    def test_should_auto_pay(self, auto_pay, limit_usd, amount_usd, expected):
+        """Tests the auto-pay check against the configured limit."""
         client = GatewayClient(
             base_url="https://test.gateway.io",
             x402_enabled=True,
-            x402_auto_pay=True,
-            x402_max_auto_pay_usd=1.00,
+            x402_auto_pay=auto_pay,
+            x402_max_auto_pay_usd=limit_usd,
+        )
+
+        assert client._should_auto_pay(amount_usd) is expected
+
+    def test_payment_callback_called(self, requests_mock):
+        """Tests that payment callback is called for confirmation."""
+        # Callback declines, so only the 402 is ever served
+        requests_mock.post(
+            "https://test.gateway.io/api/v1/stamps/",
+            status_code=402,
+            json=self.SAMPLE_402_RESPONSE,
         )
 
-        assert client._should_auto_pay(0.50) is True
-        assert client._should_auto_pay(1.00) is True
-        assert client._should_auto_pay(1.01) is False
+        callback, calls = _recording_callback(False)  # User declines
 
-    def test_should_auto_pay_disabled(self):
-        """Tests auto-pay check when disabled."""
         client = GatewayClient(
             base_url="https://test.gateway.io",
             x402_enabled=True,
+            x402_private_key=DUMMY_PRIVATE_KEY,
             x402_auto_pay=False,
-            x402_max_auto_pay_usd=10.00,
-        )
-
-        assert client._should_auto_pay(0.50) is False
-
-    def test_upload_data_402_without_x402(self, requests_mock):
-        """Tests that upload_data handles 402 when x402 disabled."""
-        from swarm_provenance_uploader.exceptions import PaymentRequiredError
-
-        requests_mock.post(
-            "https://test.gateway.io/api/v1/data/",
-            status_code=402,
-            json=self.SAMPLE_402_RESPONSE,
+            x402_payment_callback=callback,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io", x402_enabled=False)
+        client._x402_client = self._mock_x402()  # pre-seeds the lazily built client
 
-        with pytest.raises(PaymentRequiredError):
-            client.upload_data(data=b"test", stamp_id=DUMMY_STAMP)
+        with pytest.raises(PaymentRequiredError) as exc_info:
+            client.purchase_stamp()
 
-    def test_payment_callback_called(self, requests_mock):
-        """Tests that payment callback is called for confirmation."""
-        from unittest.mock import MagicMock, patch
-        from swarm_provenance_uploader.exceptions import PaymentRequiredError
+        # Callback should have been called
+        assert calls == [("$0.05", "Stamp purchase")]
+        assert "declined" in str(exc_info.value).lower()
 
-        # First request returns 402
-        requests_mock.post(
+    def test_payment_callback_accepts(self, requests_mock):
+        """Tests that an accepted payment is signed and the request retried."""
+        adapter = requests_mock.post(
             "https://test.gateway.io/api/v1/stamps/",
             [
                 {"status_code": 402, "json": self.SAMPLE_402_RESPONSE},
@@ -494,48 +628,27 @@ class TestGatewayClientX402:
             ],
         )
 
-        callback = MagicMock(return_value=False)  # User declines
+        callback, calls = _recording_callback(True)  # User accepts
 
         client = GatewayClient(
             base_url="https://test.gateway.io",
             x402_enabled=True,
-            x402_private_key="0x" + "a" * 64,
+            x402_private_key=DUMMY_PRIVATE_KEY,
             x402_auto_pay=False,
             x402_payment_callback=callback,
         )
 
-        # Mock the x402 client
-        with patch.object(client, '_get_x402_client') as mock_get_client:
-            mock_x402 = MagicMock()
-            mock_x402.parse_402_response.return_value = MagicMock(accepts=[MagicMock(
-                scheme="exact",
-                network="base-sepolia",
-                maxAmountRequired="50000",
-                resource="/api/v1/stamps/",
-                description="Stamp purchase",
-                model_dump=lambda: {},
-            )])
-            mock_x402.select_payment_option.return_value = MagicMock(
-                maxAmountRequired="50000",
-                network="base-sepolia",
-                description="Stamp purchase",
-                resource="/api/v1/stamps/",
-                model_dump=lambda: {},
-            )
-            mock_x402.format_amount_usd.return_value = "$0.05"
-            mock_get_client.return_value = mock_x402
-
-            with pytest.raises(PaymentRequiredError) as exc_info:
-                client.purchase_stamp()
-
-            # Callback should have been called
-            callback.assert_called_once()
-            assert "declined" in str(exc_info.value).lower()
+        client._x402_client = self._mock_x402()  # pre-seeds the lazily built client
+
+        result = client.purchase_stamp()
+
+        assert result == DUMMY_STAMP
+        assert calls == [("$0.05", "Stamp purchase")]
+        assert adapter.call_count == 2
+        assert adapter.last_request.headers["X-PAYMENT"] == "ZHVtbXlfcGF5bWVudF9oZWFkZXI="
 
     def test_auto_pay_skips_callback(self, requests_mock):
         """Tests that auto-pay bypasses callback when within limit."""
-        from unittest.mock import MagicMock, patch
-
         # First request returns 402, second succeeds
         requests_mock.post(
             "https://test.gateway.io/api/v1/stamps/",
@@ -545,99 +658,62 @@ class TestGatewayClientX402:
             ],
         )
 
-        callback = MagicMock(return_value=True)
+        callback, calls = _recording_callback(True)
 
         client = GatewayClient(
             base_url="https://test.gateway.io",
             x402_enabled=True,
-            x402_private_key="0x" + "a" * 64,
+            x402_private_key=DUMMY_PRIVATE_KEY,
             x402_auto_pay=True,
             x402_max_auto_pay_usd=1.00,  # $1 limit, payment is $0.05
             x402_payment_callback=callback,
         )
 
-        # Mock the x402 client
-        with patch.object(client, '_get_x402_client') as mock_get_client:
-            mock_x402 = MagicMock()
-            mock_x402.parse_402_response.return_value = MagicMock(accepts=[MagicMock(
-                maxAmountRequired="50000",  # $0.05
-            )])
-            mock_x402.select_payment_option.return_value = MagicMock(
-                maxAmountRequired="50000",
-                network="base-sepolia",
-                description="Stamp purchase",
-            )
-            mock_x402.format_amount_usd.return_value = "$0.05"
-            # Return a valid string for the payment header
-            mock_x402.sign_payment.return_value = "ZHVtbXlfcGF5bWVudF9oZWFkZXI="  # base64 encoded
-            mock_get_client.return_value = mock_x402
-
-            # Should succeed without calling callback (auto-pay within limit)
-            result = client.purchase_stamp()
-
-            # Callback should NOT be called since auto-pay handles it
-            callback.assert_not_called()
-            assert result is not None
+        client._x402_client = self._mock_x402()  # pre-seeds the lazily built client
+
+        # Should succeed without calling callback (auto-pay within limit)
+        result = client.purchase_stamp()
+
+        # Callback should NOT be called since auto-pay handles it
+        assert calls == []
+        assert result is not None
 
     def test_auto_pay_exceeds_limit_calls_callback(self, requests_mock):
         """Tests that auto-pay calls callback when payment exceeds limit."""
-        from unittest.mock import MagicMock, patch
-        from swarm_provenance_uploader.exceptions import PaymentRequiredError
-
         requests_mock.post(
             "https://test.gateway.io/api/v1/stamps/",
-            [
-                {"status_code": 402, "json": self.SAMPLE_402_RESPONSE},
-            ],
+            status_code=402,
+            json=self.SAMPLE_402_RESPONSE,
         )
 
-        callback = MagicMock(return_value=False)  # User declines
+        callback, calls = _recording_callback(False)  # User declines
 
         client = GatewayClient(
             base_url="https://test.gateway.io",
             x402_enabled=True,
-            x402_private_key="0x" + "a" * 64,
+            x402_private_key=DUMMY_PRIVATE_KEY,
             x402_auto_pay=True,
             x402_max_auto_pay_usd=0.01,  # $0.01 limit, payment is $0.05
             x402_payment_callback=callback,
         )
 
-        with patch.object(client, '_get_x402_client') as mock_get_client:
-            mock_x402 = MagicMock()
-            mock_x402.parse_402_response.return_value = MagicMock(accepts=[MagicMock(
-                maxAmountRequired="50000",  # $0.05 exceeds $0.01 limit
-            )])
-            mock_x402.select_payment_option.return_value = MagicMock(
-                maxAmountRequired="50000",
-                network="base-sepolia",
-                description="Stamp purchase",
-            )
-            mock_x402.format_amount_usd.return_value = "$0.05"
-            mock_get_client.return_value = mock_x402
-
-            with pytest.raises(PaymentRequiredError):
-                client.purchase_stamp()
-
-            # Callback SHOULD be called since payment exceeds auto-pay limit
-            callback.assert_called_once()
-
-    def test_x402_disabled_by_default(self):
-        """Tests that x402 is disabled by default."""
-        client = GatewayClient(base_url="https://test.gateway.io")
-        assert client.x402_enabled is False
+        client._x402_client = self._mock_x402()  # pre-seeds the lazily built client
 
-    def test_x402_default_network_is_base_sepolia(self):
-        """Tests default x402 network is base-sepolia."""
-        client = GatewayClient(
-            base_url="https://test.gateway.io",
-            x402_enabled=True,
-        )
+        with pytest.raises(PaymentRequiredError):
+            client.purchase_stamp()
+
+        # Callback SHOULD be called since payment exceeds auto-pay limit
+        assert calls == [("$0.05", "Stamp purchase")]
+
+    def test_x402_defaults(self, client):
+        """Tests x402 is off by default, with base-sepolia and a $1 auto-pay cap."""
+        assert client.x402_enabled is False
         assert client._x402_network == "base-sepolia"
+        assert client._x402_auto_pay is False
+        assert client._x402_max_auto_pay_usd == 1.00
 
-    def test_402_disabled_detail_wrapped(self, requests_mock):
+    def test_402_disabled_detail_wrapped(self, requests_mock, client):
         """Tests that x402-disabled path extracts amounts from detail-wrapped 402."""
-        from swarm_provenance_uploader.exceptions import PaymentRequiredError
-
         wrapped_response = {"detail": self.SAMPLE_402_RESPONSE}
 
         requests_mock.post(
@@ -646,8 +722,6 @@ class TestGatewayClientX402:
             json=wrapped_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io", x402_enabled=False)
-
         with pytest.raises(PaymentRequiredError) as exc_info:
             client.purchase_stamp(duration_hours=24)
 
@@ -656,18 +730,14 @@ class TestGatewayClientX402:
         assert len(exc_info.value.payment_options) == 1
         assert "50000" in str(exc_info.value)
 
-    def test_402_non_json_response(self, requests_mock):
+    def test_402_non_json_response(self, requests_mock, client):
         """Tests handling of 402 with non-JSON response body."""
-        from swarm_provenance_uploader.exceptions import PaymentRequiredError
-
         requests_mock.post(
             "https://test.gateway.io/api/v1/stamps/",
             status_code=402,
             text="Payment Required",
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io", x402_enabled=False)
-
         with pytest.raises(PaymentRequiredError):
             client.purchase_stamp()
 
@@ -680,8 +750,8 @@ class TestGatewayClientPool:
         "reserve_config": {"17": 5, "20": 3, "22": 2},
         "current_levels": {"17": 4, "20": 2, "22": 1},
         "available_stamps": {
-            "17": [DUMMY_STAMP, "b" * 64],
-            "20": ["c" * 64],
+            "17": [DUMMY_STAMP, DUMMY_STAMP_B],
+            "20": [DUMMY_STAMP_C],
             "22": [],
         },
         "total_stamps": 7,
@@ -714,14 +784,13 @@ class TestGatewayClientPool:
         "status": {"ttl": 43200, "depth": 17, "utilization": 25},
     }
 
-    def test_get_pool_status_success(self, requests_mock):
-        """Tests getting pool status."""
-        requests_mock.get(
-            "https://test.gateway.io/api/v1/pool/status",
-            json=self.SAMPLE_POOL_STATUS,
-        )
+    @pytest.fixture
+    def pool_status(self, requests_mock):
+        """Serves SAMPLE_POOL_STATUS from the pool status endpoint."""
+        return requests_mock.get(POOL_STATUS_URL, json=self.SAMPLE_POOL_STATUS)
 
-        client = GatewayClient(base_url="https://test.gateway.io")
+    def test_get_pool_status_success(self, pool_status, client):
+        """Tests getting pool status."""
         status = client.get_pool_status()
 
         assert status.enabled is True
@@ -730,65 +799,37 @@ class TestGatewayClientPool:
         assert len(status.available_stamps["17"]) == 2
         assert status.reserve_config["17"] == 5
 
-    def test_get_pool_status_disabled(self, requests_mock):
+    def test_get_pool_status_disabled(self, requests_mock, client):
         """Tests getting pool status when pool is disabled."""
-        from swarm_provenance_uploader.exceptions import PoolNotEnabledError
-
         requests_mock.get(
-            "https://test.gateway.io/api/v1/pool/status",
+            POOL_STATUS_URL,
             status_code=404,
             json={"error": "Pool not enabled"},
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(PoolNotEnabledError):
             client.get_pool_status()
 
-    def test_get_pool_available_count_by_size(self, requests_mock):
-        """Tests getting available stamp count by size."""
-        requests_mock.get(
-            "https://test.gateway.io/api/v1/pool/status",
-            json=self.SAMPLE_POOL_STATUS,
-        )
-
-        client = GatewayClient(base_url="https://test.gateway.io")
-        count = client.get_pool_available_count(size="small")
-
-        assert count == 2  # From SAMPLE_POOL_STATUS available_stamps["17"]
-
-    def test_get_pool_available_count_by_depth(self, requests_mock):
-        """Tests getting available stamp count by depth."""
-        requests_mock.get(
-            "https://test.gateway.io/api/v1/pool/status",
-            json=self.SAMPLE_POOL_STATUS,
-        )
-
-        client = GatewayClient(base_url="https://test.gateway.io")
-        count = client.get_pool_available_count(depth=20)
-
-        assert count == 1  # From SAMPLE_POOL_STATUS available_stamps["20"]
-
-    def test_get_pool_available_count_default(self, requests_mock):
-        """Tests getting available stamp count with default size."""
-        requests_mock.get(
-            "https://test.gateway.io/api/v1/pool/status",
-            json=self.SAMPLE_POOL_STATUS,
-        )
-
-        client = GatewayClient(base_url="https://test.gateway.io")
-        count = client.get_pool_available_count()
-
-        assert count == 2  # Defaults to small (depth 17)
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            ({"size": "small"}, 2),  # available_stamps["17"]
+            ({"depth": 20}, 1),  # available_stamps["20"]
+            ({}, 2),  # defaults to small (depth 17)
+        ],
+        ids=["by_size", "by_depth", "default"],
+    )
+    def test_get_pool_available_count(self, pool_status, client, kwargs, expected):
+        """Tests getting available stamp count by size, by depth and by default."""
+        assert client.get_pool_available_count(**kwargs) == expected
 
-    def test_acquire_stamp_from_pool_success(self, requests_mock):
+    def test_acquire_stamp_from_pool_success(self, requests_mock, client):
         """Tests acquiring stamp from pool."""
         requests_mock.post(
             "https://test.gateway.io/api/v1/pool/acquire",
             json=self.SAMPLE_ACQUIRE_RESPONSE,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.acquire_stamp_from_pool(size="small")
 
         assert result.success is True
@@ -797,7 +838,7 @@ class TestGatewayClientPool:
         assert result.size_name == "small"
         assert result.fallback_used is False
 
-    def test_acquire_stamp_from_pool_with_fallback(self, requests_mock):
+    def test_acquire_stamp_from_pool_with_fallback(self, requests_mock, client):
         """Tests acquiring stamp from pool with fallback."""
         fallback_response = {
             "success": True,
@@ -812,17 +853,14 @@ class TestGatewayClientPool:
             json=fallback_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.acquire_stamp_from_pool(size="small")
 
         assert result.success is True
         assert result.fallback_used is True
         assert result.size_name == "medium"
 
-    def test_acquire_stamp_acquisition_fails(self, requests_mock):
+    def test_acquire_stamp_acquisition_fails(self, requests_mock, client):
         """Tests handling acquisition failure."""
-        from swarm_provenance_uploader.exceptions import PoolAcquisitionError
-
         # Acquisition fails
         requests_mock.post(
             "https://test.gateway.io/api/v1/pool/acquire",
@@ -834,12 +872,10 @@ class TestGatewayClientPool:
             },
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(PoolAcquisitionError):
             client.acquire_stamp_from_pool(size="small")
 
-    def test_list_pool_stamps(self, requests_mock):
+    def test_list_pool_stamps(self, requests_mock, client):
         """Tests listing stamps in the pool."""
         stamps_response = {
             "stamps": [
@@ -851,7 +887,7 @@ class TestGatewayClientPool:
                     "ttl_at_creation": 86400,
                 },
                 {
-                    "batch_id": "b" * 64,
+                    "batch_id": DUMMY_STAMP_B,
                     "depth": 20,
                     "size_name": "medium",
                     "created_at": "2024-01-15T09:00:00Z",
@@ -865,7 +901,6 @@ class TestGatewayClientPool:
             json=stamps_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         stamps = client.list_pool_stamps()
 
         assert len(stamps) == 2
@@ -873,14 +908,13 @@ class TestGatewayClientPool:
         assert stamps[0].depth == 17
         assert stamps[1].size_name == "medium"
 
-    def test_check_stamp_health_success(self, requests_mock):
+    def test_check_stamp_health_success(self, requests_mock, client):
         """Tests stamp health check."""
         requests_mock.get(
-            f"https://test.gateway.io/api/v1/stamps/{DUMMY_STAMP}/check",
+            STAMP_URL + "/check",
             json=self.SAMPLE_HEALTH_CHECK,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         health = client.check_stamp_health(DUMMY_STAMP)
 
         assert health.stamp_id == DUMMY_STAMP
@@ -889,7 +923,7 @@ class TestGatewayClientPool:
         assert len(health.warnings) == 1
         assert health.warnings[0].code == "LOW_TTL"
 
-    def test_check_stamp_health_not_usable(self, requests_mock):
+    def test_check_stamp_health_not_usable(self, requests_mock, client):
         """Tests stamp health check when stamp is not usable."""
         unhealthy_response = {
             "stamp_id": DUMMY_STAMP,
@@ -905,29 +939,24 @@ class TestGatewayClientPool:
             "status": None,
         }
         requests_mock.get(
-            f"https://test.gateway.io/api/v1/stamps/{DUMMY_STAMP}/check",
+            STAMP_URL + "/check",
             json=unhealthy_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         health = client.check_stamp_health(DUMMY_STAMP)
 
         assert health.can_upload is False
         assert len(health.errors) == 1
         assert health.errors[0].code == "EXPIRED"
 
-    def test_check_stamp_health_not_found(self, requests_mock):
+    def test_check_stamp_health_not_found(self, requests_mock, client):
         """Tests stamp health check when stamp not found."""
-        from swarm_provenance_uploader.exceptions import StampNotFoundError
-
         requests_mock.get(
-            f"https://test.gateway.io/api/v1/stamps/{DUMMY_STAMP}/check",
+            STAMP_URL + "/check",
             status_code=404,
             json={"error": "Stamp not found"},
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(StampNotFoundError):
             client.check_stamp_health(DUMMY_STAMP)
 
@@ -935,7 +964,7 @@ class TestGatewayClientPool:
 class TestGatewayClientNotary:
     """Tests for notary signing functionality."""
 
-    def test_get_notary_info_enabled(self, requests_mock):
+    def test_get_notary_info_enabled(self, requests_mock, client):
         """Tests getting notary info when enabled."""
         notary_response = {
             "enabled": True,
@@ -948,7 +977,6 @@ class TestGatewayClientNotary:
             json=notary_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         info = client.get_notary_info()
 
         assert info.enabled is True
@@ -956,22 +984,18 @@ class TestGatewayClientNotary:
         assert info.address == "0x54e5e8477D2352dFBCab55B0306bA77038074670"
         assert "sign=notary" in info.message
 
-    def test_get_notary_info_disabled(self, requests_mock):
+    def test_get_notary_info_disabled(self, requests_mock, client):
         """Tests getting notary info when disabled (404)."""
-        from swarm_provenance_uploader.exceptions import NotaryNotEnabledError
-
         requests_mock.get(
             "https://test.gateway.io/api/v1/notary/info",
             status_code=404,
             json={"error": "Not found"},
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(NotaryNotEnabledError):
             client.get_notary_info()
 
-    def test_get_notary_info_not_configured(self, requests_mock):
+    def test_get_notary_info_not_configured(self, requests_mock, client):
         """Tests getting notary info when enabled but not configured."""
         notary_response = {
             "enabled": True,
@@ -984,14 +1008,13 @@ class TestGatewayClientNotary:
             json=notary_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         info = client.get_notary_info()
 
         assert info.enabled is True
         assert info.available is False
         assert info.address is None
 
-    def test_get_notary_status(self, requests_mock):
+    def test_get_notary_status(self, requests_mock, client):
         """Tests getting notary status."""
         status_response = {
             "enabled": True,
@@ -1003,13 +1026,12 @@ class TestGatewayClientNotary:
             json=status_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         status = client.get_notary_status()
 
         assert status.enabled is True
         assert status.available is True
 
-    def test_upload_with_signing(self, requests_mock):
+    def test_upload_with_signing(self, requests_mock, client):
         """Tests upload with sign=notary parameter."""
         upload_response = {
             "reference": DUMMY_SWARM_REF,
@@ -1021,7 +1043,7 @@ class TestGatewayClientNotary:
                         "signer": "0x54e5e8477D2352dFBCab55B0306bA77038074670",
                         "timestamp": "2026-01-21T16:30:00+00:00",
                         "data_hash": "abc123",
-                        "signature": "0x" + "a" * 130,
+                        "signature": DUMMY_SIGNATURE,
                         "hashed_fields": ["data"],
                         "signed_message_format": "{data_hash}|{timestamp}",
                     }
@@ -1034,7 +1056,6 @@ class TestGatewayClientNotary:
             json=upload_response,
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.upload_data_with_signing(b'{"data": "test"}', DUMMY_STAMP)
 
         assert result.reference == DUMMY_SWARM_REF
@@ -1042,48 +1063,36 @@ class TestGatewayClientNotary:
         assert len(result.signed_document["signatures"]) == 1
         assert result.signed_document["signatures"][0]["type"] == "notary"
 
-    def test_upload_with_signing_notary_not_enabled(self, requests_mock):
+    def test_upload_with_signing_notary_not_enabled(self, requests_mock, client):
         """Tests upload when notary not enabled."""
-        from swarm_provenance_uploader.exceptions import NotaryNotEnabledError
-
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/",
             status_code=400,
             json={"code": "NOTARY_NOT_ENABLED", "detail": "Notary signing is not enabled"},
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(NotaryNotEnabledError):
             client.upload_data_with_signing(b'{"data": "test"}', DUMMY_STAMP)
 
-    def test_upload_with_signing_notary_not_configured(self, requests_mock):
+    def test_upload_with_signing_notary_not_configured(self, requests_mock, client):
         """Tests upload when notary not configured."""
-        from swarm_provenance_uploader.exceptions import NotaryNotConfiguredError
-
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/",
             status_code=400,
             json={"code": "NOTARY_NOT_CONFIGURED", "detail": "Missing private key"},
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(NotaryNotConfiguredError):
             client.upload_data_with_signing(b'{"data": "test"}', DUMMY_STAMP)
 
-    def test_upload_with_signing_invalid_document(self, requests_mock):
+    def test_upload_with_signing_invalid_document(self, requests_mock, client):
         """Tests upload with invalid document format."""
-        from swarm_provenance_uploader.exceptions import InvalidDocumentFormatError
-
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/",
             status_code=400,
             json={"code": "INVALID_DOCUMENT_FORMAT", "detail": "Missing 'data' field"},
         )
 
-        client = GatewayClient(base_url="https://test.gateway.io")
-
         with pytest.raises(InvalidDocumentFormatError):
             client.upload_data_with_signing(b'{"invalid": "document"}', DUMMY_STAMP)
 
@@ -1091,7 +1100,7 @@ class TestGatewayClientNotary:
 class TestGatewayClientManifest:
     """Tests for manifest/collection upload."""
 
-    def test_upload_manifest_success(self, requests_mock, tmp_path):
+    def test_upload_manifest_success(self, requests_mock, tmp_path, client):
         """Tests successful manifest upload."""
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/manifest",
@@ -1103,21 +1112,19 @@ class TestGatewayClientManifest:
         )
 
         # Create a small tar file
-        import tarfile
         tar_path = tmp_path / "test.tar"
         file1 = tmp_path / "file1.txt"
         file1.write_text("hello")
         with tarfile.open(tar_path, "w") as tar:
             tar.add(str(file1), arcname="file1.txt")
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.upload_manifest(str(tar_path), DUMMY_STAMP)
 
         assert result.reference == DUMMY_SWARM_REF
         assert result.file_count == 3
         assert result.message == "Manifest uploaded successfully"
 
-    def test_upload_manifest_with_timing(self, requests_mock, tmp_path):
+    def test_upload_manifest_with_timing(self, requests_mock, tmp_path, client):
         """Tests manifest upload with timing info."""
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/manifest",
@@ -1132,14 +1139,12 @@ class TestGatewayClientManifest:
             },
         )
 
-        import tarfile
         tar_path = tmp_path / "test.tar"
         file1 = tmp_path / "f.txt"
         file1.write_text("data")
         with tarfile.open(tar_path, "w") as tar:
             tar.add(str(file1), arcname="f.txt")
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         result = client.upload_manifest(str(tar_path), DUMMY_STAMP, include_timing=True)
 
         assert result.reference == DUMMY_SWARM_REF
@@ -1147,7 +1152,7 @@ class TestGatewayClientManifest:
         assert result.timing.total_ms == 1250
         assert result.timing.upload_ms == 1200
 
-    def test_upload_manifest_invalid_stamp(self, requests_mock, tmp_path):
+    def test_upload_manifest_invalid_stamp(self, requests_mock, tmp_path, client):
         """Tests manifest upload with invalid stamp returns error."""
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/manifest",
@@ -1155,18 +1160,16 @@ class TestGatewayClientManifest:
             json={"detail": "Invalid stamp"},
         )
 
-        import tarfile
         tar_path = tmp_path / "test.tar"
         file1 = tmp_path / "f.txt"
         file1.write_text("data")
         with tarfile.open(tar_path, "w") as tar:
             tar.add(str(file1), arcname="f.txt")
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         with pytest.raises(Exception):
             client.upload_manifest(str(tar_path), "bad_stamp")
 
-    def test_upload_manifest_server_error(self, requests_mock, tmp_path):
+    def test_upload_manifest_server_error(self, requests_mock, tmp_path, client):
         """Tests manifest upload handles 500 error."""
         requests_mock.post(
             "https://test.gateway.io/api/v1/data/manifest",
@@ -1174,72 +1177,64 @@ class TestGatewayClientManifest:
             json={"detail": "Internal server error"},
         )
 
-        import tarfile
         tar_path = tmp_path / "test.tar"
         file1 = tmp_path / "f.txt"
         file1.write_text("data")
         with tarfile.open(tar_path, "w") as tar:
             tar.add(str(file1), arcname="f.txt")
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         with pytest.raises(Exception):
             client.upload_manifest(str(tar_path), DUMMY_STAMP)
 
-    def test_upload_manifest_deferred_param(self, requests_mock, tmp_path):
+    def test_upload_manifest_deferred_param(self, requests_mock, tmp_path, client):
         """Tests that deferred=True is sent as query parameter."""
         mock = requests_mock.post(
             "https://test.gateway.io/api/v1/data/manifest",
             json={"reference": DUMMY_SWARM_REF},
         )
 
-        import tarfile
         tar_path = tmp_path / "test.tar"
         file1 = tmp_path / "f.txt"
         file1.write_text("data")
         with tarfile.open(tar_path, "w") as tar:
             tar.add(str(file1), arcname="f.txt")
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         client.upload_manifest(str(tar_path), DUMMY_STAMP, deferred=True)
 
         assert mock.called
         assert "deferred=true" in mock.last_request.url.lower()
 
-    def test_upload_manifest_redundancy_param(self, requests_mock, tmp_path):
+    def test_upload_manifest_redundancy_param(self, requests_mock, tmp_path, client):
         """Tests that redundancy=True is sent as query parameter."""
         mock = requests_mock.post(
             "https://test.gateway.io/api/v1/data/manifest",
             json={"reference": DUMMY_SWARM_REF},
         )
 
-        import tarfile
         tar_path = tmp_path / "test.tar"
         file1 = tmp_path / "f.txt"
         file1.write_text("data")
         with tarfile.open(tar_path, "w") as tar:
             tar.add(str(file1), arcname="f.txt")
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         client.upload_manifest(str(tar_path), DUMMY_STAMP, redundancy=True)
 
         assert mock.called
         assert "redundancy=true" in mock.last_request.url.lower()
 
-    def test_upload_manifest_deferred_and_redundancy(self, requests_mock, tmp_path):
+    def test_upload_manifest_deferred_and_redundancy(self, requests_mock, tmp_path, client):
         """Tests both deferred and redundancy params sent together."""
         mock = requests_mock.post(
             "https://test.gateway.io/api/v1/data/manifest",
             json={"reference": DUMMY_SWARM_REF},
         )
 
-        import tarfile
         tar_path = tmp_path / "test.tar"
         file1 = tmp_path / "f.txt"
         file1.write_text("data")
         with tarfile.open(tar_path, "w") as tar:
             tar.add(str(file1), arcname="f.txt")
 
-        client = GatewayClient(base_url="https://test.gateway.io")
         client.upload_manifest(
             str(tar_path), DUMMY_STAMP, deferred=True, redundancy=True
         )
@@ -1261,9 +1256,8 @@ class TestGatewayClientFreeTier:
         client2 = GatewayClient(base_url="https://test.gateway.io", free_tier=False)
         assert client2.free_tier is False
 
-    def test_free_tier_disabled_by_default(self):
+    def test_free_tier_disabled_by_default(self, client):
         """Tests that free_tier is disabled by default."""
-        client = GatewayClient(base_url="https://test.gateway.io")
         assert client.free_tier is False
 
     def test_free_tier_header_in_get_headers(self):
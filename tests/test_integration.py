@@ -14,6 +14,7 @@ For blockchain tests:
 - blockchain dependencies installed (pip install -e .[blockchain])
 
 Run with: pytest tests/test_integration.py -v
+Parallel: pytest tests/test_integration.py -n auto --dist loadgroup
 Skip with: pytest --ignore=tests/test_integration.py
 
 Tests are marked with:
@@ -22,53 +23,109 @@ Tests are marked with:
 - @pytest.mark.gateway - requires gateway service
 - @pytest.mark.x402 - requires x402 wallet configuration
 - @pytest.mark.blockchain - requires blockchain deps and network access
+
+Classes that send transactions from the same wallet share an xdist_group, so
+under --dist loadgroup they run on one worker and never race on nonces.
 """
 
+import functools
+import importlib.util
 import os
 import secrets
+import time
 
 import pytest
 import requests
 
-from swarm_provenance_uploader.core.gateway_client import GatewayClient
 from swarm_provenance_uploader.core import swarm_client
+from swarm_provenance_uploader.core.gateway_client import GatewayClient
+from swarm_provenance_uploader.core.chain_client import ChainClient
+from swarm_provenance_uploader.core.file_utils import create_tar_from_directory
+from swarm_provenance_uploader.chain.provider import ChainProvider
+from swarm_provenance_uploader.chain.exceptions import (
+    TransformationAlreadyExistsError,
+    DataNotRegisteredError,
+)
+from swarm_provenance_uploader.exceptions import (
+    PaymentTransactionFailedError,
+    ChainTransactionError,
+    DataAlreadyRegisteredError,
+)
+from swarm_provenance_uploader.models import (
+    X402PaymentOption,
+    DataStatusEnum,
+)
+
+# core.x402_client is imported inside the x402 tests, not here: a module-level
+# import would pin it in sys.modules, and its lazily cached web3/eth_account
+# globals would then leak across the mocked tests in test_x402_client.py.
+
+
+# Uses INTEGRATION_GATEWAY_URL if set, otherwise defaults to production.
+# This is intentionally separate from PROVENANCE_GATEWAY_URL (used by the
+# app and often overridden in .env.local for local development).
+INTEGRATION_GATEWAY_URL = os.getenv(
+    "INTEGRATION_GATEWAY_URL", "https://provenance-gateway.datafund.io"
+)
 
 
 # =============================================================================
 # FIXTURES
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def local_bee_url():
     """Local Bee node URL."""
     return "http://localhost:1633"
 
 
-@pytest.fixture
-def gateway_url():
-    """Gateway URL for integration tests.
+@pytest.fixture(scope="session")
+def bee_http():
+    """Keep-alive HTTP session for raw local Bee requests, closed at the end."""
+    with requests.Session() as session:
+        yield session
 
-    Uses INTEGRATION_GATEWAY_URL if set, otherwise defaults to production.
-    This is intentionally separate from PROVENANCE_GATEWAY_URL (used by the
-    app and often overridden in .env.local for local development).
-    """
-    return os.getenv("INTEGRATION_GATEWAY_URL", "https://provenance-gateway.datafund.io")
+
+@pytest.fixture(scope="session")
+def gateway_url():
+    """Gateway URL for integration tests (see INTEGRATION_GATEWAY_URL)."""
+    return INTEGRATION_GATEWAY_URL
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gateway_client(gateway_url):
-    """GatewayClient instance."""
-    return GatewayClient(base_url=gateway_url)
+    """GatewayClient shared by the session, so its pooled connection is reused."""
+    with GatewayClient(base_url=gateway_url) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def x402_client():
+    """Base Sepolia X402Client shared by the read-only x402 tests.
+
+    Only request this from tests marked skip_if_no_x402; tests that assert on
+    per-instance state (e.g. lazy domain validation) build their own client.
+    """
+    from swarm_provenance_uploader.core.x402_client import X402Client
+
+    return X402Client(network="base-sepolia")
 
 
 # =============================================================================
 # SKIP CONDITIONS
 # =============================================================================
 
+# Probes run once, at import time, and their results are kept in constants
+# for the skip marks. An unreachable host gives up after the short connect
+# timeout instead of the full read timeout.
+# GET rather than HEAD: the gateway answers HEAD / with 405.
+_PROBE_TIMEOUT = (2, 5)
+
+
 def is_local_bee_available():
     """Check if local Bee node is reachable."""
     try:
-        resp = requests.get("http://localhost:1633/", timeout=5)
+        resp = requests.get("http://localhost:1633/", timeout=_PROBE_TIMEOUT)
         return resp.status_code == 200
     except requests.RequestException:
         return False
@@ -77,20 +134,23 @@ def is_local_bee_available():
 def is_gateway_available():
     """Check if gateway is reachable."""
     try:
-        resp = requests.get("https://provenance-gateway.datafund.io/", timeout=5)
+        resp = requests.get(f"{INTEGRATION_GATEWAY_URL.rstrip('/')}/", timeout=_PROBE_TIMEOUT)
         return resp.status_code == 200
     except requests.RequestException:
         return False
 
 
+LOCAL_BEE_AVAILABLE = is_local_bee_available()
+GATEWAY_AVAILABLE = is_gateway_available()
+
 skip_if_no_local_bee = pytest.mark.skipif(
-    not is_local_bee_available(),
+    not LOCAL_BEE_AVAILABLE,
     reason="Local Bee node not available at localhost:1633"
 )
 
 skip_if_no_gateway = pytest.mark.skipif(
-    not is_gateway_available(),
-    reason="Gateway not available at provenance-gateway.datafund.io"
+    not GATEWAY_AVAILABLE,
+    reason=f"Gateway not available at {INTEGRATION_GATEWAY_URL}"
 )
 
 
@@ -100,14 +160,10 @@ def is_x402_configured():
     return private_key is not None and private_key.startswith("0x")
 
 
+@functools.lru_cache(maxsize=None)
 def are_x402_deps_installed():
-    """Check if x402 dependencies are installed."""
-    try:
-        import eth_account
-        import web3
-        return True
-    except ImportError:
-        return False
+    """Check if x402 dependencies are installed (without importing them)."""
+    return all(importlib.util.find_spec(name) is not None for name in ("eth_account", "web3"))
 
 
 skip_if_no_x402 = pytest.mark.skipif(
@@ -126,23 +182,23 @@ class TestLocalBeeIntegration:
     """Integration tests against real local Bee node."""
 
     @skip_if_no_local_bee
-    def test_health_check(self, local_bee_url):
+    def test_health_check(self, bee_http, local_bee_url):
         """Test local Bee health check."""
-        resp = requests.get(f"{local_bee_url}/", timeout=5)
+        resp = bee_http.get(f"{local_bee_url}/", timeout=5)
         assert resp.status_code == 200
 
     @skip_if_no_local_bee
-    def test_get_stamps(self, local_bee_url):
+    def test_get_stamps(self, bee_http, local_bee_url):
         """Test listing stamps from local Bee."""
-        resp = requests.get(f"{local_bee_url}/stamps", timeout=10)
+        resp = bee_http.get(f"{local_bee_url}/stamps", timeout=10)
         assert resp.status_code == 200
         data = resp.json()
         assert "stamps" in data
 
     @skip_if_no_local_bee
-    def test_get_wallet(self, local_bee_url):
+    def test_get_wallet(self, bee_http, local_bee_url):
         """Test getting wallet info from local Bee."""
-        resp = requests.get(f"{local_bee_url}/wallet", timeout=10)
+        resp = bee_http.get(f"{local_bee_url}/wallet", timeout=10)
         # Wallet endpoint may not exist on all Bee versions
         assert resp.status_code in [200, 404]
 
@@ -204,10 +260,10 @@ class TestCrossBackendComparison:
 
     @skip_if_no_local_bee
     @skip_if_no_gateway
-    def test_both_backends_healthy(self, local_bee_url, gateway_client):
+    def test_both_backends_healthy(self, bee_http, local_bee_url, gateway_client):
         """Verify both backends are reachable."""
         # Local Bee
-        local_resp = requests.get(f"{local_bee_url}/", timeout=5)
+        local_resp = bee_http.get(f"{local_bee_url}/", timeout=5)
         assert local_resp.status_code == 200
 
         # Gateway
@@ -231,37 +287,28 @@ class TestX402Integration:
     """
 
     @skip_if_no_x402
-    def test_x402_client_initialization(self):
+    def test_x402_client_initialization(self, x402_client):
         """Test X402Client initializes with configured wallet."""
-        from swarm_provenance_uploader.core.x402_client import X402Client
-
-        client = X402Client(network="base-sepolia")
-        assert client is not None
-        assert client.network == "base-sepolia"
+        assert x402_client is not None
+        assert x402_client.network == "base-sepolia"
 
     @skip_if_no_x402
-    def test_x402_wallet_address(self):
+    def test_x402_wallet_address(self, x402_client):
         """Test X402Client derives correct wallet address."""
-        from swarm_provenance_uploader.core.x402_client import X402Client
-
-        client = X402Client(network="base-sepolia")
-        address = client.wallet_address
+        address = x402_client.wallet_address
         assert address is not None
         assert address.startswith("0x")
         assert len(address) == 42
 
     @skip_if_no_x402
-    def test_x402_balance_check(self):
+    def test_x402_balance_check(self, x402_client):
         """Test checking USDC balance on Base Sepolia.
 
         Note: This hits the real blockchain. Balance may be 0 if wallet
         hasn't received testnet USDC from faucet.
         """
-        from swarm_provenance_uploader.core.x402_client import X402Client
-
-        client = X402Client(network="base-sepolia")
         try:
-            raw_balance, usdc_balance = client.get_usdc_balance()
+            raw_balance, usdc_balance = x402_client.get_usdc_balance()
             # Raw balance is int (smallest units), usdc_balance is float
             assert isinstance(raw_balance, int)
             assert isinstance(usdc_balance, float)
@@ -279,7 +326,6 @@ class TestX402Integration:
         If this test fails, payment signatures will be invalid on-chain.
         """
         from swarm_provenance_uploader.core.x402_client import (
-            X402Client,
             USDC_PERMIT_DOMAIN,
             USDC_CONTRACTS,
             compute_domain_separator,
@@ -367,7 +413,6 @@ class TestX402Integration:
         domains that would fail on-chain.
         """
         from swarm_provenance_uploader.core.x402_client import X402Client
-        from swarm_provenance_uploader.models import X402PaymentOption
 
         client = X402Client(network="base-sepolia")
 
@@ -393,23 +438,17 @@ class TestX402Integration:
             pytest.fail(f"Domain validation or signing failed: {e}")
 
     @skip_if_no_x402
-    def test_x402_format_amount(self):
+    def test_x402_format_amount(self, x402_client):
         """Test formatting USDC amounts."""
-        from swarm_provenance_uploader.core.x402_client import X402Client
-
-        client = X402Client(network="base-sepolia")
-
         # 1 USDC = 1_000_000 (6 decimals)
-        assert client.format_amount_usd("1000000") == "$1.00"
-        assert client.format_amount_usd("500000") == "$0.50"
-        assert client.format_amount_usd("10000000") == "$10.00"
+        assert x402_client.format_amount_usd("1000000") == "$1.00"
+        assert x402_client.format_amount_usd("500000") == "$0.50"
+        assert x402_client.format_amount_usd("10000000") == "$10.00"
 
     @skip_if_no_x402
     @skip_if_no_gateway
     def test_gateway_client_with_x402_disabled(self, gateway_url):
         """Test GatewayClient works normally when x402 is disabled."""
-        from swarm_provenance_uploader.core.gateway_client import GatewayClient
-
         client = GatewayClient(
             base_url=gateway_url,
             x402_enabled=False
@@ -423,8 +462,6 @@ class TestX402Integration:
     @skip_if_no_gateway
     def test_gateway_client_with_x402_enabled(self, gateway_url):
         """Test GatewayClient initializes with x402 enabled."""
-        from swarm_provenance_uploader.core.gateway_client import GatewayClient
-
         private_key = os.getenv("X402_PRIVATE_KEY")
 
         client = GatewayClient(
@@ -452,6 +489,7 @@ class TestX402Integration:
 @pytest.mark.integration
 @pytest.mark.x402
 @pytest.mark.slow
+@pytest.mark.xdist_group("x402_wallet")
 class TestX402PaymentFlow:
     """Tests that actually make x402 payments.
 
@@ -477,9 +515,7 @@ class TestX402PaymentFlow:
         If x-payment-response shows success=false, PaymentTransactionFailedError is raised.
         This prevents silent fallback to free tier.
         """
-        from swarm_provenance_uploader.core.gateway_client import GatewayClient
         from swarm_provenance_uploader.core.x402_client import X402Client
-        from swarm_provenance_uploader.exceptions import PaymentTransactionFailedError
 
         private_key = os.getenv("X402_PRIVATE_KEY")
 
@@ -571,14 +607,10 @@ class TestX402PaymentFlow:
 # BLOCKCHAIN SKIP CONDITIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=None)
 def are_blockchain_deps_installed():
-    """Check if blockchain dependencies are installed."""
-    try:
-        import eth_account  # noqa: F401
-        import web3  # noqa: F401
-        return True
-    except ImportError:
-        return False
+    """Check if blockchain dependencies are installed (without importing them)."""
+    return all(importlib.util.find_spec(name) is not None for name in ("eth_account", "web3"))
 
 
 def is_hardhat_available():
@@ -628,6 +660,7 @@ def _random_hash():
 
 @pytest.mark.integration
 @pytest.mark.blockchain
+@pytest.mark.xdist_group("provenance_wallet")
 class TestBlockchainLocalHardhat:
     """Integration tests against a local Hardhat node.
 
@@ -645,8 +678,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_provider_health(self):
         """Test ChainProvider connects to local Hardhat."""
-        from swarm_provenance_uploader.chain.provider import ChainProvider
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -663,8 +694,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_anchor(self):
         """Test anchoring a hash on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -691,8 +720,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_anchor_and_verify(self):
         """Test anchoring then verifying on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -718,8 +745,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_record_access(self):
         """Test recording data access on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -743,8 +768,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_transform(self):
         """Test recording transformation on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -773,8 +796,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_balance(self):
         """Test getting wallet balance on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -794,9 +815,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_set_status(self):
         """Test setting data status on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.models import DataStatusEnum
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -823,8 +841,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_transfer_ownership(self):
         """Test transferring data ownership on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -854,8 +870,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_client_delegate(self):
         """Test delegate authorization on local Hardhat."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -876,8 +890,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_provenance_chain_walk(self):
         """Test provenance chain walking: anchor A, transform A->B, walk chain."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -914,9 +926,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_chain_wallet
     def test_chain_protect_workflow(self):
         """Test full protect workflow: anchor, protect, verify restriction."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.models import DataStatusEnum
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -951,9 +960,6 @@ class TestBlockchainLocalHardhat:
     @skip_if_no_blockchain_deps
     def test_chain_client_anchor_insufficient_gas(self):
         """Test that an explicit gas limit too low for a contract call raises ChainTransactionError."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.exceptions import ChainTransactionError
-
         contract = os.getenv("CHAIN_CONTRACT")
         if not contract:
             pytest.skip("CHAIN_CONTRACT not set for local Hardhat")
@@ -981,6 +987,7 @@ class TestBlockchainLocalHardhat:
 @pytest.mark.integration
 @pytest.mark.blockchain
 @pytest.mark.slow
+@pytest.mark.xdist_group("provenance_wallet")
 class TestBlockchainBaseSepolia:
     """Integration tests against Base Sepolia testnet.
 
@@ -997,8 +1004,6 @@ class TestBlockchainBaseSepolia:
     @skip_if_no_blockchain_deps
     def test_chain_provider_health_base_sepolia(self):
         """Test ChainProvider connects to Base Sepolia."""
-        from swarm_provenance_uploader.chain.provider import ChainProvider
-
         provider = ChainProvider(chain="base-sepolia")
 
         try:
@@ -1012,8 +1017,6 @@ class TestBlockchainBaseSepolia:
     @skip_if_no_blockchain_deps
     def test_chain_client_balance_base_sepolia(self):
         """Test getting wallet balance on Base Sepolia."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         try:
             client = ChainClient(chain="base-sepolia")
             info = client.balance()
@@ -1033,8 +1036,6 @@ class TestBlockchainBaseSepolia:
     @skip_if_no_blockchain_deps
     def test_chain_client_verify_unregistered_base_sepolia(self):
         """Test verifying an unregistered hash on Base Sepolia."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-
         try:
             client = ChainClient(chain="base-sepolia")
             # Random hash should not be registered
@@ -1050,10 +1051,6 @@ class TestBlockchainBaseSepolia:
 
         WARNING: This uses real testnet gas. Run sparingly.
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        import secrets
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1091,11 +1088,6 @@ class TestBlockchainBaseSepolia:
 
         WARNING: This uses real testnet gas (one anchor tx). Run sparingly.
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.exceptions import DataAlreadyRegisteredError
-        import secrets
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1135,9 +1127,6 @@ class TestBlockchainBaseSepolia:
 
         WARNING: Uses real testnet gas (2 anchor txs + 1 transform tx).
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1181,10 +1170,6 @@ class TestBlockchainBaseSepolia:
 
         WARNING: Uses real testnet gas (1 anchor tx).
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.models import DataStatusEnum
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1216,9 +1201,6 @@ class TestBlockchainBaseSepolia:
 
         WARNING: Uses real testnet gas (1 anchor tx + 1 access tx).
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1247,9 +1229,6 @@ class TestBlockchainBaseSepolia:
 
         WARNING: Uses real testnet gas (2 anchor txs + 1 merge tx).
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1298,9 +1277,6 @@ class TestBlockchainBaseSepolia:
         Anchors A, transforms A->B, then walks the chain from B.
         WARNING: Uses real testnet gas (1 anchor tx + 1 transform tx).
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1347,10 +1323,6 @@ class TestBlockchainBaseSepolia:
 
         WARNING: Uses real testnet gas (1 anchor + 2 transform txs).
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.models import DataStatusEnum
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1440,10 +1412,6 @@ class TestBlockchainBaseSepolia:
         Anchors A, transforms A->B, then attempts A->B again.
         WARNING: Uses real testnet gas (1 anchor tx + 1 transform tx).
         """
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.chain.exceptions import TransformationAlreadyExistsError
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1488,6 +1456,7 @@ class TestBlockchainBaseSepolia:
 
 @pytest.mark.blockchain
 @pytest.mark.slow
+@pytest.mark.xdist_group("provenance_wallet")
 class TestBlockchainStorageRefBaseSepolia:
     """Integration tests for storageRef on Base Sepolia.
 
@@ -1499,9 +1468,6 @@ class TestBlockchainStorageRefBaseSepolia:
     @skip_if_no_blockchain_deps
     def test_anchor_with_storage_ref_base_sepolia(self):
         """Test anchoring a hash with a storage reference on Base Sepolia."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1538,9 +1504,6 @@ class TestBlockchainStorageRefBaseSepolia:
     @skip_if_no_blockchain_deps
     def test_set_storage_ref_base_sepolia(self):
         """Test post-registration storage ref linking on Base Sepolia."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1576,10 +1539,6 @@ class TestBlockchainStorageRefBaseSepolia:
     @skip_if_no_blockchain_deps
     def test_lookup_by_storage_ref_base_sepolia(self):
         """Test reverse lookup by storage reference on Base Sepolia."""
-        from swarm_provenance_uploader.core.chain_client import ChainClient
-        from swarm_provenance_uploader.chain.exceptions import DataNotRegisteredError
-        import time
-
         try:
             client = ChainClient(chain="base-sepolia")
 
@@ -1627,9 +1586,6 @@ class TestGatewayManifestUpload:
     @pytest.mark.gateway
     def test_gateway_manifest_upload(self, gateway_client, tmp_path):
         """Upload a directory as a manifest and verify reference is returned."""
-        import tarfile
-        from swarm_provenance_uploader.core.file_utils import create_tar_from_directory
-
         # Create temp directory with test files
         test_dir = tmp_path / "test_collection"
         test_dir.mkdir()
@@ -1650,7 +1606,6 @@ class TestGatewayManifestUpload:
             pytest.skip(f"Could not purchase stamp: {e}")
 
         # Wait for stamp to be usable
-        import time
         for _ in range(12):
             stamp = gateway_client.get_stamp(stamp_id)
             if stamp and stamp.usable:
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Standalone CLI Binary Builder
+
+Compiles the swarm-prov-upload CLI into a single executable with Nuitka.
+Intended for CI/ops environments that invoke the CLI many times, where
+interpreter startup and module import dominate short commands. The wheel
+remains the distribution for pip users.
+
+Requires the 'binary' extra:
+    pip install -e .[binary]
+
+Usage:
+    python tools/build_cli.py
+    python tools/build_cli.py --output-dir dist
+"""
+
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+ENTRY_POINT = REPO_ROOT / "swarm_provenance_uploader" / "__main__.py"
+BINARY_NAME = "swarm-prov-upload"
+
+
+def build_command(output_dir: Path) -> list:
+    """Build the Nuitka command line."""
+    return [
+        sys.executable, "-m", "nuitka",
+        "--onefile",
+        "--assume-yes-for-downloads",
+        f"--output-dir={output_dir}",
+        f"--output-filename={BINARY_NAME}",
+        "--include-package=swarm_provenance_uploader",
+        "--include-package-data=swarm_provenance_uploader",
+        "--include-package=pydantic",
+        str(ENTRY_POINT),
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Build standalone swarm-prov-upload binary with Nuitka")
+    parser.add_argument("--output-dir", default=str(REPO_ROOT / "dist"), help="Directory for the built binary (default: dist/)")
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir).resolve()
+    cmd = build_command(output_dir)
+    print(f"Building {BINARY_NAME} into {output_dir}...")
+    result = subprocess.run(cmd, cwd=REPO_ROOT)
+    if result.returncode != 0:
+        print("ERROR: Nuitka build failed.", file=sys.stderr)
+        return result.returncode
+
+    print(f"Built: {output_dir / BINARY_NAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())